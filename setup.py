@@ -24,7 +24,6 @@ setuptools.setup(
     },
     classifiers=[
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
@@ -48,5 +47,7 @@ setuptools.setup(
     install_requires=["google-api-python-client",
                       "pandas",
                       "youtube_transcript_api"],
-    python_requires=">=3.6",
+    extras_require={"async": ["aiohttp"], "parquet": ["pyarrow"]},
+    entry_points={"console_scripts": ["tubeframes=tubeframes.cli:main"]},
+    python_requires=">=3.7",
 )
@@ -0,0 +1,187 @@
+import unittest
+import asyncio
+import os
+from tubeframes import AsyncSearch, AsyncChannelInfo
+from tubeframes.testing.mockserver import MockYouTubeServer, Fixtures
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    aiohttp = None
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp not installed")
+class TestAsync(unittest.TestCase):
+    """Tests for the asyncio API."""
+
+    TEST_CHANNEL_ID = "UCBR8-60-B28hp2BmDPdntcQ"
+
+    def setUp(self):
+        """Set up the test environment."""
+        if "YOUTUBE_DEVELOPER_KEY" not in os.environ:
+            self.skipTest("YOUTUBE_DEVELOPER_KEY environment variable not set")
+
+    def test_search_df_shape(self):
+        """Test the DataFrame of an async search."""
+        search = asyncio.run(AsyncSearch.create("Test", maxres=25))
+        self.assertTrue(search.df.shape[0] >= 1)
+        self.assertEqual(search.df.shape[1], 13)
+
+    def test_search_pages(self):
+        """Test iterating over the pages of an async search."""
+
+        async def collect():
+            return [rows async for rows in AsyncSearch("Test", maxres=100)]
+
+        pages = asyncio.run(collect())
+        self.assertTrue(len(pages) >= 2)
+
+    def test_channel_info(self):
+        """Test the DataFrame of an async channel pull."""
+        channel_info = asyncio.run(
+            AsyncChannelInfo.create(self.TEST_CHANNEL_ID, max_results=5)
+        )
+        self.assertIn("caption", channel_info.df.columns)
+
+
+
+class RepeatingFixtures(Fixtures):
+    """Fixtures where only 40 distinct videos exist."""
+
+    def video_id(self, seed, n):
+        return "v{:013d}".format(n % 40)
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp not installed")
+class TestAsyncMockServer(unittest.TestCase):
+    """Offline tests of the asyncio API against the mock server."""
+
+    def setUp(self):
+        """Start a mock server repeating videos across pages."""
+        self.server = MockYouTubeServer(
+            RepeatingFixtures(total_results=150, uploads_per_channel=60)
+        ).start()
+        self.addCleanup(self.server.stop)
+
+    def _client(self):
+        from tubeframes.aio import AsyncTubeFramesClient
+
+        return AsyncTubeFramesClient(
+            "test_key_value", base_url=self.server.base_url
+        )
+
+    def test_repeated_results_dropped(self):
+        """Test that results repeated on later pages are enriched once."""
+
+        async def run():
+            async with self._client() as client:
+                search = await AsyncSearch.create(
+                    "Test", maxres=100, client=client
+                )
+                info = await AsyncChannelInfo.create(
+                    "UC0", max_results=60, client=client
+                )
+            return search, info
+
+        with self.server.patch_transcripts():
+            search, info = asyncio.run(run())
+        self.assertEqual(search.df.shape[0], 40)
+        self.assertEqual(info.df.shape[0], 40)
+        self.assertEqual(self.server.requests["videos"], 2)
+
+    def test_segments_are_not_streamed(self):
+        """Test that caption segments are only collected by create."""
+
+        async def run():
+            async with self._client() as client:
+                search = AsyncSearch(
+                    "Test", caption=True, caption_format="segments",
+                    client=client,
+                )
+                info = AsyncChannelInfo(
+                    "UC0", caption_format="segments", client=client
+                )
+                for streamed in (search, info):
+                    with self.assertRaises(ValueError):
+                        async for _ in streamed:
+                            pass
+                return await AsyncSearch.create(
+                    "Test", maxres=50, caption=True,
+                    caption_format="segments", client=client,
+                )
+
+        with self.server.patch_transcripts():
+            search = asyncio.run(run())
+        self.assertGreater(search.captions.shape[0], 0)
+        self.assertEqual(self.server.requests["search"], 1)
+
+    def test_slots_follow_the_running_loop(self):
+        """Test that concurrency slots work under successive event loops."""
+        from tubeframes.aio import _LoopSemaphore
+
+        slots = _LoopSemaphore(1)
+        running = []
+        peaks = []
+
+        async def hold():
+            async with slots:
+                running.append(None)
+                peaks.append(len(running))
+                await asyncio.sleep(0.001)
+                running.pop()
+
+        async def run():
+            await asyncio.gather(hold(), hold(), hold())
+
+        for _ in range(2):
+            asyncio.run(run())
+        self.assertEqual(peaks, [1] * 6)
+
+    def test_content_details(self):
+        """Test that video details come with the counts, as in Search."""
+
+        async def run():
+            async with self._client() as client:
+                search = await AsyncSearch.create(
+                    "Test", maxres=50, content_details=True, client=client
+                )
+                info = await AsyncChannelInfo.create(
+                    "UC0",
+                    max_results=10,
+                    columns=["title", "duration"],
+                    content_details=True,
+                    client=client,
+                )
+            return search, info
+
+        search, info = asyncio.run(run())
+        self.assertEqual(self.server.requests["videos"], 2)
+        self.assertEqual(str(search.df["duration"].dtype), "Int64")
+        self.assertEqual(str(search.df["hasCaption"].dtype), "boolean")
+        self.assertEqual(
+            list(info.df.columns),
+            ["channelId", "videoId", "title", "duration"],
+        )
+        self.assertTrue(info.df["duration"].notna().all())
+
+    def test_early_stop_cancels_enrichment(self):
+        """Test that stopping after one page leaves no task running."""
+
+        async def run():
+            async with self._client() as client:
+                pages = AsyncSearch("Test", maxres=150, client=client)
+                pages = pages.iter_pages()
+                rows = await pages.__anext__()
+                await pages.aclose()
+                others = asyncio.all_tasks() - {asyncio.current_task()}
+            return rows, others
+
+        rows, others = asyncio.run(run())
+        self.assertEqual(len(rows), 40)
+        self.assertEqual(others, set())
+        self.assertEqual(self.server.requests["search"], 2)
+        self.assertEqual(self.server.requests["videos"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+from tubeframes.benchmark import measure_import, IMPORT_BUDGET
+
+
+class TestImportTime(unittest.TestCase):
+    """Tests for the cold-start cost of the package."""
+
+    def test_package_import_is_lazy(self):
+        """Test that importing tubeframes loads no heavy dependency."""
+        result = measure_import("tubeframes", repeat=3)
+        self.assertEqual(result.heavy_modules, [])
+        self.assertLess(result.seconds, IMPORT_BUDGET)
+
+    def test_cli_skips_dataframe_stack(self):
+        """Test that the command line starts without pandas."""
+        result = measure_import("tubeframes.cli", repeat=1)
+        self.assertNotIn("pandas", result.heavy_modules)
+        self.assertNotIn("requests", result.heavy_modules)
+
+    def test_exports_resolve(self):
+        """Test that public names are imported on first access."""
+        import tubeframes
+        from tubeframes.search import Search
+
+        self.assertIs(tubeframes.Search, Search)
+        self.assertIn("WorkQueue", dir(tubeframes))
+        with self.assertRaises(AttributeError):
+            tubeframes.NotAName
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import unittest
+import os
+import tempfile
+from tubeframes.cache import ResponseCache, TranscriptCache
+
+
+class TestResponseCache(unittest.TestCase):
+    """Tests for the on-disk API response cache."""
+
+    def setUp(self):
+        """Create a cache in a temporary directory."""
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp_dir.name, "responses.sqlite")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self._tmp_dir.cleanup()
+
+    def test_make_key_normalizes_params(self):
+        """Test that parameter order, None values and the key are ignored."""
+        key_a = ResponseCache.make_key(
+            "search", {"q": "test", "maxResults": 50, "pageToken": None}
+        )
+        key_b = ResponseCache.make_key(
+            "search", {"maxResults": "50", "q": "test", "key": "secret"}
+        )
+        self.assertEqual(key_a, key_b)
+
+    def test_set_and_get(self):
+        """Test that a stored response is fresh and keeps its ETag."""
+        cache = ResponseCache(self.path)
+        cache.set("videos", {"id": "abc"}, {"etag": "e1", "items": []})
+        cached = cache.get("videos", {"id": "abc"})
+        self.assertEqual(cached.data, {"etag": "e1", "items": []})
+        self.assertEqual(cached.etag, "e1")
+        self.assertTrue(cached.fresh)
+        cache.close()
+
+    def test_expired_response_is_stale(self):
+        """Test that a response older than its TTL must be revalidated."""
+        cache = ResponseCache(self.path, ttl={"videos": 0})
+        cache.set("videos", {"id": "abc"}, {"etag": "e1", "items": []})
+        self.assertFalse(cache.get("videos", {"id": "abc"}).fresh)
+        cache.close()
+
+    def test_uncached_endpoint(self):
+        """Test that endpoints without a TTL are not stored."""
+        cache = ResponseCache(self.path)
+        cache.set("captions", {"id": "abc"}, {"items": []})
+        self.assertIsNone(cache.get("captions", {"id": "abc"}))
+        cache.close()
+
+    def test_lru_eviction(self):
+        """Test that least recently used responses are evicted first."""
+        cache = ResponseCache(self.path, max_bytes=1000)
+        for video_id in ["a", "b", "c"]:
+            cache.set("videos", {"id": video_id}, {"x": os.urandom(200).hex()})
+        cache.get("videos", {"id": "a"})
+        cache.set("videos", {"id": "d"}, {"x": os.urandom(200).hex()})
+        cache.set("videos", {"id": "e"}, {"x": os.urandom(200).hex()})
+        self.assertIsNotNone(cache.get("videos", {"id": "a"}))
+        self.assertIsNone(cache.get("videos", {"id": "b"}))
+        cache.close()
+
+
+class TestTranscriptCache(unittest.TestCase):
+    """Tests for the on-disk transcript store."""
+
+    SEGMENTS = [
+        {"text": "hello", "start": 0.0, "duration": 1.5},
+        {"text": "world", "start": 1.5, "duration": 2.0},
+    ]
+
+    def setUp(self):
+        """Create a cache in a temporary directory."""
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp_dir.name, "transcripts.sqlite")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self._tmp_dir.cleanup()
+
+    def test_found(self):
+        """Test that stored segments are read back."""
+        cache = TranscriptCache(self.path)
+        cache.set("abc", "en", TranscriptCache.FOUND, self.SEGMENTS)
+        cached = cache.get("abc", "en")
+        self.assertEqual(cached.status, TranscriptCache.FOUND)
+        self.assertEqual(cached.segments, self.SEGMENTS)
+        self.assertIsNone(cache.get("abc", "pt"))
+        cache.close()
+
+    def test_negative_results_expire(self):
+        """Test that negative results use their own expiry."""
+        cache = TranscriptCache(self.path, ttl={"missing": 0})
+        cache.set("abc", "pt", TranscriptCache.MISSING)
+        cache.set("abc", "*", TranscriptCache.DISABLED)
+        self.assertIsNone(cache.get("abc", "pt"))
+        self.assertEqual(
+            cache.get("abc", "*").status, TranscriptCache.DISABLED
+        )
+        cache.close()
+
+    def test_identical_segments_stored_once(self):
+        """Test that identical transcripts share one stored copy."""
+        cache = TranscriptCache(self.path)
+        cache.set("abc", "en", TranscriptCache.FOUND, self.SEGMENTS)
+        cache.set("abc", "en-US", TranscriptCache.FOUND, self.SEGMENTS)
+        (count,) = cache._conn.execute(
+            "SELECT COUNT(*) FROM segments"
+        ).fetchone()
+        self.assertEqual(count, 1)
+        cache.close()
+
+    def test_size_cap(self):
+        """Test that old segments are evicted above the size limit."""
+        cache = TranscriptCache(self.path, max_bytes=600)
+        for video_id in ["a", "b", "c"]:
+            segments = [{"text": os.urandom(200).hex()}]
+            cache.set(video_id, "en", TranscriptCache.FOUND, segments)
+        self.assertIsNone(cache.get("a", "en"))
+        self.assertIsNotNone(cache.get("c", "en"))
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
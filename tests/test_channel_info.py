@@ -1,5 +1,6 @@
 import unittest
 from tubeframes import ChannelInfo
+from tubeframes.state import ChannelMark
 
 
 class TestChannelInfo(unittest.TestCase):
@@ -40,6 +41,83 @@ class TestChannelInfo(unittest.TestCase):
 
         self.assertIn("caption", channel_info.df.columns)
 
+    def test_max_results_beyond_one_page(self):
+        """Tests that uploads are paged past 50 results."""
+        channel_info = ChannelInfo(self.TEST_CHANNEL_ID, max_results=60)
+
+        self.assertGreater(len(channel_info.df), 50)
+
+    def test_parse_playlist_items(self):
+        """Tests that private and deleted uploads are skipped."""
+        response = {
+            "items": [
+                {
+                    "snippet": {"title": "Public", "thumbnails": {}},
+                    "contentDetails": {
+                        "videoId": "abc",
+                        "videoPublishedAt": "2024-01-01T00:00:00Z",
+                    },
+                },
+                {
+                    "snippet": {"title": "Private video"},
+                    "contentDetails": {"videoId": "def"},
+                },
+            ]
+        }
+        rows = ChannelInfo._parse_playlist_items("UC1", response)
+
+        self.assertEqual([row["videoId"] for row in rows], ["abc"])
+        self.assertEqual(rows[0]["publishedAt"], "2024-01-01T00:00:00Z")
+
+    def test_parse_channels(self):
+        """Tests that uploads playlists are keyed by channel ID."""
+        response = {
+            "items": [
+                {
+                    "id": "UC1",
+                    "contentDetails": {"relatedPlaylists": {"uploads": "UU1"}},
+                }
+            ]
+        }
+        self.assertEqual(ChannelInfo._parse_channels(response), {"UC1": "UU1"})
+
+    def test_new_items_stop_at_known_video(self):
+        """Tests that paging stops at the first video already synced."""
+        mark = ChannelMark("UU1", "2024-01-02T00:00:00Z", frozenset(["b"]))
+        items = [
+            {
+                "contentDetails": {
+                    "videoId": video_id,
+                    "videoPublishedAt": "2024-01-0{}T00:00:00Z".format(day),
+                }
+            }
+            for video_id, day in [("a", 3), ("b", 2), ("c", 1)]
+        ]
+        new_items, caught_up = ChannelInfo._new_items(items, mark)
+
+        self.assertEqual(len(new_items), 1)
+        self.assertTrue(caught_up)
+        self.assertEqual(ChannelInfo._new_items(items, None), (items, False))
+
+    def test_new_items_skip_capped_videos(self):
+        """Tests that videos newer than the mark are skipped, not a stop."""
+        mark = ChannelMark(
+            "UU1", "2024-01-02T00:00:00Z", frozenset(["a", "c"])
+        )
+        items = [
+            {
+                "contentDetails": {
+                    "videoId": video_id,
+                    "videoPublishedAt": "2024-01-0{}T00:00:00Z".format(day),
+                }
+            }
+            for video_id, day in [("a", 4), ("b", 3), ("c", 2), ("d", 1)]
+        ]
+        new_items, caught_up = ChannelInfo._new_items(items, mark)
+
+        self.assertEqual(new_items, [items[1]])
+        self.assertTrue(caught_up)
+
 
 if __name__ == "__main__":
     unittest.main()
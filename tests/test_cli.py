@@ -0,0 +1,92 @@
+import unittest
+import json
+import os
+import tempfile
+import pandas as pd
+from tubeframes.cli import main, run
+from tubeframes.config.constants import DEFAULT_MAX_ATTEMPTS
+from tubeframes.testing.mockserver import MockYouTubeServer, Fixtures
+from tubeframes.workqueue import WorkQueue
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestCrawlRunner(unittest.TestCase):
+    """Tests for the resumable crawl runner against the mock server."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.queue = os.path.join(self.tmp_dir.name, "queue.sqlite")
+        self.output = os.path.join(self.tmp_dir.name, "out")
+        self.server = MockYouTubeServer(Fixtures(total_results=60)).start()
+        self.addCleanup(self.server.stop)
+
+    def run_queue(self, processes=1):
+        """Drain the queue against the mock server."""
+        return run(
+            self.queue,
+            processes=processes,
+            output=self.output,
+            developer_key="test_key_value",
+            base_url=self.server.base_url,
+        )
+
+    def test_submit_and_run(self):
+        """Test a search job submitted from a spec file."""
+        with open(os.path.join(self.tmp_dir.name, "terms.txt"), "w") as fh:
+            fh.write("a\nb\nc\n")
+        spec = os.path.join(self.tmp_dir.name, "spec.json")
+        with open(spec, "w") as fh:
+            json.dump(
+                {
+                    "job": "terms",
+                    "kind": "search",
+                    "units": "terms.txt",
+                    "options": {"maxres": 60, "columns": ["title"]},
+                },
+                fh,
+            )
+        main(["submit", self.queue, spec])
+        self.assertEqual(self.run_queue(), 1)
+        df = pd.read_parquet(os.path.join(self.output, "terms"))
+        self.assertEqual(df.shape, (180, 2))
+
+    def test_invalid_options_fail_units(self):
+        """Test that invalid job options count as failed attempts."""
+        queue = WorkQueue(self.queue)
+        queue.submit("terms", "search", ["a", "b"], {"bogus": 1}, 1)
+        # Each shard is claimed again until its unit runs out of attempts
+        self.assertEqual(self.run_queue(), 2 * DEFAULT_MAX_ATTEMPTS)
+        status = queue.status()
+        queue.close()
+        self.assertEqual(status.loc["terms", "failed"], 2)
+        self.assertEqual(self.server.requests["search"], 0)
+
+    def test_resume_after_quota(self):
+        """Test that a stopped job only redoes unfinished units."""
+        queue = WorkQueue(self.queue)
+        queue.submit("terms", "search", ["a", "b", "c"], {"maxres": 60}, 1)
+        queue.close()
+        self.run_queue()
+        self.server.error_rate = 1.0
+        self.server.error_status = 403
+        queue = WorkQueue(self.queue)
+        queue.submit("terms", "search", ["d", "e"], {"maxres": 60}, 1)
+        self.run_queue()
+        self.assertEqual(queue.status().loc["terms", "pending"], 2)
+
+        self.server.error_rate = 0.0
+        self.server.reset()
+        self.run_queue(processes=2)
+        self.assertEqual(self.server.requests["search"], 4)
+        self.assertEqual(queue.status().loc["terms", "done"], 5)
+        queue.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
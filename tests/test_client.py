@@ -0,0 +1,46 @@
+import unittest
+import tempfile
+from tubeframes.client import (
+    DiscoveryFileCache,
+    TubeFramesClient,
+    get_default_client,
+)
+
+
+class TestDiscoveryFileCache(unittest.TestCase):
+    """Tests for the on-disk discovery document cache."""
+
+    def test_get_missing(self):
+        """Test that an uncached URL returns None."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = DiscoveryFileCache(cache_dir)
+            self.assertIsNone(cache.get("https://example.com/discovery"))
+
+    def test_set_and_get(self):
+        """Test that a stored document is read back."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = DiscoveryFileCache(cache_dir)
+            cache.set("https://example.com/discovery", '{"name": "test"}')
+            self.assertEqual(
+                cache.get("https://example.com/discovery"), '{"name": "test"}'
+            )
+
+
+class TestTubeFramesClient(unittest.TestCase):
+    """Tests for the shared API client."""
+
+    def test_default_client_is_shared(self):
+        """Test that the default client is reused for the same key."""
+        client = get_default_client("test_key_value")
+        self.assertIs(client, get_default_client("test_key_value"))
+        self.assertIsNot(client, get_default_client("other_key_value"))
+
+    def test_developer_key(self):
+        """Test that the client exposes its developer key."""
+        client = TubeFramesClient("test_key_value")
+        self.assertEqual(client.developer_key, "test_key_value")
+        client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
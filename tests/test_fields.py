@@ -0,0 +1,123 @@
+import unittest
+from tubeframes import Search, ChannelInfo, TubeFramesClient, RetryPolicy
+from tubeframes.config.constants import CHANNEL_INFO_COLUMNS
+from tubeframes.fields import (
+    fields_selector,
+    select_columns,
+    search_fields,
+    statistics_fields,
+    playlist_items_request,
+)
+from tubeframes.testing.mockserver import (
+    MockYouTubeServer,
+    Fixtures,
+    parse_fields,
+    project_fields,
+)
+
+
+class TestFields(unittest.TestCase):
+    """Tests for column selection and partial-response selectors."""
+
+    def test_fields_selector(self):
+        """Test that paths with a common prefix are grouped."""
+        selector = fields_selector(
+            ["nextPageToken", "items/id", "items/statistics/viewCount"]
+        )
+        self.assertEqual(
+            selector, "nextPageToken,items(id,statistics/viewCount)"
+        )
+        self.assertEqual(
+            parse_fields(selector),
+            {
+                "nextPageToken": {},
+                "items": {"id": {}, "statistics": {"viewCount": {}}},
+            },
+        )
+
+    def test_select_columns(self):
+        """Test that columns keep their order and required columns."""
+        columns = select_columns(
+            ["title", "channelId"], CHANNEL_INFO_COLUMNS, ["videoId"]
+        )
+        self.assertEqual(
+            [name for name, _ in columns], ["channelId", "videoId", "title"]
+        )
+        with self.assertRaises(ValueError):
+            select_columns(["title", "dislikes"], CHANNEL_INFO_COLUMNS)
+
+    def test_request_selectors(self):
+        """Test the selectors built for each endpoint."""
+        self.assertIn(
+            "items(id/videoId,snippet/title)",
+            search_fields(["title"], "videoId"),
+        )
+        self.assertIsNone(statistics_fields(["title"]))
+        self.assertEqual(
+            statistics_fields(["likeCount"]),
+            "items(id,statistics/likeCount)",
+        )
+        self.assertEqual(
+            playlist_items_request(["publishedAt"])[0], "contentDetails"
+        )
+        self.assertEqual(
+            playlist_items_request(["title"])[0], "snippet,contentDetails"
+        )
+
+    def test_project_fields(self):
+        """Test that the mock server projects responses like the API."""
+        data = {"items": [{"id": "v1", "statistics": {"viewCount": "1"}}]}
+        self.assertEqual(
+            project_fields(data, parse_fields("items/id")),
+            {"items": [{"id": "v1"}]},
+        )
+
+
+class TestColumnProjection(unittest.TestCase):
+    """Tests for ``columns`` against the local mock API server."""
+
+    def setUp(self):
+        """Start a small mock server."""
+        fixtures = Fixtures(
+            total_results=120, uploads_per_channel=30, transcript_segments=3
+        )
+        self.server = MockYouTubeServer(fixtures).start()
+        self.addCleanup(self.server.stop)
+        self.client = TubeFramesClient(
+            "test_key_value",
+            base_url=self.server.base_url,
+            retry=RetryPolicy(backoff=0.001, jitter=False),
+        )
+        self.addCleanup(self.client.close)
+
+    def test_search_columns(self):
+        """Test that a search keeps and requests only the given columns."""
+        full = Search("Test", maxres=100, client=self.client)
+        self.server.reset()
+        search = Search(
+            "Test", maxres=100, columns=["title"], client=self.client
+        )
+        self.assertEqual(list(search.df.columns), ["title"])
+        self.assertEqual(search.df.shape[0], 100)
+        self.assertNotIn("videos", self.server.requests)
+        self.assertLess(search.metrics.bytes, full.metrics.bytes / 2)
+
+    def test_channel_columns(self):
+        """Test that a channel pull skips unselected statistics."""
+        with self.server.patch_transcripts():
+            info = ChannelInfo(
+                ["UC0", "UC1"],
+                max_results=20,
+                columns=["publishedAt", "viewCount"],
+                client=self.client,
+            )
+        self.assertEqual(
+            list(info.df.columns),
+            ["channelId", "videoId", "publishedAt", "viewCount"],
+        )
+        self.assertEqual(info.df["viewCount"].notna().sum(), 40)
+        self.assertNotIn("transcripts", self.server.requests)
+
+
+if __name__ == "__main__":
+    unittest.main()
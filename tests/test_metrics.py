@@ -0,0 +1,107 @@
+import unittest
+import threading
+from tubeframes import Search, TubeFramesClient, Metrics, RequestEvent
+from tubeframes.metrics import emit
+from tubeframes.testing.mockserver import MockYouTubeServer, Fixtures
+
+
+class TestMetrics(unittest.TestCase):
+    """Tests for request events and metrics."""
+
+    def test_aggregates_events(self):
+        """Test that events are summed per endpoint."""
+        metrics = Metrics()
+        metrics(RequestEvent("search", 0.5, 200, 1000, 100, None))
+        metrics(RequestEvent("search", 0.0, None, 0, 0, "hit"))
+        metrics(RequestEvent("videos", 0.25, 503, 10, 1, None))
+        df = metrics.to_frame()
+        self.assertEqual(df.loc["search", "requests"], 2)
+        self.assertEqual(df.loc["search", "cache_hits"], 1)
+        self.assertEqual(df.loc["videos", "errors"], 1)
+        self.assertEqual(metrics.quota, 101)
+        self.assertEqual(metrics.bytes, 1010)
+
+    def test_phases(self):
+        """Test that phases add up the time of their blocks."""
+        metrics = Metrics()
+        with metrics.phase("paging"):
+            pass
+        with metrics.phase("paging"):
+            pass
+        self.assertGreater(metrics.phases["paging"], 0)
+        self.assertEqual(metrics.phases["frame"], 0)
+        metrics.reset()
+        self.assertEqual(metrics.phases["paging"], 0)
+
+    def test_failing_hook(self):
+        """Test that a failing hook does not stop the others."""
+        events = []
+
+        def broken(event):
+            raise RuntimeError("broken hook")
+
+        with self.assertLogs("tubeframes.metrics", "ERROR"):
+            emit(
+                [broken, events.append],
+                RequestEvent("videos", 0.1, 200, 10, 1, None),
+            )
+        self.assertEqual(len(events), 1)
+
+    def test_search_metrics(self):
+        """Test the metrics of a search against the mock server."""
+        fixtures = Fixtures(total_results=100, transcript_segments=2)
+        with MockYouTubeServer(fixtures) as server:
+            events = []
+            client = TubeFramesClient(
+                "test_key_value",
+                base_url=server.base_url,
+                hooks=[events.append],
+            )
+            with server.patch_transcripts():
+                search = Search(
+                    "Test",
+                    caption=True,
+                    maxres=100,
+                    accepted_caption_lang=["en"],
+                    client=client,
+                )
+            client.close()
+
+        df = search.metrics.to_frame()
+        self.assertEqual(df.loc["search", "requests"], 2)
+        self.assertEqual(df.loc["search", "quota"], 200)
+        self.assertEqual(df.loc["transcripts", "requests"], 100)
+        self.assertEqual(search.metrics.requests, len(events))
+        self.assertTrue(all(t > 0 for t in search.metrics.phases.values()))
+        self.assertNotIn(search.metrics, client.hooks)
+
+    def test_concurrent_instances(self):
+        """Test that instances sharing a client only record their own."""
+        fixtures = Fixtures(total_results=300, uploads_per_channel=100)
+        with MockYouTubeServer(fixtures, latency=0.005) as server:
+            client = TubeFramesClient(
+                "test_key_value", base_url=server.base_url
+            )
+            searches = [
+                Search("Test", maxres=50, lazy=True, client=client),
+                Search("Other", maxres=300, lazy=True, client=client),
+            ]
+            threads = [
+                threading.Thread(target=lambda s=search: s.df)
+                for search in searches
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            client.close()
+
+        small, large = (search.metrics.to_frame() for search in searches)
+        self.assertEqual(small.loc["search", "requests"], 1)
+        self.assertEqual(small.loc["videos", "requests"], 1)
+        self.assertEqual(large.loc["search", "requests"], 6)
+        self.assertEqual(large.loc["videos", "requests"], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
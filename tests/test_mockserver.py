@@ -0,0 +1,392 @@
+import unittest
+import os
+import tempfile
+from unittest import mock
+import youtube_transcript_api as ytapi
+from tubeframes import Search, ChannelInfo, TubeFramesClient, RetryPolicy
+from tubeframes import ChannelSyncState, QuotaExceededError, TranscriptCache
+from tubeframes.testing.mockserver import MockYouTubeServer, Fixtures
+from tubeframes.utils import get_videos_captions
+
+
+class QuotaServer(MockYouTubeServer):
+    """Mock server refusing videos.list calls with quotaExceeded."""
+
+    refuse = True
+
+    def respond(self, path, query):
+        """Answer videos.list with a 403 while ``refuse`` is set."""
+        if self.refuse and path.endswith("/videos"):
+            with self._lock:
+                self.errors["videos"] += 1
+            return self._error(403)
+        return super().respond(path, query)
+
+
+class TestMockYouTubeServer(unittest.TestCase):
+    """Offline tests against the local mock API server."""
+
+    def setUp(self):
+        """Start a small mock server."""
+        fixtures = Fixtures(
+            total_results=120, uploads_per_channel=30, transcript_segments=3
+        )
+        self.server = MockYouTubeServer(fixtures).start()
+        self.addCleanup(self.server.stop)
+        self.client = TubeFramesClient(
+            "test_key_value",
+            base_url=self.server.base_url,
+            retry=RetryPolicy(backoff=0.001, jitter=False),
+        )
+        self.addCleanup(self.client.close)
+
+    def test_search(self):
+        """Test that a search pages through the fixtures."""
+        df = Search("Test", maxres=100, client=self.client).df
+        self.assertEqual(df.shape, (100, 13))
+        self.assertEqual(self.server.requests["search"], 2)
+        self.assertEqual(self.server.requests["videos"], 2)
+
+    def test_search_ends_with_results(self):
+        """Test that a search stops when the results run out."""
+        df = Search("Test", maxres=500, client=self.client).df
+        self.assertEqual(df.shape[0], 120)
+
+    def test_captions(self):
+        """Test that captions are served by the transcript endpoint."""
+        with self.server.patch_transcripts():
+            df = Search(
+                "Test",
+                caption=True,
+                accepted_caption_lang=["en"],
+                client=self.client,
+            ).df
+        missing = df["video_caption"].isna()
+        self.assertTrue(missing.any())
+        self.assertFalse(missing.all())
+        self.assertEqual(self.server.requests["transcripts"], 50)
+
+    def test_caption_failure_skips_video(self):
+        """Test that a failed transcript lookup only skips its video."""
+        calls = []
+
+        def list_transcripts(video_id):
+            calls.append(video_id)
+            if len(calls) == 3:
+                raise ytapi.VideoUnavailable(video_id)
+            return self.server.list_transcripts(video_id)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = TranscriptCache(os.path.join(tmp_dir, "t.sqlite"))
+            with mock.patch(
+                "tubeframes.utils.list_transcripts", list_transcripts
+            ):
+                df = Search(
+                    "Test",
+                    caption=True,
+                    accepted_caption_lang=["en"],
+                    caption_workers=4,
+                    transcript_cache=cache,
+                    client=self.client,
+                ).df
+            failed = cache.get(calls[2], cache.ANY_LANGUAGE)
+            cache.close()
+        self.assertEqual(df.shape[0], 50)
+        self.assertTrue(df["video_caption"].isna()[calls[2]])
+        self.assertGreater(df["video_caption"].notna().sum(), 0)
+        self.assertEqual(failed.status, TranscriptCache.FAILED)
+
+    def test_statistics_failure_drops_video(self):
+        """Test that a failed statistics call only affects its videos."""
+
+        class PoisonedFixtures(Fixtures):
+            def video_item(self, video_id):
+                if video_id.endswith("00007"):
+                    raise ValueError(video_id)
+                return super().video_item(video_id)
+
+        with MockYouTubeServer(
+            PoisonedFixtures(total_results=60, uploads_per_channel=30)
+        ) as server:
+            client = TubeFramesClient(
+                "test_key_value", base_url=server.base_url
+            )
+            search = Search("Test", maxres=50, client=client).df
+            with server.patch_transcripts():
+                channels = ChannelInfo(
+                    ["UC0"], max_results=30, client=client
+                ).df
+            client.close()
+        self.assertEqual(search.shape[0], 49)
+        self.assertFalse(any(i.endswith("00007") for i in search.index))
+        self.assertTrue(search["viewCount"].notna().all())
+        self.assertEqual(channels.shape[0], 30)
+        poisoned = channels["videoId"].str.endswith("00007")
+        self.assertTrue(channels.loc[poisoned, "viewCount"].isna().all())
+        self.assertTrue(channels.loc[~poisoned, "viewCount"].notna().all())
+
+    def test_channel_quota_keeps_uploads(self):
+        """Test that uploads stay when the quota refuses their statistics."""
+        with QuotaServer(Fixtures(uploads_per_channel=30)) as server:
+            client = TubeFramesClient(
+                "test_key_value", base_url=server.base_url
+            )
+            df = ChannelInfo(
+                "UC0",
+                max_results=30,
+                columns=["title", "viewCount"],
+                client=client,
+            ).df
+            client.close()
+        self.assertEqual(server.errors["videos"], 1)
+        self.assertEqual(df.shape[0], 30)
+        self.assertTrue(df["viewCount"].isna().all())
+
+    def test_refused_sync_fetches_again(self):
+        """Test that uploads dropped by a refused sync come next."""
+        for streamed in (False, True):
+            with self.subTest(streamed=streamed), \
+                    QuotaServer(Fixtures(uploads_per_channel=30)) as server, \
+                    tempfile.TemporaryDirectory() as tmp_dir:
+                client = TubeFramesClient(
+                    "test_key_value", base_url=server.base_url
+                )
+                state = ChannelSyncState(os.path.join(tmp_dir, "s.sqlite"))
+                synced = []
+                for refuse in (True, False, False):
+                    server.refuse = refuse
+                    info = ChannelInfo(
+                        "UC0",
+                        max_results=50,
+                        columns=["title", "viewCount"],
+                        where=[("viewCount", ">=", 0)],
+                        sync_state=state,
+                        lazy=streamed,
+                        client=client,
+                    )
+                    if streamed:
+                        rows = sum(info.iter_channels(), [])
+                    else:
+                        rows = info.df.to_dict("records")
+                    synced.append(len(rows))
+                state.close()
+                client.close()
+                self.assertEqual(synced, [0, 30, 0])
+
+    def test_loaded_results_are_not_streamed(self):
+        """Test that loaded results are not fetched again by the writers."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "videos.parquet")
+            search = Search("Test", maxres=50, client=self.client)
+            with self.server.patch_transcripts():
+                info = ChannelInfo("UC0", max_results=30, client=self.client)
+            for loaded in (search, info):
+                with self.assertRaises(ValueError):
+                    loaded.to_parquet(path)
+            self.assertFalse(os.path.exists(path))
+            self.assertEqual(self.server.requests["search"], 1)
+            search = Search("Test", maxres=50, lazy=True, client=self.client)
+            search.to_parquet(path)
+            self.assertEqual(self.server.requests["search"], 2)
+
+    def test_segments_are_not_streamed(self):
+        """Test that caption segments are refused when streaming."""
+        search = Search(
+            "Test",
+            caption=True,
+            caption_format="segments",
+            lazy=True,
+            client=self.client,
+        )
+        info = ChannelInfo(
+            "UC0", caption_format="segments", lazy=True, client=self.client
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "videos.parquet")
+            for streamed in (search, info):
+                with self.assertRaises(ValueError):
+                    streamed.to_parquet(path)
+            self.assertFalse(os.path.exists(path))
+        with self.assertRaises(ValueError):
+            next(search.iter_pages())
+        with self.assertRaises(ValueError):
+            next(info.iter_channels())
+        self.assertEqual(self.server.total_requests, 0)
+        with self.server.patch_transcripts():
+            self.assertGreater(search.captions.shape[0], 0)
+
+    def test_search_many(self):
+        """Test that results shared by several terms are enriched once."""
+
+        class SharedFixtures(Fixtures):
+            def video_id(self, seed, n):
+                return "v{:013d}".format(n + 10 * len(seed))
+
+        with MockYouTubeServer(SharedFixtures(total_results=60)) as server:
+            client = TubeFramesClient(
+                "test_key_value", base_url=server.base_url
+            )
+            search = Search.many(["ab", "abc"], maxres=60, client=client)
+            client.close()
+        df = search.df
+        self.assertEqual(df.shape[0], 70)
+        self.assertEqual(server.requests["search"], 4)
+        self.assertEqual(server.requests["videos"], 2)
+        self.assertEqual(df.loc["v0000000000020", "terms"], ["ab"])
+        self.assertEqual(df.loc["v0000000000030", "terms"], ["ab", "abc"])
+        self.assertEqual(df.loc["v0000000000089", "terms"], ["abc"])
+
+    def test_channels(self):
+        """Test a channel pull over several uploads pages."""
+        with self.server.patch_transcripts():
+            df = ChannelInfo(
+                ["UC0", "UC1"], max_results=60, client=self.client
+            ).df
+        self.assertEqual(df.shape[0], 60)
+        self.assertEqual(self.server.requests["channels"], 1)
+
+    def test_iter_channel_rows(self):
+        """Test that streamed channels come with their IDs, in order."""
+        info = ChannelInfo(
+            ["UC0", "UC1"], max_results=30, lazy=True, client=self.client
+        )
+        with self.server.patch_transcripts():
+            channels = [
+                (channel_id, len(rows))
+                for channel_id, rows in info.iter_channel_rows()
+            ]
+        self.assertEqual(channels, [("UC0", 30), ("UC1", 30)])
+
+    def test_capped_sync_fetches_gap(self):
+        """Test that uploads left out by a capped sync come next."""
+
+        class GrowingFixtures(Fixtures):
+            hidden = 15
+
+            def upload_items(self, playlist_id, start, count):
+                return super().upload_items(
+                    playlist_id, start + self.hidden, count
+                )
+
+        fixtures = GrowingFixtures(uploads_per_channel=30)
+        with MockYouTubeServer(fixtures) as server, \
+                tempfile.TemporaryDirectory() as tmp_dir:
+            client = TubeFramesClient(
+                "test_key_value", base_url=server.base_url
+            )
+            state = ChannelSyncState(os.path.join(tmp_dir, "sync.sqlite"))
+            synced = []
+            for hidden in (15, 0, 0, 0):
+                fixtures.hidden = hidden
+                with server.patch_transcripts():
+                    info = ChannelInfo(
+                        "UC0", max_results=10, sync_state=state, client=client
+                    )
+                    synced.append(list(info.df.get("title", [])))
+            state.close()
+            client.close()
+        uploads = ["UU0 upload {}".format(n) for n in range(30)]
+        self.assertEqual(synced[0], uploads[15:25])
+        self.assertEqual(synced[1], uploads[:10])
+        self.assertEqual(synced[2], uploads[10:15])
+        self.assertEqual(synced[3], [])
+
+    def test_compact_mode(self):
+        """Test that repeated results are enriched once and pages freed."""
+
+        class RepeatingFixtures(Fixtures):
+            def video_id(self, seed, n):
+                return "v{:013d}".format(n % 40)
+
+        fixtures = RepeatingFixtures(
+            total_results=120, uploads_per_channel=60, transcript_segments=3
+        )
+        with MockYouTubeServer(fixtures) as server:
+            client = TubeFramesClient(
+                "test_key_value", base_url=server.base_url
+            )
+            with server.patch_transcripts():
+                search = Search(
+                    "Test",
+                    maxres=100,
+                    caption=True,
+                    keep_raw=False,
+                    client=client,
+                )
+                transcripts = server.requests["transcripts"]
+                info = ChannelInfo(
+                    "UC0", max_results=60, keep_raw=False, client=client
+                )
+            client.close()
+        self.assertEqual(search.df.shape[0], 40)
+        self.assertEqual(transcripts, 40)
+        self.assertEqual(len(search.raw), 2)
+        self.assertNotIn("items", search.raw[0])
+        self.assertIn("nextPageToken", search.raw[0])
+        self.assertEqual(info.df.shape[0], 40)
+        self.assertEqual(
+            set(info.raw_data["UC0"]["items"][0]), {"contentDetails"}
+        )
+
+    def test_content_details(self):
+        """Test that video details come with the counts, in one call."""
+        search = Search(
+            "Test",
+            maxres=100,
+            content_details=True,
+            where=[("duration", ">", 1800)],
+            client=self.client,
+        )
+        df = search.df
+        self.assertEqual(self.server.requests["videos"], 2)
+        self.assertEqual(str(df["duration"].dtype), "Int64")
+        self.assertTrue((df["duration"] > 1800).all())
+        self.assertEqual(set(df["definition"]), {"hd", "sd"})
+        self.assertEqual(str(df["hasCaption"].dtype), "boolean")
+        with self.assertRaises(ValueError):
+            Search("Test", columns=["duration"], lazy=True, client=self.client)
+
+    def test_injected_errors_are_retried(self):
+        """Test that injected server errors are retried."""
+        self.server.error_rate = 0.3
+        df = Search("Test", maxres=100, client=self.client).df
+        self.assertEqual(df.shape[0], 100)
+        self.assertTrue(sum(self.server.errors.values()) > 0)
+
+    def test_injected_quota_error(self):
+        """Test that an injected quotaExceeded error is not retried."""
+        self.server.error_rate = 1.0
+        self.server.error_status = 403
+        with self.assertRaises(QuotaExceededError):
+            self.client.get("videos", {"part": "statistics", "id": "v1"})
+        self.assertEqual(self.server.total_requests, 1)
+
+    def test_injected_transcript_errors(self):
+        """Test that injected transcript errors raise the library errors."""
+        self.server.error_rate = 1.0
+        self.server.error_status = 429
+        with self.assertRaises(ytapi.RequestBlocked):
+            self.server.list_transcripts("v1")
+        self.server.error_status = 503
+        with self.assertRaises(ytapi.YouTubeRequestFailed):
+            self.server.list_transcripts("v1")
+        with self.server.patch_transcripts():
+            captions = get_videos_captions(["v1", "v2"], ["en"])
+        self.assertEqual(captions, [None, None])
+        self.assertEqual(self.server.errors["transcripts"], 4)
+
+    def test_etag_revalidation(self):
+        """Test that unchanged responses are answered with 304."""
+        first = self.client.session.get(
+            self.server.base_url + "videos", params={"id": "v1"}
+        )
+        second = self.client.session.get(
+            self.server.base_url + "videos",
+            params={"id": "v1"},
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+        self.assertEqual(second.status_code, 304)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import os
+import tempfile
+from tubeframes.quota import (
+    QuotaScheduler,
+    QuotaBudgetExceeded,
+    estimate_quota,
+)
+
+
+class TestQuotaScheduler(unittest.TestCase):
+    """Tests for quota accounting."""
+
+    def test_estimate(self):
+        """Test estimating a job from call counts."""
+        self.assertEqual(estimate_quota({"search": 10, "videos": 10}), 1010)
+        scheduler = QuotaScheduler(costs={"videos": 2})
+        self.assertEqual(scheduler.estimate({"search": 1, "videos": 3}), 106)
+
+    def test_daily_budget(self):
+        """Test that calls beyond the daily budget are refused."""
+        scheduler = QuotaScheduler(daily_budget=201)
+        scheduler.acquire("search")
+        scheduler.acquire("search")
+        self.assertEqual(scheduler.remaining, 1)
+        with self.assertRaises(QuotaBudgetExceeded):
+            scheduler.acquire("search")
+        scheduler.acquire("videos")
+        self.assertEqual(scheduler.remaining, 0)
+
+    def test_enrichment_reserve(self):
+        """Test that search pages cannot spend the enrichment reserve."""
+        scheduler = QuotaScheduler(daily_budget=150, enrichment_reserve=60)
+        with self.assertRaises(QuotaBudgetExceeded):
+            scheduler.acquire("search")
+        for _ in range(60):
+            scheduler.acquire("videos")
+        self.assertEqual(scheduler.used, 60)
+
+    def test_per_minute_budget(self):
+        """Test that the per-minute budget delays expensive calls."""
+        scheduler = QuotaScheduler(per_minute=100)
+        self.assertEqual(scheduler.reserve("search"), 0)
+        self.assertGreater(scheduler.reserve("videos"), 0)
+
+    def test_state_file(self):
+        """Test that units spent are kept across schedulers."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "quota.json")
+            QuotaScheduler(path=path).acquire("search")
+            self.assertEqual(QuotaScheduler(path=path).used, 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+import time
+from tubeframes.ratelimit import RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Tests for the token bucket rate limiter."""
+
+    def test_unlimited(self):
+        """Test that a limiter without rate never waits."""
+        limiter = RateLimiter()
+        start = time.monotonic()
+        for _ in range(100):
+            limiter.acquire()
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    def test_rate(self):
+        """Test that calls are spaced according to the rate."""
+        limiter = RateLimiter(rate=50)
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        # The first call uses the burst token, the next five wait 20 ms each
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+
+if __name__ == "__main__":
+    unittest.main()
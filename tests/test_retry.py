@@ -0,0 +1,72 @@
+import unittest
+import json
+from tubeframes.client import http_error
+from tubeframes.retry import RetryPolicy, QuotaExceededError, retry_after
+
+
+def api_error(status, reason=None, headers=None):
+    """Build an HttpError shaped like a YouTube Data API error."""
+    errors = [{"reason": reason}] if reason else []
+    content = json.dumps(
+        {"error": {"code": status, "message": "error", "errors": errors}}
+    ).encode("utf-8")
+    return http_error(status, headers or {}, content, "http://test/videos")
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Tests for the retry policy shared by the API clients."""
+
+    def test_quota_exceeded_is_not_retried(self):
+        """Test that an exhausted daily quota raises at once."""
+        policy = RetryPolicy()
+        with self.assertRaises(QuotaExceededError):
+            policy.on_http_error(api_error(403, "quotaExceeded"), 0)
+
+    def test_rate_limit_is_retried(self):
+        """Test that a rate limit error is retried and slows the client."""
+        policy = RetryPolicy(backoff=0.5, jitter=False)
+        delay = policy.on_http_error(api_error(403, "rateLimitExceeded"), 1)
+        self.assertEqual(delay, 1.0)
+        self.assertIsNotNone(policy.throttle.rate)
+
+    def test_server_error_is_retried(self):
+        """Test that 5xx responses are retried until attempts run out."""
+        policy = RetryPolicy(max_retries=2, jitter=False)
+        self.assertEqual(policy.on_http_error(api_error(503), 0), 1.0)
+        with self.assertRaises(Exception):
+            policy.on_http_error(api_error(503), 2)
+
+    def test_client_error_is_not_retried(self):
+        """Test that other 4xx responses are raised unchanged."""
+        policy = RetryPolicy()
+        error = api_error(400, "badRequest")
+        with self.assertRaises(type(error)):
+            policy.on_http_error(error, 0)
+
+    def test_retry_after(self):
+        """Test that Retry-After overrides the computed backoff."""
+        error = api_error(429, headers={"Retry-After": "3"})
+        self.assertEqual(retry_after(error), 3.0)
+        policy = RetryPolicy(backoff=10, jitter=False)
+        self.assertEqual(policy.on_http_error(error, 0), 3.0)
+
+    def test_backoff_is_capped(self):
+        """Test that delays grow exponentially up to the maximum."""
+        policy = RetryPolicy(backoff=1, max_backoff=5, jitter=False)
+        self.assertEqual(
+            [policy.delay(attempt) for attempt in range(4)], [1, 2, 4, 5]
+        )
+
+    def test_throttle_recovers(self):
+        """Test that successes lift the adaptive rate limit again."""
+        policy = RetryPolicy()
+        policy.on_http_error(api_error(429), 0)
+        for _ in range(100000):
+            if policy.throttle.rate is None:
+                break
+            policy.on_success()
+        self.assertIsNone(policy.throttle.rate)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,3 +22,16 @@ class TestSearch(unittest.TestCase):
     def test_big_shape(self):
         df_shape = Search("Test", maxres=100).df.shape
         self.assertTrue(df_shape[0] >= 50)
+
+    def test_lazy(self):
+        search = Search("Test", maxres=25, lazy=True)
+        self.assertIsNone(search._raw)
+        self.assertTrue(search.df.shape[0] >= 1)
+        self.assertEqual(len(search.raw), 1)
+
+    def test_iter_pages(self):
+        search = Search("Test", maxres=100, lazy=True)
+        pages = list(search.iter_pages())
+        self.assertTrue(len(pages) >= 2)
+        self.assertTrue(all("viewCount" in row for row in pages[0]))
+        self.assertIsNone(search._raw)
@@ -0,0 +1,112 @@
+import unittest
+import os
+import tempfile
+from tubeframes.config.constants import (
+    CHANNEL_INFO_COLUMNS,
+    CONTENT_DETAILS_COLUMNS,
+)
+from tubeframes.sink import ParquetSink, ArrowSink
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+
+def make_rows(count):
+    """Build rows shaped like ChannelInfo rows."""
+    return [
+        {
+            "channelId": "channel",
+            "videoId": "video{}".format(i),
+            "title": "Video {}".format(i),
+            "publishedAt": "2022-01-01T00:00:00Z",
+            "viewCount": str(i),
+            "thumbnails": {"default": {"url": "ignored"}},
+        }
+        for i in range(count)
+    ]
+
+
+@unittest.skipIf(pa is None, "pyarrow not installed")
+class TestSinks(unittest.TestCase):
+    """Tests for the incremental Parquet and Arrow writers."""
+
+    def setUp(self):
+        """Create a temporary output directory."""
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_dir = self._tmp_dir.name
+
+    def tearDown(self):
+        """Remove the temporary output directory."""
+        self._tmp_dir.cleanup()
+
+    def test_parquet_row_groups(self):
+        """Test that rows are written in row groups with a fixed schema."""
+        path = os.path.join(self.tmp_dir, "videos.parquet")
+        with ParquetSink(path, CHANNEL_INFO_COLUMNS, row_group_size=4) as sink:
+            sink.write_rows(make_rows(3))
+            sink.write_rows(make_rows(7))
+
+        parquet_file = pq.ParquetFile(path)
+        self.assertEqual(parquet_file.metadata.num_row_groups, 3)
+        table = parquet_file.read()
+        self.assertEqual(table.num_rows, 10)
+        self.assertEqual(
+            table.column_names, [name for name, _ in CHANNEL_INFO_COLUMNS]
+        )
+        self.assertEqual(table.schema.field("viewCount").type, pa.int64())
+        self.assertTrue(
+            pa.types.is_timestamp(table.schema.field("publishedAt").type)
+        )
+        self.assertEqual(table.column("caption").null_count, 10)
+
+    def test_parquet_dataset_append(self):
+        """Test that each sink on a directory adds a new part file."""
+        for _ in range(2):
+            with ParquetSink(self.tmp_dir, CHANNEL_INFO_COLUMNS) as sink:
+                sink.write_rows(make_rows(2))
+        self.assertEqual(len(os.listdir(self.tmp_dir)), 2)
+        self.assertEqual(pq.read_table(self.tmp_dir).num_rows, 4)
+
+    def test_arrow(self):
+        """Test writing an Arrow IPC file."""
+        path = os.path.join(self.tmp_dir, "videos.arrow")
+        with ArrowSink(path, CHANNEL_INFO_COLUMNS, row_group_size=2) as sink:
+            sink.write_rows(make_rows(5))
+        table = pa.ipc.open_file(path).read_all()
+        self.assertEqual(table.num_rows, 5)
+
+    def test_content_details(self):
+        """Test that durations are written as seconds and flags as bools."""
+        path = os.path.join(self.tmp_dir, "videos.parquet")
+        rows = make_rows(3)
+        for row, duration in zip(rows, ["PT1M5S", "PT1H", None]):
+            row.update(duration=duration, definition="hd", hasCaption="true")
+        columns = CHANNEL_INFO_COLUMNS + CONTENT_DETAILS_COLUMNS
+        with ParquetSink(path, columns) as sink:
+            sink.write_rows(rows)
+        table = pq.read_table(path)
+        durations = table.column("duration").to_pylist()
+        self.assertEqual(durations, [65, 3600, None])
+        self.assertEqual(table.schema.field("hasCaption").type, pa.bool_())
+
+
+    def test_fractional_timestamps(self):
+        """Test that timestamps with fractional seconds are truncated."""
+        path = os.path.join(self.tmp_dir, "videos.parquet")
+        rows = make_rows(3)
+        for row, published in zip(
+            rows, ["2022-01-01T00:00:00.000Z", "2022-01-01T00:00:00.5Z", None]
+        ):
+            row["publishedAt"] = published
+        with ParquetSink(path, CHANNEL_INFO_COLUMNS) as sink:
+            sink.write_rows(rows)
+        published = pq.read_table(path).column("publishedAt").to_pylist()
+        self.assertEqual(published[0], published[1])
+        self.assertEqual(published[1].isoformat(), "2022-01-01T00:00:00+00:00")
+        self.assertIsNone(published[2])
+
+if __name__ == "__main__":
+    unittest.main()
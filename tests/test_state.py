@@ -0,0 +1,80 @@
+import unittest
+import os
+import tempfile
+from tubeframes.state import ChannelSyncState
+
+
+class TestChannelSyncState(unittest.TestCase):
+    """Tests for the incremental channel sync state."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.state = ChannelSyncState(
+            os.path.join(self.tmp_dir.name, "sync.sqlite")
+        )
+
+    def tearDown(self):
+        self.state.close()
+        self.tmp_dir.cleanup()
+
+    def test_unknown_channel(self):
+        """Test that a channel never synced has no mark."""
+        self.assertIsNone(self.state.get("UC1"))
+        self.assertEqual(self.state.playlists(["UC1"]), {})
+
+    def test_update_advances_mark(self):
+        """Test that the newest publishedAt and the IDs it needs are kept."""
+        self.state.update(
+            "UC1",
+            "UU1",
+            [
+                {"videoId": "a", "publishedAt": "2024-01-02T00:00:00Z"},
+                {"videoId": "b", "publishedAt": "2024-01-01T00:00:00Z"},
+            ],
+        )
+        self.state.update("UC1", "UU1", [])
+        mark = self.state.get("UC1")
+        self.assertEqual(mark.playlist_id, "UU1")
+        self.assertEqual(mark.published_at, "2024-01-02T00:00:00Z")
+        # Only videos not older than the mark can stop a sync
+        self.assertEqual(mark.video_ids, {"a"})
+        self.assertEqual(self.state.playlists(["UC1", "UC2"]), {"UC1": "UU1"})
+
+    def test_capped_update_keeps_mark(self):
+        """Test that a capped sync does not move the mark past its gap."""
+        old = {"videoId": "a", "publishedAt": "2024-01-01T00:00:00Z"}
+        self.state.update("UC1", "UU1", [old])
+        new = {"videoId": "c", "publishedAt": "2024-01-03T00:00:00Z"}
+        self.state.update("UC1", "UU1", [new], complete=False)
+        mark = self.state.get("UC1")
+        self.assertEqual(mark.published_at, "2024-01-01T00:00:00Z")
+        self.assertEqual(mark.video_ids, {"a", "c"})
+
+        gap = {"videoId": "b", "publishedAt": "2024-01-02T00:00:00Z"}
+        self.state.update("UC1", "UU1", [gap])
+        mark = self.state.get("UC1")
+        self.assertEqual(mark.published_at, "2024-01-03T00:00:00Z")
+        self.assertEqual(mark.video_ids, {"c"})
+
+    def test_incomplete_first_update_keeps_oldest(self):
+        """Test that a first sync leaving uploads out marks the oldest."""
+        new = {"videoId": "c", "publishedAt": "2024-03-01T00:00:00Z"}
+        self.state.update(
+            "UC1", "UU1", [new], complete=False,
+            oldest="2024-02-01T00:00:00Z",
+        )
+        mark = self.state.get("UC1")
+        self.assertEqual(mark.published_at, "2024-02-01T00:00:00Z")
+        self.assertEqual(mark.video_ids, {"c"})
+
+    def test_clear(self):
+        """Test that clearing a channel forgets its mark."""
+        self.state.update("UC1", "UU1", [{"videoId": "a"}])
+        self.state.update("UC2", "UU2", [{"videoId": "b"}])
+        self.state.clear("UC1")
+        self.assertIsNone(self.state.get("UC1"))
+        self.assertIsNotNone(self.state.get("UC2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
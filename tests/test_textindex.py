@@ -0,0 +1,105 @@
+import unittest
+import os
+import tempfile
+import pandas as pd
+from tubeframes import Search, TubeFramesClient, RetryPolicy
+from tubeframes.testing.mockserver import MockYouTubeServer, Fixtures
+from tubeframes.textindex import CaptionIndex
+
+
+class TestCaptionIndex(unittest.TestCase):
+    """Tests for the full-text caption index."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "captions.sqlite")
+        self.index = CaptionIndex(self.path)
+
+    def tearDown(self):
+        self.index.close()
+        self.tmp_dir.cleanup()
+
+    def test_ranked_phrase_search(self):
+        """Test phrase queries, title weight and accent folding."""
+        self.index.add_rows(
+            [
+                {"videoId": "a", "title": "Cooking", "caption": "data café"},
+                {"videoId": "b", "title": "Data talk", "caption": "more"},
+                {"videoId": "c", "caption": "science of data"},
+                {"videoId": "d", "caption": "data science for all"},
+            ]
+        )
+        self.assertEqual(list(self.index.search("data")["videoId"])[0], "b")
+        found = self.index.search("data science", phrase=True)
+        self.assertEqual(list(found["videoId"]), ["d"])
+        self.assertEqual(list(self.index.search("cafe")["videoId"]), ["a"])
+        with self.assertRaises(ValueError):
+            self.index.search('"unbalanced')
+
+    def test_incremental_additions(self):
+        """Test that videos are updated and the index persists."""
+        self.index.add_rows(
+            [{"videoId": "a", "title": "old", "caption": "hello world"}]
+        )
+        self.index.add_rows([{"videoId": "a", "title": "new"}])
+        self.index.close()
+        self.index = CaptionIndex(self.path)
+        self.assertEqual(len(self.index.search("old")), 0)
+        found = self.index.search("hello")
+        self.assertEqual(found["title"].tolist(), ["new"])
+        self.assertEqual(found["snippet"].tolist(), ["[hello] world"])
+
+    def test_segment_hits(self):
+        """Test that matches are traced back to caption segments."""
+        segments = pd.DataFrame(
+            {
+                "videoId": ["a", "a", "b"],
+                "lang": "en",
+                "start": [0.0, 12.5, 3.0],
+                "duration": 2.0,
+                "text": ["intro", "the river bank", "river"],
+            }
+        )
+        self.assertEqual(self.index.add_segments(segments), 3)
+        self.assertEqual(self.index.add_segments(segments), 3)
+        hits = self.index.find_segments("river", video_ids=["a"])
+        self.assertEqual(hits["start"].tolist(), [12.5])
+        self.assertEqual(len(self.index.find_segments("river")), 2)
+
+
+class TestCaptionIndexSearch(unittest.TestCase):
+    """Tests for indexing results fetched from the mock API server."""
+
+    def test_add_frame(self):
+        """Test that a search with caption segments can be indexed."""
+        fixtures = Fixtures(total_results=20, transcript_segments=3)
+        with MockYouTubeServer(fixtures) as server:
+            client = TubeFramesClient(
+                "test_key_value",
+                base_url=server.base_url,
+                retry=RetryPolicy(backoff=0.001, jitter=False),
+            )
+            with server.patch_transcripts():
+                search = Search(
+                    "Test",
+                    maxres=20,
+                    caption=True,
+                    caption_format="segments",
+                    client=client,
+                )
+            client.close()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            index = CaptionIndex(os.path.join(tmp_dir, "captions.sqlite"))
+            self.assertEqual(index.add_frame(search.df, search.captions), 20)
+            video_id = search.df.index[0]
+            text = search.captions["text"].iloc[0].split()[0]
+            found = index.search(text, limit=100)
+            self.assertIn(video_id, found["videoId"].tolist())
+            hits = index.find_segments(text, video_ids=[video_id])
+            self.assertGreater(len(hits), 0)
+            index.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
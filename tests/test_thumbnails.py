@@ -0,0 +1,83 @@
+import unittest
+import os
+import tempfile
+from tubeframes import Search, TubeFramesClient, RetryPolicy
+from tubeframes.testing.mockserver import MockYouTubeServer, Fixtures
+from tubeframes.thumbnails import ThumbnailStore
+
+
+class SharedThumbnailFixtures(Fixtures):
+    """Fixtures where every video without a maxres image shares one."""
+
+    def thumbnail(self, video_id, image):
+        if image == "hqdefault.jpg":
+            return b"\xff\xd8\xff\xe0shared" * 1000
+        return super().thumbnail(video_id, image)
+
+
+class TestThumbnailStore(unittest.TestCase):
+    """Tests for the concurrent, content-addressed thumbnail downloads."""
+
+    def setUp(self):
+        """Start a mock server and open a store in a temporary dir."""
+        self.server = MockYouTubeServer(
+            SharedThumbnailFixtures(total_results=60)
+        ).start()
+        self.addCleanup(self.server.stop)
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp_dir.cleanup)
+        self.store = ThumbnailStore(
+            self._tmp_dir.name, base_url=self.server.thumbnail_url
+        )
+        self.addCleanup(self.store.close)
+        self.video_ids = ["v{:013d}".format(n) for n in range(30)]
+
+    def test_tier_fallback_and_dedupe(self):
+        """Test that missing tiers fall back and equal images are shared."""
+        result = self.store.download(self.video_ids, workers=4)
+        self.assertEqual(list(result["videoId"]), self.video_ids)
+        fallback = result[result["tier"] == "high"]
+        self.assertGreater(len(fallback), 1)
+        self.assertEqual(
+            self.server.requests["thumbnails"], len(result) + len(fallback)
+        )
+        self.assertEqual(fallback["sha256"].nunique(), 1)
+        self.assertEqual(
+            set(fallback["status"]), {"downloaded", "duplicate"}
+        )
+        stats = self.store.stats()
+        self.assertEqual(stats["videos"], 30)
+        self.assertEqual(stats["images"], 30 - len(fallback) + 1)
+        with open(result["path"].iloc[0], "rb") as image:
+            self.assertTrue(image.read().startswith(b"\xff\xd8"))
+
+    def test_skip_present(self):
+        """Test that stored videos are skipped unless their file is gone."""
+        first = self.store.download(self.video_ids[:5])
+        self.server.reset()
+        again = self.store.download(self.video_ids[:5] * 2)
+        self.assertEqual(list(again["status"]), ["present"] * 5)
+        self.assertEqual(self.server.requests["thumbnails"], 0)
+        removed = first[first["tier"] == "maxres"]["path"].iloc[0]
+        os.remove(removed)
+        again = self.store.download(self.video_ids[:5])
+        self.assertEqual(list(again["status"]).count("downloaded"), 1)
+
+    def test_search_thumbnails(self):
+        """Test downloading the thumbnails of a search's videos."""
+        client = TubeFramesClient(
+            "test_key_value",
+            base_url=self.server.base_url,
+            retry=RetryPolicy(backoff=0.001, jitter=False),
+        )
+        self.addCleanup(client.close)
+        search = Search("Test", maxres=20, client=client)
+        result = search.download_thumbnails(self.store)
+        self.assertEqual(list(result["videoId"]), list(search.df.index))
+        self.assertEqual(result["path"].isna().sum(), 0)
+        endpoints = search.metrics.to_frame().index
+        self.assertIn("thumbnails", endpoints)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,8 +5,16 @@ from tubeframes.utils import (
     get_dev_key,
     create_tubeframes_client,
     get_video_captions,
+    get_videos_captions,
     get_video_statistics,
+    get_videos_statistics,
+    chunk_ids,
     create_df_from_items,
+    FrameBuilder,
+    CaptionTable,
+    join_captions,
+    parse_duration,
+    parse_durations,
 )
 
 
@@ -48,11 +56,27 @@ class TestUtilsFunctions(unittest.TestCase):
         self.assertIn("viewCount", stats)
         self.assertIn("likeCount", stats)
 
+    def test_get_videos_statistics(self):
+        """Test getting statistics for several videos at once."""
+        stats = get_videos_statistics(
+            [self.TEST_VIDEO_ID, self.TEST_VIDEO_ID], self.developer_key
+        )
+        self.assertEqual(list(stats), [self.TEST_VIDEO_ID])
+        self.assertIn("viewCount", stats[self.TEST_VIDEO_ID])
+
     def test_get_video_captions(self):
         """Test getting video captions."""
         captions = get_video_captions(self.TEST_VIDEO_ID, ["en"])
         self.assertTrue(captions is None or isinstance(captions, str))
 
+    def test_get_videos_captions(self):
+        """Test getting captions concurrently keeps the input order."""
+        video_ids = [self.TEST_VIDEO_ID, "invalid_video", self.TEST_VIDEO_ID]
+        captions = get_videos_captions(video_ids, ["en"], workers=3)
+        self.assertEqual(len(captions), 3)
+        self.assertEqual(captions[0], captions[2])
+        self.assertIsNone(captions[1])
+
     def test_create_df_from_items(self):
         """Test creating DataFrame from items."""
         # Test with empty list
@@ -80,5 +104,130 @@ class TestUtilsFunctions(unittest.TestCase):
         self.assertNotIn("publishedAt", df.columns)
 
 
+class TestChunkIds(unittest.TestCase):
+    """Tests for splitting IDs into API-sized batches."""
+
+    def test_chunk_ids(self):
+        """Test that IDs are split in order into chunks of 50."""
+        ids = [str(i) for i in range(120)]
+        chunks = chunk_ids(ids)
+        self.assertEqual([len(chunk) for chunk in chunks], [50, 50, 20])
+        self.assertEqual(sum(chunks, []), ids)
+
+    def test_chunk_ids_empty(self):
+        """Test that an empty list produces no chunks."""
+        self.assertEqual(chunk_ids([]), [])
+
+
+class TestFrameBuilder(unittest.TestCase):
+    """Tests for the typed, column-buffered DataFrame construction."""
+
+    ROWS = [
+        {
+            "videoId": "a",
+            "channelId": "UC1",
+            "publishedAt": "2022-01-01T00:00:00Z",
+            "viewCount": "10",
+        },
+        {
+            "videoId": "b",
+            "channelId": "UC1",
+            "publishedAt": "2022-01-02T00:00:00.5Z",
+            "likeCount": "3",
+        },
+    ]
+
+    def test_column_types(self):
+        """Test that known columns get compact, nullable dtypes."""
+        df = create_df_from_items(self.ROWS)
+        self.assertEqual(
+            list(df.columns),
+            ["videoId", "channelId", "publishedAt", "viewCount", "likeCount"],
+        )
+        self.assertEqual(str(df["viewCount"].dtype), "Int64")
+        self.assertTrue(pd.isna(df["viewCount"].iloc[1]))
+        self.assertEqual(df["likeCount"].iloc[1], 3)
+        self.assertIsInstance(df["channelId"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(df["videoId"].dtype, pd.StringDtype)
+        self.assertTrue(
+            pd.api.types.is_datetime64_any_dtype(df["publishedAt"])
+        )
+
+    def test_rows_added_in_batches(self):
+        """Test that columns appearing late are padded with nulls."""
+        builder = FrameBuilder()
+        builder.add_rows([{"title": "x"}])
+        builder.add_rows([{"title": "y", "commentCount": "4"}])
+        df = builder.to_frame()
+        self.assertEqual(len(builder), 2)
+        self.assertTrue(pd.isna(df["commentCount"].iloc[0]))
+        self.assertEqual(df["commentCount"].iloc[1], 4)
+
+    def test_pyarrow_backend(self):
+        """Test that the pyarrow backend builds Arrow-backed columns."""
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            self.skipTest("pyarrow not installed")
+        df = create_df_from_items(self.ROWS, dtype_backend="pyarrow")
+        self.assertTrue(
+            all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+        )
+
+    def test_durations(self):
+        """Test that ISO 8601 durations become nullable seconds."""
+        self.assertEqual(parse_duration("PT1H2M3S"), 3723)
+        self.assertEqual(parse_duration("P1DT2S"), 86402)
+        self.assertIsNone(parse_duration("1:02"))
+        seconds = parse_durations(["PT45S", None, "P0D", "bad", "PT45S"])
+        self.assertEqual(str(seconds.dtype), "Int64")
+        self.assertEqual(list(seconds.fillna(-1)), [45, -1, 0, -1, 45])
+        df = create_df_from_items(
+            [{"duration": "PT2M", "hasCaption": "false"}, {"title": "x"}]
+        )
+        self.assertEqual(df["duration"].iloc[0], 120)
+        self.assertEqual(str(df["hasCaption"].dtype), "boolean")
+        self.assertFalse(df["hasCaption"].iloc[0])
+
+    def test_invalid_backend(self):
+        """Test that unknown backends are rejected."""
+        with self.assertRaises(ValueError):
+            FrameBuilder(dtype_backend="polars")
+
+
+class TestCaptionTable(unittest.TestCase):
+    """Tests for the long-format caption table."""
+
+    SEGMENTS = [
+        {"text": "Hello", "start": 0.0, "duration": 1.5},
+        {"text": "world", "start": 1.5, "duration": 2.0},
+    ]
+
+    def test_to_frame(self):
+        """Test that segments become one row each, with timing."""
+        table = CaptionTable()
+        table.add("a", "en", self.SEGMENTS)
+        table.add_found(["b", "c"], [("pt", self.SEGMENTS[:1]), None])
+        df = table.to_frame()
+        self.assertEqual(list(df.columns), CaptionTable.COLUMNS)
+        self.assertEqual(len(df), 3)
+        self.assertEqual(list(df["start"]), [0.0, 1.5, 0.0])
+        self.assertIsInstance(df["videoId"].dtype, pd.CategoricalDtype)
+
+    def test_duplicate_video_is_skipped(self):
+        """Test that a video found on two pages is stored once."""
+        table = CaptionTable()
+        table.add("a", "en", self.SEGMENTS)
+        table.add("a", "en", self.SEGMENTS)
+        self.assertEqual(len(table), 2)
+
+    def test_join_captions(self):
+        """Test that joined text matches the single-string format."""
+        table = CaptionTable()
+        table.add("a", "en", self.SEGMENTS)
+        text = join_captions(table.to_frame())
+        self.assertEqual(text["a"], "Hello; world")
+
+
 if __name__ == "__main__":
     unittest.main()
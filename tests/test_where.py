@@ -0,0 +1,138 @@
+import unittest
+from tubeframes import Search, ChannelInfo, TubeFramesClient, RetryPolicy
+from tubeframes.config.constants import VIDEO_SEARCH_COLUMNS
+from tubeframes.testing.mockserver import MockYouTubeServer, Fixtures
+from tubeframes.where import Predicate, Where, column_stage
+
+
+class TestWhere(unittest.TestCase):
+    """Tests for where conditions and their stages."""
+
+    def test_predicate(self):
+        """Test that API strings are compared as counts and dates."""
+        row = {"viewCount": "1500", "publishedAt": "2024-03-01T10:00:00Z"}
+        self.assertTrue(Predicate("viewCount", ">=", 1000)(row))
+        self.assertFalse(Predicate("viewCount", "<", 1000)(row))
+        self.assertTrue(Predicate("publishedAt", ">=", "2024-01-01")(row))
+        self.assertTrue(
+            Predicate("viewCount", lambda views: views % 2 == 0)(row)
+        )
+        self.assertFalse(Predicate("likeCount", ">=", 0)(row))
+        with self.assertRaises(ValueError):
+            Predicate("viewCount", "~", 1)
+
+    def test_malformed_conditions(self):
+        """Test that malformed conditions raise ValueError."""
+        for condition in [
+            ("duration", ">"),
+            ("duration", ">", None),
+            ("viewCount", ">=", "many"),
+            ("viewCount", "in", 5),
+            ("viewCount", ["<"], 5),
+            ("viewCount", lambda views: views > 0, 5),
+        ]:
+            with self.subTest(condition=condition):
+                with self.assertRaises(ValueError):
+                    Where([condition], VIDEO_SEARCH_COLUMNS)
+
+    def test_stages(self):
+        """Test that conditions are grouped by the stage checking them."""
+        self.assertEqual(column_stage("channelId"), "snippet")
+        self.assertEqual(column_stage("likeCount"), "statistics")
+        self.assertEqual(column_stage("video_caption"), "captions")
+        where = Where(
+            [("viewCount", ">", 10), ("channelId", "in", ["UC1"])],
+            VIDEO_SEARCH_COLUMNS,
+        )
+        self.assertEqual(where.columns, ["channelId", "viewCount"])
+        rows = [
+            {"channelId": "UC1", "viewCount": "20"},
+            {"channelId": "UC2", "viewCount": "20"},
+            {"channelId": "UC1", "viewCount": "5"},
+        ]
+        rows = where.apply(rows, "snippet")
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(len(where.apply(rows, "statistics")), 1)
+        with self.assertRaises(ValueError):
+            Where([("dislikes", ">", 0)], VIDEO_SEARCH_COLUMNS)
+        with self.assertRaises(ValueError):
+            Where(["viewCount > 0"], VIDEO_SEARCH_COLUMNS)
+
+
+class TestWherePushdown(unittest.TestCase):
+    """Tests for where conditions against the local mock API server."""
+
+    def setUp(self):
+        """Start a small mock server."""
+        fixtures = Fixtures(
+            total_results=120, uploads_per_channel=30, transcript_segments=3
+        )
+        self.server = MockYouTubeServer(fixtures).start()
+        self.addCleanup(self.server.stop)
+        self.client = TubeFramesClient(
+            "test_key_value",
+            base_url=self.server.base_url,
+            retry=RetryPolicy(backoff=0.001, jitter=False),
+        )
+        self.addCleanup(self.client.close)
+
+    def test_search_where(self):
+        """Test that captions are fetched only for the kept results."""
+        where = [
+            ("publishedAt", ">=", "2020-01-01T00:20:00Z"),
+            ("viewCount", ">=", 5000000),
+        ]
+        with self.server.patch_transcripts():
+            full = Search("Test", maxres=100, caption=True, client=self.client)
+            self.server.reset()
+            search = Search(
+                "Test",
+                maxres=100,
+                caption=True,
+                where=where,
+                client=self.client,
+            )
+        df = full.df
+        expected = df[
+            (df["viewCount"] >= 5000000)
+            & (df["publishedAt"] >= "2020-01-01T00:20:00Z")
+        ]
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(list(search.df.index), list(expected.index))
+        self.assertEqual(self.server.requests["transcripts"], len(expected))
+
+    def test_where_unselected_column(self):
+        """Test that condition columns are fetched but not returned."""
+        search = Search(
+            "Test",
+            maxres=100,
+            columns=["title"],
+            where=[("viewCount", ">=", 5000000)],
+            client=self.client,
+        )
+        self.assertEqual(list(search.df.columns), ["title"])
+        self.assertEqual(self.server.requests["videos"], 2)
+        self.assertLess(search.df.shape[0], 100)
+        with self.assertRaises(ValueError):
+            Search(
+                "Test",
+                where=[("video_caption", "!=", "")],
+                lazy=True,
+                client=self.client,
+            )
+
+    def test_channel_where(self):
+        """Test that a channel pull filters uploads before enrichment."""
+        with self.server.patch_transcripts():
+            info = ChannelInfo(
+                ["UC0", "UC1"],
+                max_results=20,
+                where=[("channelId", "==", "UC1")],
+                client=self.client,
+            )
+        self.assertEqual(list(info.df["channelId"].unique()), ["UC1"])
+        self.assertEqual(self.server.requests["transcripts"], 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
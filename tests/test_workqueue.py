@@ -0,0 +1,77 @@
+import unittest
+import os
+import tempfile
+from tubeframes.workqueue import WorkQueue
+
+
+class TestWorkQueue(unittest.TestCase):
+    """Tests for the SQLite-backed crawl work queue."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "queue.sqlite")
+        self.queue = WorkQueue(self.path, max_attempts=2)
+
+    def tearDown(self):
+        self.queue.close()
+        self.tmp_dir.cleanup()
+
+    def test_submit_shards(self):
+        """Test that units are split into shards and resubmits ignored."""
+        added = self.queue.submit("job", "search", ["a", "b", "c"], None, 2)
+        self.assertEqual(added, 3)
+        self.assertEqual(self.queue.submit("job", "search", ["a", "d"]), 1)
+        first = self.queue.claim("w1")
+        second = self.queue.claim("w2")
+        self.assertEqual(first.units, ["a", "b"])
+        self.assertEqual(second.units, ["c"])
+        self.assertEqual(self.queue.claim("w3").units, ["d"])
+        self.assertIsNone(self.queue.claim("w4"))
+        with self.assertRaises(ValueError):
+            self.queue.submit("job", "channels", ["UC1"])
+
+    def test_checkpoints_and_attempts(self):
+        """Test that done units stay done and failures are retried."""
+        self.queue.submit("job", "channels", ["UC1", "UC2"])
+        shard = self.queue.claim("w1")
+        self.queue.complete(shard, "UC1", 10)
+        self.assertEqual(self.queue.fail(shard, "UC2", "boom"), "pending")
+        shard = self.queue.claim("w1")
+        self.assertEqual(shard.units, ["UC2"])
+        self.assertEqual(self.queue.fail(shard, "UC2", "boom"), "failed")
+        self.assertIsNone(self.queue.claim("w1"))
+        status = self.queue.status("job")
+        self.assertEqual(status.loc["job", "done"], 1)
+        self.assertEqual(status.loc["job", "failed"], 1)
+        self.assertEqual(status.loc["job", "rows"], 10)
+        self.assertEqual(self.queue.retry_failed(), 1)
+
+    def test_expired_lease(self):
+        """Test that the shard of a silent worker is claimed again."""
+        self.queue.submit("job", "search", ["a", "b"])
+        other = WorkQueue(self.path, lease=0)
+        self.addCleanup(other.close)
+        shard = other.claim("crashed")
+        other.complete(shard, "a", 1)
+        self.assertEqual(self.queue.claim("w2").units, ["b"])
+
+    def test_stale_worker_cannot_overwrite(self):
+        """Test that a worker whose lease ran out leaves the units alone."""
+        self.queue.submit("job", "search", ["a", "b", "c"])
+        other = WorkQueue(self.path, lease=0)
+        self.addCleanup(other.close)
+        stale = other.claim("stale")
+        current = self.queue.claim("w2")
+        self.assertEqual(current.units, ["a", "b", "c"])
+        self.assertFalse(other.complete(stale, "a", 1))
+        self.assertEqual(other.fail(stale, "b", "boom"), "running")
+        other.release(stale, ["c"])
+        self.assertTrue(self.queue.complete(current, "a", 5))
+        self.assertEqual(self.queue.fail(current, "b", "boom"), "pending")
+        status = self.queue.status("job")
+        self.assertEqual(status.loc["job", "rows"], 5)
+        self.assertEqual(status.loc["job", "running"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
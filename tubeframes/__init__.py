@@ -4,10 +4,73 @@ TubeFrames - A YouTube Data Analysis Library
 A Python package for retrieving YouTube data, including video statistics, captions, and channel information. TubeFrames outputs results in a user-friendly pandas DataFrame format, making it ideal for data analysis workflows — especially in Jupyter Notebooks.
 """
 
-from tubeframes.search import Search
-from tubeframes.channel_info import ChannelInfo
+from typing import TYPE_CHECKING
+import importlib
 
 __version__ = "0.3.2"
 __license__ = "GNU General Public License v3 (GPLv3)"
 __url__ = "https://github.com/umLu/tubeframes"
-__all__ = ["Search", "ChannelInfo"]
+
+# Public names and their modules. Modules are imported on first access,
+# so ``import tubeframes`` stays cheap and pandas, the API discovery
+# client or aiohttp are only loaded by the parts that use them.
+_EXPORTS = {
+    "Search": "tubeframes.search",
+    "ChannelInfo": "tubeframes.channel_info",
+    "TubeFramesClient": "tubeframes.client",
+    "ResponseCache": "tubeframes.cache",
+    "TranscriptCache": "tubeframes.cache",
+    "QuotaScheduler": "tubeframes.quota",
+    "QuotaBudgetExceeded": "tubeframes.quota",
+    "RetryPolicy": "tubeframes.retry",
+    "QuotaExceededError": "tubeframes.retry",
+    "Metrics": "tubeframes.metrics",
+    "RequestEvent": "tubeframes.metrics",
+    "ChannelSyncState": "tubeframes.state",
+    "WorkQueue": "tubeframes.workqueue",
+    "CaptionIndex": "tubeframes.textindex",
+    "ThumbnailStore": "tubeframes.thumbnails",
+    "ParquetSink": "tubeframes.sink",
+    "ArrowSink": "tubeframes.sink",
+    "AsyncSearch": "tubeframes.aio",
+    "AsyncChannelInfo": "tubeframes.aio",
+    "AsyncTubeFramesClient": "tubeframes.aio",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import the module of a public name on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:  # pragma: no cover - for type checkers and IDEs
+    from tubeframes.search import Search
+    from tubeframes.channel_info import ChannelInfo
+    from tubeframes.client import TubeFramesClient
+    from tubeframes.cache import ResponseCache, TranscriptCache
+    from tubeframes.quota import QuotaScheduler, QuotaBudgetExceeded
+    from tubeframes.retry import RetryPolicy, QuotaExceededError
+    from tubeframes.metrics import Metrics, RequestEvent
+    from tubeframes.state import ChannelSyncState
+    from tubeframes.workqueue import WorkQueue
+    from tubeframes.textindex import CaptionIndex
+    from tubeframes.thumbnails import ThumbnailStore
+    from tubeframes.sink import ParquetSink, ArrowSink
+    from tubeframes.aio import (
+        AsyncSearch,
+        AsyncChannelInfo,
+        AsyncTubeFramesClient,
+    )
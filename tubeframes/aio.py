@@ -0,0 +1,1205 @@
+from typing import List, Union, Dict, Optional, Any, AsyncIterator, Tuple
+import asyncio
+import logging
+import time
+import pandas as pd
+from googleapiclient.errors import HttpError
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from tubeframes.cache import ResponseCache, TranscriptCache
+from tubeframes.client import http_error
+from tubeframes.config.constants import (
+    YOUTUBE_API_BASE_URL,
+    QUOTA_COSTS,
+    CAPTION_FORMATS,
+    CHANNEL_INFO_COLUMNS,
+    CONTENT_DETAILS_COLUMNS,
+    DEFAULT_CHANNEL_WORKERS,
+    DEFAULT_POOL_SIZE,
+    MAX_IDS_PER_REQUEST,
+    DEFAULT_TIMEOUT,
+)
+from tubeframes.fields import select_columns, statistics_fields, videos_part
+from tubeframes.metrics import Metrics, RequestEvent, RequestHook, emit
+from tubeframes.quota import QuotaScheduler, QuotaBudgetExceeded
+from tubeframes.ratelimit import RateLimiter
+from tubeframes.retry import RetryPolicy, QuotaExceededError
+from tubeframes.search import Search
+from tubeframes.state import ChannelSyncState
+from tubeframes.channel_info import ChannelInfo
+from tubeframes.utils import (
+    get_dev_key,
+    get_video_captions,
+    get_video_caption_segments,
+    chunk_ids,
+    statistics_from_response,
+    merge_statistics,
+    create_df_from_items,
+    CaptionTable,
+    join_captions,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _statistics_fields(
+    columns: Optional[List[Tuple[str, str]]],
+    available: Optional[List[Tuple[str, str]]] = None,
+) -> Optional[str]:
+    """
+    Get the statistics selector of selected columns, as Search does.
+
+    Args:
+        columns: Selected output columns, None for all columns
+        available: Every output column when video details are requested,
+            None if they are not
+
+    Returns:
+        Optional[str]: None for full statistics, or "" if no count column
+        is selected and no call is needed
+    """
+    if columns is None:
+        if available is None:
+            return None
+        columns = available
+    fields = statistics_fields([name for name, _ in columns])
+    return "" if fields is None else fields
+
+
+class AsyncTubeFramesClient:
+    """
+    Asynchronous access layer to the YouTube Data API.
+
+    All requests made through one client share a single aiohttp connection
+    pool. The pool is opened on first use and must be closed with
+    ``await client.close()`` or by using the client as an async context
+    manager.
+    """
+
+    def __init__(
+        self,
+        dev_key: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        base_url: str = YOUTUBE_API_BASE_URL,
+        cache: Optional[ResponseCache] = None,
+        scheduler: Optional[QuotaScheduler] = None,
+        retry: Optional[RetryPolicy] = None,
+        hooks: Optional[List[RequestHook]] = None,
+    ) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            dev_key: YouTube API developer key
+            pool_size: Maximum number of pooled connections
+            timeout: Timeout in seconds for each HTTP request
+            base_url: Root URL of the REST endpoints
+            cache: Response cache for list calls
+            scheduler: Quota scheduler charging and pacing every call
+            retry: Retry policy for transient errors, a default
+                RetryPolicy if None
+            hooks: Callables receiving a RequestEvent for every API call,
+                retry and cache hit, and for every transcript fetch made
+                through this client
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for the asyncio API: "
+                "pip install tubeframes[async]"
+            )
+        self._developer_key = dev_key
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._base_url = base_url
+        self._session = None
+        self.cache = cache
+        self.scheduler = scheduler
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.hooks = list(hooks or [])
+
+    @property
+    def developer_key(self) -> str:
+        """YouTube API developer key used by this client."""
+        return self._developer_key
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """Pooled aiohttp session, opened on first access."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._pool_size),
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+            )
+        return self._session
+
+    def add_hook(self, hook: RequestHook) -> None:
+        """
+        Register an instrumentation hook.
+
+        Args:
+            hook: Callable receiving a RequestEvent per request
+        """
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        """
+        Unregister an instrumentation hook.
+
+        Args:
+            hook: Callable registered with add_hook
+        """
+        if hook in self.hooks:
+            self.hooks.remove(hook)
+
+    def emit(
+        self, event: RequestEvent, hook: Optional[RequestHook] = None
+    ) -> None:
+        """
+        Pass a request event to the registered hooks.
+
+        Args:
+            event: Request event
+            hook: Extra hook of the caller, such as the metrics of the
+                Search or ChannelInfo making the request
+        """
+        hooks = self.hooks if hook is None else self.hooks + [hook]
+        if hooks:
+            emit(hooks, event)
+
+    def _emit_request(
+        self,
+        resource: str,
+        sent: float,
+        status: Optional[int],
+        size: int,
+        hook: Optional[RequestHook] = None,
+    ) -> None:
+        """Emit the event of one HTTP attempt."""
+        if not self.hooks and hook is None:
+            return
+        cache = None
+        if self.cache is not None:
+            cache = "revalidated" if status == 304 else "miss"
+        if self.scheduler is not None:
+            quota = self.scheduler.cost(resource)
+        else:
+            quota = QUOTA_COSTS.get(resource, 1)
+        self.emit(
+            RequestEvent(
+                resource,
+                time.perf_counter() - sent,
+                status,
+                size,
+                quota,
+                cache,
+            ),
+            hook,
+        )
+
+    async def get(
+        self,
+        resource: str,
+        params: Dict[str, Any],
+        hook: Optional[RequestHook] = None,
+    ) -> Dict:
+        """
+        Call a list endpoint of the YouTube Data API.
+
+        With a response cache, fresh cached responses are returned without a
+        request and stale ones are revalidated with ``If-None-Match``. With a
+        quota scheduler, every request is charged and paced; cache hits are
+        free. Transient errors are retried according to the retry policy.
+        Every attempt and cache hit is reported to the hooks.
+
+        Args:
+            resource: API resource name, e.g. "search" or "videos"
+            params: Query parameters, without the developer key
+            hook: Callable receiving the events of this call only, besides
+                the registered hooks
+
+        Returns:
+            Dict: Decoded JSON response
+
+        Raises:
+            HttpError: If the API answers with an error status
+            QuotaExceededError: If the API reports the daily quota exhausted
+            QuotaBudgetExceeded: If the scheduler refuses the call
+        """
+        start = time.perf_counter()
+        query = {k: str(v) for k, v in params.items() if v is not None}
+        cached = self.cache.get(resource, query) if self.cache else None
+        if cached is not None and cached.fresh:
+            self.emit(
+                RequestEvent(
+                    resource, time.perf_counter() - start, None, 0, 0, "hit"
+                ),
+                hook,
+            )
+            return cached.data
+
+        headers = {}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+
+        attempt = 0
+        while True:
+            wait = self.retry.before_request()
+            if self.scheduler is not None:
+                wait = max(wait, self.scheduler.reserve(resource))
+            if wait > 0:
+                await asyncio.sleep(wait)
+            sent = time.perf_counter()
+            try:
+                data, etag = await self._request(
+                    resource, query, headers, sent, hook
+                )
+            except HttpError as e:
+                delay = self.retry.on_http_error(e, attempt)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self._emit_request(resource, sent, None, 0, hook)
+                delay = self.retry.on_transport_error(e, attempt)
+            else:
+                break
+            logger.warning(
+                "%s request failed (attempt %d), retrying in %.1fs",
+                resource,
+                attempt + 1,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        self.retry.on_success()
+        if data is None:
+            self.cache.touch(resource, query)
+            return cached.data
+        if self.cache is not None:
+            self.cache.set(resource, query, data, etag)
+        return data
+
+    async def _request(
+        self,
+        resource: str,
+        query: Dict[str, str],
+        headers: Dict[str, str],
+        sent: float,
+        hook: Optional[RequestHook] = None,
+    ):
+        """
+        Send one request.
+
+        Args:
+            resource: API resource name
+            query: Query parameters, without the developer key
+            headers: Request headers
+            sent: perf_counter value when the request was started
+            hook: Extra hook of the caller
+
+        Returns:
+            Tuple[Optional[Dict], Optional[str]]: Decoded JSON response and
+            its ETag, or (None, None) if a cached response was not modified
+
+        Raises:
+            HttpError: If the API answers with an error status
+        """
+        async with self.session.get(
+            self._base_url + resource,
+            params=dict(query, key=self._developer_key),
+            headers=headers,
+        ) as response:
+            content = await response.read()
+            self._emit_request(
+                resource, sent, response.status, len(content), hook
+            )
+            if response.status == 304 and "If-None-Match" in headers:
+                return None, None
+            if response.status >= 400:
+                raise http_error(
+                    response.status,
+                    response.headers,
+                    content,
+                    str(response.url),
+                )
+            data = await response.json(content_type=None)
+            return data, response.headers.get("ETag")
+
+    async def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        if self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncTubeFramesClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+class _LoopSemaphore:
+    """
+    Semaphore created in the running event loop when first entered.
+
+    asyncio primitives belong to the loop that first waits on them, so an
+    object used under several ``asyncio.run`` calls gets a new semaphore
+    for each loop.
+    """
+
+    def __init__(self, value: int) -> None:
+        self._value = max(1, value)
+        self._loop = None
+        self._semaphore = None
+
+    async def __aenter__(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self._value)
+        await self._semaphore.acquire()
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._semaphore.release()
+
+
+class _AsyncEnricher:
+    """Shared statistics and caption fetching for the async classes."""
+
+    def __init__(
+        self,
+        client: AsyncTubeFramesClient,
+        accepted_caption_lang: List[str],
+        caption_workers: int,
+        caption_rate_limit: Optional[float],
+        transcript_cache: Optional[TranscriptCache],
+        metrics: Metrics,
+    ) -> None:
+        self._client = client
+        self._metrics = metrics
+        self._accepted_caption_lang = accepted_caption_lang
+        self._transcript_cache = transcript_cache
+        self._caption_slots = _LoopSemaphore(caption_workers)
+        self._caption_limiter = RateLimiter(caption_rate_limit)
+
+    async def statistics(
+        self, video_ids: List[str], fields: Optional[str] = None
+    ) -> Dict[str, Dict]:
+        """
+        Get statistics for several videos, one call per 50 IDs.
+
+        Like ``get_videos_statistics``, a failing call is split in halves
+        until the failing IDs are isolated, so only their videos are
+        missing from the result.
+
+        Args:
+            video_ids: List of YouTube video IDs
+            fields: Partial-response selector, full statistics if None
+
+        Returns:
+            Dict[str, Dict]: Video statistics keyed by video ID
+
+        Raises:
+            QuotaExceededError: If the API reports the daily quota exhausted
+            QuotaBudgetExceeded: If the scheduler refuses a call
+        """
+        with self._metrics.phase("statistics"):
+            chunks = await asyncio.gather(
+                *[
+                    self._chunk_statistics(ids, fields)
+                    for ids in chunk_ids(list(dict.fromkeys(video_ids)))
+                ]
+            )
+        statistics = {}
+        for chunk in chunks:
+            statistics.update(chunk)
+        return statistics
+
+    async def _chunk_statistics(
+        self, video_ids: List[str], fields: Optional[str]
+    ) -> Dict[str, Dict]:
+        """Get the statistics of up to 50 videos, isolating failing IDs."""
+        ploads = {
+            "part": videos_part(fields),
+            "id": ",".join(video_ids),
+            "fields": fields,
+        }
+        try:
+            response = await self._client.get("videos", ploads, self._metrics)
+            return statistics_from_response(response)
+        except (QuotaExceededError, QuotaBudgetExceeded):
+            raise
+        except (
+            KeyError,
+            ValueError,
+            HttpError,
+            aiohttp.ClientError,
+            asyncio.TimeoutError,
+        ) as e:
+            if len(video_ids) == 1:
+                logger.warning("No statistics for %s: %s", video_ids[0], e)
+                return {}
+        half = len(video_ids) // 2
+        first, second = await asyncio.gather(
+            self._chunk_statistics(video_ids[:half], fields),
+            self._chunk_statistics(video_ids[half:], fields),
+        )
+        first.update(second)
+        return first
+
+    def _emit(self, event: RequestEvent) -> None:
+        """Report a transcript fetch to the client hooks and metrics."""
+        self._client.emit(event, self._metrics)
+
+    async def _transcript(self, fetch, video_id: str):
+        """Run a blocking transcript lookup on the default executor."""
+        async with self._caption_slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                fetch,
+                video_id,
+                self._accepted_caption_lang,
+                self._transcript_cache,
+                self._caption_limiter,
+                self._emit,
+            )
+
+    async def caption(self, video_id: str) -> Optional[str]:
+        """
+        Get captions for a video on the default executor.
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            Optional[str]: Caption text or None if not available
+        """
+        return await self._transcript(get_video_captions, video_id)
+
+    async def captions(self, video_ids: List[str]) -> List[Optional[str]]:
+        """
+        Get captions for several videos concurrently.
+
+        Args:
+            video_ids: List of YouTube video IDs
+
+        Returns:
+            List[Optional[str]]: Captions in the same order as video_ids
+        """
+        return list(
+            await asyncio.gather(
+                *[self.caption(video_id) for video_id in video_ids]
+            )
+        )
+
+    async def segments(
+        self, video_ids: List[str]
+    ) -> List[Optional[Tuple[str, List[Dict]]]]:
+        """
+        Get transcript segments for several videos concurrently.
+
+        Args:
+            video_ids: List of YouTube video IDs
+
+        Returns:
+            List[Optional[Tuple[str, List[Dict]]]]: Language and segments,
+            or None, in the same order as video_ids
+        """
+        return list(
+            await asyncio.gather(
+                *[
+                    self._transcript(get_video_caption_segments, video_id)
+                    for video_id in video_ids
+                ]
+            )
+        )
+
+    async def add_captions(
+        self,
+        video_data: List[Dict],
+        column: str,
+        caption_table: Optional[CaptionTable] = None,
+    ) -> None:
+        """
+        Add captions to rows, or their segments to a caption table.
+
+        Args:
+            video_data: Rows with a "videoId" key
+            column: Column receiving the joined caption text
+            caption_table: Table receiving the segments instead, if given
+        """
+        video_ids = [video_info["videoId"] for video_info in video_data]
+        if caption_table is not None:
+            with self._metrics.phase("captions"):
+                found = await self.segments(video_ids)
+            caption_table.add_found(video_ids, found)
+            return
+        with self._metrics.phase("captions"):
+            captions = await self.captions(video_ids)
+        for video_info, caption in zip(video_data, captions):
+            video_info[column] = caption
+
+
+class AsyncSearch:
+    """
+    Asynchronous YouTube search.
+
+    Use ``await AsyncSearch.create(...)`` to get an object with ``raw`` and
+    ``df`` filled like Search, or iterate with ``async for rows in
+    AsyncSearch(...)`` to receive enriched rows page by page. Statistics and
+    captions of a page are fetched while the next page is requested.
+    """
+
+    def __init__(
+        self,
+        term: str,
+        caption: bool = False,
+        maxres: int = 50,
+        accepted_caption_lang: Optional[List[str]] = None,
+        item_type: str = "video",
+        developer_key: Optional[str] = None,
+        client: Optional[AsyncTubeFramesClient] = None,
+        caption_workers: int = 1,
+        caption_rate_limit: Optional[float] = None,
+        transcript_cache: Optional[TranscriptCache] = None,
+        dtype_backend: str = "numpy_nullable",
+        caption_format: str = "joined",
+        columns: Optional[List[str]] = None,
+        content_details: bool = False,
+    ) -> None:
+        """
+        Initialize the AsyncSearch class. No request is made here.
+
+        Args:
+            term: YouTube search term
+            caption: Whether to include captions
+            maxres: Maximum number of results to return
+            accepted_caption_lang: List of accepted languages for captions
+            item_type: Type of item to search for ("video" or "channel")
+            developer_key: YouTube API developer key
+            client: Shared async API client, a new one if None
+            caption_workers: Number of captions fetched concurrently
+            caption_rate_limit: Maximum caption fetches started per second
+            transcript_cache: Local store of previously fetched transcripts
+            dtype_backend: "numpy_nullable" or "pyarrow" for ``df``
+            caption_format: "joined" or "segments", as in Search. Segments
+                are collected in ``captions`` by ``create``.
+            columns: Output columns to keep, all if None, as in Search
+            content_details: Whether video results also get the duration,
+                definition and hasCaption columns, as in Search
+
+        Raises:
+            ValueError: If caption_format is not supported or a column is
+                unknown
+        """
+        if accepted_caption_lang is None:
+            accepted_caption_lang = ["pt", "en"]
+        self._owns_client = client is None
+        if client is None:
+            client = AsyncTubeFramesClient(get_dev_key(developer_key))
+        self._client = client
+        self._term = term
+        self._caption = caption
+        self._maxres = maxres
+        self._item_type = item_type
+        self._dtype_backend = dtype_backend
+        if caption_format not in CAPTION_FORMATS:
+            raise ValueError(
+                "caption_format must be one of {}".format(CAPTION_FORMATS)
+            )
+        self._caption_format = caption_format
+        self._columns = Search._select_columns(
+            columns,
+            item_type,
+            caption and caption_format == "joined",
+            content_details,
+        )
+        self._available = None
+        if content_details:
+            self._available = Search._available_columns(item_type, True)
+        self._caption_table = None
+        self.metrics = Metrics()
+        self._enricher = _AsyncEnricher(
+            client,
+            accepted_caption_lang,
+            caption_workers,
+            caption_rate_limit,
+            transcript_cache,
+            self.metrics,
+        )
+        self.raw = []
+        self.df = None
+        self.captions = None
+
+    @classmethod
+    async def create(cls, *args, **kwargs) -> "AsyncSearch":
+        """
+        Run a search and build its DataFrame.
+
+        Takes the same arguments as AsyncSearch.
+
+        Returns:
+            AsyncSearch: Search with ``raw`` and ``df`` filled
+        """
+        search = cls(*args, **kwargs)
+        builder = Search._frame_builder(
+            search._item_type, search._dtype_backend, search._columns
+        )
+        if search._caption and search._caption_format == "segments":
+            search._caption_table = CaptionTable()
+        async for rows in search:
+            with search.metrics.phase("frame"):
+                builder.add_rows(rows)
+        with search.metrics.phase("frame"):
+            search.df = Search._finalize_dataframe(
+                builder, search._item_type
+            )
+            if search._caption_table is not None:
+                search.captions = search._caption_table.to_frame(
+                    search._dtype_backend
+                )
+        return search
+
+    @property
+    def caption_text(self) -> Optional[pd.Series]:
+        """Caption text per videoId, joined from ``captions`` when read."""
+        if self.captions is None:
+            return None
+        return join_captions(self.captions)
+
+    def __aiter__(self) -> AsyncIterator[List[Dict]]:
+        return self.iter_pages()
+
+    async def iter_pages(self) -> AsyncIterator[List[Dict]]:
+        """
+        Iterate over search result pages.
+
+        A client created by this object is closed when iteration ends,
+        including when the consumer stops early.
+
+        Yields:
+            List[Dict]: Enriched rows of one page, in page order
+
+        Raises:
+            ValueError: If captions are requested as segments, which only
+                ``create`` collects
+        """
+        pages = self._iter_pages()
+        try:
+            async for rows in pages:
+                yield rows
+        finally:
+            await pages.aclose()
+            if self._owns_client:
+                await self._client.close()
+
+    async def _iter_pages(self) -> AsyncIterator[List[Dict]]:
+        """
+        Page the search, enriching each page while the next is requested.
+
+        Results repeated on a later page are dropped before they are
+        enriched, like in Search. The enrichment still running when the
+        consumer stops early is cancelled.
+
+        Yields:
+            List[Dict]: Enriched rows of one page, in page order
+        """
+        segments = self._caption and self._caption_format == "segments"
+        if segments and self._caption_table is None:
+            raise ValueError(
+                'caption_format="segments" cannot be streamed; collect the '
+                "segments with create"
+            )
+        id_key = Search._id_key(self._item_type)
+        if id_key is None:
+            return
+
+        results, pages = Search._page_size(self._maxres)
+        page_token = None
+        pending = None
+        seen = set()
+        try:
+            for page in range(pages):
+                try:
+                    search_list = await self._search_from_term(
+                        results, page_token
+                    )
+                except (QuotaExceededError, QuotaBudgetExceeded) as e:
+                    if page == 0:
+                        raise
+                    # Keep the remaining budget for the pages already found
+                    logger.warning("Stopping search early: %s", e)
+                    break
+                self.raw.append(search_list)
+
+                rows = []
+                for item_info in Search._parse_page(search_list, id_key):
+                    if item_info[id_key] not in seen:
+                        seen.add(item_info[id_key])
+                        rows.append(item_info)
+                previous, pending = pending, asyncio.ensure_future(
+                    self._enrich(rows)
+                )
+                if previous is not None:
+                    yield await previous
+
+                page_token = search_list.get("nextPageToken")
+                if page_token is None:
+                    break
+
+            if pending is not None:
+                yield await pending
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+                await asyncio.wait([pending])
+
+    async def _search_from_term(
+        self, maxres: int, page_token: Optional[str]
+    ) -> Dict:
+        """
+        Search YouTube with the term.
+
+        Args:
+            maxres: Maximum number of results
+            page_token: Token for pagination
+
+        Returns:
+            Dict: Search results
+
+        Raises:
+            HttpError: If API request fails
+        """
+        try:
+            with self.metrics.phase("paging"):
+                search_list = await self._client.get(
+                    "search",
+                    Search._search_params(
+                        self._term,
+                        maxres,
+                        page_token,
+                        self._item_type,
+                        self._columns,
+                    ),
+                    self.metrics,
+                )
+            Search._validate_search_response(search_list)
+        except HttpError as e:
+            logger.error(
+                "Search for %r failed with HTTP %s: %s",
+                self._term,
+                e.resp.status,
+                e.reason,
+            )
+            raise
+        return search_list
+
+    async def _enrich(self, items_data: List[Dict]) -> List[Dict]:
+        """
+        Add statistics and, optionally, captions to the rows of a page.
+
+        Args:
+            items_data: Rows built from the page snippets
+
+        Returns:
+            List[Dict]: Enriched rows
+        """
+        if self._item_type != "video" or not items_data:
+            return items_data
+
+        enriched = items_data
+        video_ids = [video_info["videoId"] for video_info in items_data]
+        fields = _statistics_fields(self._columns, self._available)
+        try:
+            if fields != "":
+                statistics = await self._enricher.statistics(
+                    video_ids, fields
+                )
+                enriched = merge_statistics(items_data, statistics)
+        except (QuotaExceededError, QuotaBudgetExceeded) as e:
+            logger.warning(
+                "Dropping %d videos without statistics: %s", len(video_ids), e
+            )
+            return []
+
+        if self._caption:
+            await self._enricher.add_captions(
+                enriched, "video_caption", self._caption_table
+            )
+
+        return enriched
+
+
+class AsyncChannelInfo:
+    """
+    Asynchronous information about videos from YouTube channels.
+
+    Use ``await AsyncChannelInfo.create(...)`` to get an object with
+    ``raw_data`` and ``df`` filled like ChannelInfo, or iterate with
+    ``async for rows in AsyncChannelInfo(...)`` to receive enriched rows
+    channel by channel. Uploads playlists are resolved for up to 50
+    channels per call and up to ``channel_workers`` channels are crawled
+    concurrently.
+    """
+
+    def __init__(
+        self,
+        channel_ids: Union[str, List[str]],
+        max_results: int = 10,
+        accepted_caption_lang: Optional[List[str]] = None,
+        developer_key: Optional[str] = None,
+        client: Optional[AsyncTubeFramesClient] = None,
+        caption_workers: int = 1,
+        caption_rate_limit: Optional[float] = None,
+        transcript_cache: Optional[TranscriptCache] = None,
+        channel_workers: int = DEFAULT_CHANNEL_WORKERS,
+        sync_state: Optional[ChannelSyncState] = None,
+        dtype_backend: str = "numpy_nullable",
+        caption_format: str = "joined",
+        columns: Optional[List[str]] = None,
+        content_details: bool = False,
+    ) -> None:
+        """
+        Initialize the class. No request is made here.
+
+        Args:
+            channel_ids: YouTube channel ID(s).
+            max_results: Maximum number of results per channel.
+            accepted_caption_lang: List of accepted languages for captions.
+            developer_key: YouTube API developer key.
+            client: Shared async API client, a new one if None.
+            caption_workers: Number of captions fetched concurrently.
+            caption_rate_limit: Maximum caption fetches started per second.
+            transcript_cache: Local store of previously fetched transcripts.
+            channel_workers: Number of channels crawled concurrently.
+            sync_state: High-water marks of previous runs, to fetch only
+                new uploads like ChannelInfo.
+            dtype_backend: "numpy_nullable" or "pyarrow" for ``df``.
+            caption_format: "joined" or "segments", as in ChannelInfo.
+                Segments are collected in ``captions`` by ``create``.
+            columns: Output columns to keep, all if None, as in
+                ChannelInfo.
+            content_details: Whether videos also get the duration,
+                definition and hasCaption columns, as in ChannelInfo.
+
+        Raises:
+            ValueError: If caption_format is not supported or a column is
+                unknown.
+        """
+        if caption_format not in CAPTION_FORMATS:
+            raise ValueError(
+                "caption_format must be one of {}".format(CAPTION_FORMATS)
+            )
+        if accepted_caption_lang is None:
+            accepted_caption_lang = ["pt", "en"]
+        if isinstance(channel_ids, str):
+            channel_ids = [channel_ids]
+        self._owns_client = client is None
+        if client is None:
+            client = AsyncTubeFramesClient(get_dev_key(developer_key))
+        self._client = client
+        self._channel_ids = channel_ids
+        self._max_results = max_results
+        self._channel_slots = _LoopSemaphore(channel_workers)
+        self._sync_state = sync_state
+        self._dtype_backend = dtype_backend
+        self._caption_format = caption_format
+        self._available = None
+        if content_details:
+            self._available = CHANNEL_INFO_COLUMNS + CONTENT_DETAILS_COLUMNS
+        self._columns = None
+        if columns is not None:
+            self._columns = select_columns(
+                columns,
+                self._available or CHANNEL_INFO_COLUMNS,
+                ["channelId", "videoId"],
+            )
+        self._caption_table = None
+        self.metrics = Metrics()
+        self._enricher = _AsyncEnricher(
+            client,
+            accepted_caption_lang,
+            caption_workers,
+            caption_rate_limit,
+            transcript_cache,
+            self.metrics,
+        )
+        self.raw_data = {}
+        self.df = None
+        self.captions = None
+
+    @classmethod
+    async def create(cls, *args, **kwargs) -> "AsyncChannelInfo":
+        """
+        Fetch the channels and build the DataFrame.
+
+        Takes the same arguments as AsyncChannelInfo.
+
+        Returns:
+            AsyncChannelInfo: Object with ``raw_data`` and ``df`` filled
+        """
+        channel_info = cls(*args, **kwargs)
+        if channel_info._caption_format == "segments":
+            channel_info._caption_table = CaptionTable()
+        video_data = []
+        async for rows in channel_info:
+            video_data.extend(rows)
+        with channel_info.metrics.phase("frame"):
+            channel_info.df = create_df_from_items(
+                video_data,
+                channel_info._columns
+                or channel_info._available
+                or CHANNEL_INFO_COLUMNS,
+                dtype_backend=channel_info._dtype_backend,
+                select=channel_info._columns is not None,
+            )
+            if channel_info._caption_table is not None:
+                channel_info.captions = channel_info._caption_table.to_frame(
+                    channel_info._dtype_backend
+                )
+        return channel_info
+
+    @property
+    def caption_text(self) -> Optional[pd.Series]:
+        """Caption text per videoId, joined from ``captions`` when read."""
+        if self.captions is None:
+            return None
+        return join_captions(self.captions)
+
+    def __aiter__(self) -> AsyncIterator[List[Dict]]:
+        return self.iter_channels()
+
+    async def iter_channels(self) -> AsyncIterator[List[Dict]]:
+        """
+        Iterate over the requested channels.
+
+        A client created by this object is closed when iteration ends.
+
+        Yields:
+            List[Dict]: Enriched rows of one channel, in channel order
+
+        Raises:
+            ValueError: If captions are requested as segments, which only
+                ``create`` collects
+        """
+        tasks = []
+        try:
+            segments = self._caption_format == "segments"
+            if segments and self._caption_table is None:
+                raise ValueError(
+                    'caption_format="segments" cannot be streamed; collect '
+                    "the segments with create"
+                )
+            for batch in chunk_ids(self._channel_ids, MAX_IDS_PER_REQUEST):
+                try:
+                    playlists = await self._resolve_uploads(batch)
+                except (QuotaExceededError, QuotaBudgetExceeded) as e:
+                    logger.warning("Stopping channel fetch early: %s", e)
+                    return
+                tasks = [
+                    asyncio.ensure_future(
+                        self._fetch_channel(
+                            channel_id, playlists.get(channel_id)
+                        )
+                    )
+                    for channel_id in batch
+                ]
+                for channel_id, task in zip(batch, tasks):
+                    try:
+                        rows = await task
+                    except (QuotaExceededError, QuotaBudgetExceeded) as e:
+                        logger.warning("Stopping channel fetch early: %s", e)
+                        return
+                    yield rows
+                    self._record_sync(channel_id, rows)
+        finally:
+            for task in tasks:
+                task.cancel()
+            if self._owns_client:
+                await self._client.close()
+
+    async def _resolve_uploads(self, channel_ids: List[str]) -> Dict[str, str]:
+        """
+        Get the uploads playlists of up to 50 channels with one call.
+
+        Args:
+            channel_ids: YouTube channel IDs.
+
+        Returns:
+            Dict[str, str]: Uploads playlist ID keyed by channel ID.
+        """
+        playlists = {}
+        if self._sync_state is not None:
+            playlists = self._sync_state.playlists(channel_ids)
+        missing = [c for c in channel_ids if c not in playlists]
+        if not missing:
+            return playlists
+
+        try:
+            with self.metrics.phase("paging"):
+                response = await self._client.get(
+                    "channels",
+                    ChannelInfo._channels_params(missing),
+                    self.metrics,
+                )
+        except (QuotaExceededError, QuotaBudgetExceeded):
+            raise
+        except Exception as e:
+            logger.warning("Error resolving uploads playlists: %s", e)
+            return playlists
+        playlists.update(ChannelInfo._parse_channels(response))
+        return playlists
+
+    def _record_sync(self, channel_id: str, rows: List[Dict]) -> None:
+        """
+        Advance the sync mark of a channel past its delivered uploads.
+
+        Uploads missing from the delivered rows are not recorded, and the
+        mark does not move past them, so the next run fetches them again.
+
+        Args:
+            channel_id: YouTube channel ID.
+            rows: Rows delivered for the channel.
+        """
+        response = self.raw_data.get(channel_id)
+        if self._sync_state is None or response is None:
+            return
+        delivered = {row["videoId"] for row in rows}
+        uploads = ChannelInfo._parse_playlist_items(channel_id, response)
+        videos = [v for v in uploads if v["videoId"] in delivered]
+        self._sync_state.update(
+            channel_id,
+            response["playlistId"],
+            videos,
+            complete=len(videos) == len(uploads)
+            and len(response["items"]) < self._max_results,
+            oldest=min((v["publishedAt"] for v in uploads), default=None),
+        )
+
+    async def _fetch_uploads(
+        self, channel_id: str, playlist_id: str
+    ) -> Optional[Dict]:
+        """
+        Page the uploads playlist of one channel up to max_results videos.
+
+        Args:
+            channel_id: YouTube channel ID.
+            playlist_id: Uploads playlist of the channel.
+
+        Returns:
+            Optional[Dict]: Playlist ID and playlistItems items, None on
+            error.
+        """
+        mark = None
+        if self._sync_state is not None:
+            mark = self._sync_state.get(channel_id)
+
+        items = []
+        seen = set()
+        page_token = None
+        try:
+            while len(items) < self._max_results:
+                with self.metrics.phase("paging"):
+                    response = await self._client.get(
+                        "playlistItems",
+                        ChannelInfo._playlist_items_params(
+                            playlist_id,
+                            self._max_results - len(items),
+                            page_token,
+                            self._columns,
+                        ),
+                        self.metrics,
+                    )
+                new_items, caught_up = ChannelInfo._new_items(
+                    response.get("items", []), mark
+                )
+                # Uploads shifting while paging repeat items on later pages
+                for item in new_items:
+                    video_id = item.get("contentDetails", {}).get("videoId")
+                    if video_id not in seen:
+                        seen.add(video_id)
+                        items.append(item)
+                page_token = response.get("nextPageToken")
+                if caught_up or page_token is None:
+                    break
+        except (QuotaExceededError, QuotaBudgetExceeded):
+            raise
+        except Exception as e:
+            logger.warning(
+                "Skipping channel %s after failed request: %s", channel_id, e
+            )
+            return None
+        return {"playlistId": playlist_id, "items": items[:self._max_results]}
+
+    async def _fetch_channel(
+        self, channel_id: str, playlist_id: Optional[str]
+    ) -> List[Dict]:
+        """
+        Get and enrich the videos of one channel.
+
+        Args:
+            channel_id: YouTube channel ID.
+            playlist_id: Uploads playlist of the channel, None if unknown.
+
+        Returns:
+            List[Dict]: Enriched rows of the channel.
+        """
+        if playlist_id is None:
+            logger.warning("Skipping channel %s: not found", channel_id)
+            return []
+        async with self._channel_slots:
+            response = await self._fetch_uploads(channel_id, playlist_id)
+        if response is None:
+            return []
+
+        self.raw_data[channel_id] = response
+        video_data = ChannelInfo._parse_playlist_items(channel_id, response)
+        if not video_data:
+            return video_data
+
+        video_ids = [video_info["videoId"] for video_info in video_data]
+        tasks = [self._statistics(video_ids)]
+        if self._caption_table is not None or self._columns is None or any(
+            name == "caption" for name, _ in self._columns
+        ):
+            tasks.append(
+                self._enricher.add_captions(
+                    video_data, "caption", self._caption_table
+                )
+            )
+        statistics, *_ = await asyncio.gather(*tasks)
+        statistics = statistics or {}
+        for video_info in video_data:
+            video_info.update(statistics.get(video_info["videoId"], {}))
+        return video_data
+
+    async def _statistics(
+        self, video_ids: List[str]
+    ) -> Optional[Dict[str, Dict]]:
+        """
+        Get video statistics, none on quota errors like ChannelInfo.
+
+        Args:
+            video_ids: List of YouTube video IDs.
+
+        Returns:
+            Optional[Dict[str, Dict]]: Video statistics keyed by video ID,
+            None if no count column is selected.
+        """
+        fields = _statistics_fields(self._columns, self._available)
+        if fields == "":
+            return None
+        try:
+            return await self._enricher.statistics(video_ids, fields)
+        except (QuotaExceededError, QuotaBudgetExceeded) as e:
+            logger.warning(
+                "Keeping %d videos without statistics: %s", len(video_ids), e
+            )
+            return {}
+
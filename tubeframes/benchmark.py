@@ -0,0 +1,369 @@
+"""
+Offline benchmarks of standard tubeframes workloads.
+
+Every workload runs against a local MockYouTubeServer, so no developer key
+or quota is needed and results only depend on the machine and the
+configured latency. Run from the command line::
+
+    python -m tubeframes.benchmark --latency 0.02
+
+``--imports`` measures the cold import time of the package instead, each
+import in a fresh interpreter.
+"""
+
+from typing import Callable, Dict, List, NamedTuple, Optional
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from tubeframes.search import Search
+from tubeframes.channel_info import ChannelInfo
+from tubeframes.client import TubeFramesClient
+from tubeframes.retry import RetryPolicy
+from tubeframes.testing.mockserver import MockYouTubeServer, Fixtures
+
+BENCHMARK_KEY = "benchmark"
+CAPTION_WORKERS = 8
+
+# Modules timed by the import benchmark, the dependencies that a bare
+# ``import tubeframes`` must not load, and its cold-start budget in seconds
+IMPORT_TARGETS = (
+    "tubeframes",
+    "tubeframes.cli",
+    "tubeframes.client",
+    "tubeframes.search",
+    "tubeframes.aio",
+)
+HEAVY_MODULES = (
+    "pandas",
+    "pyarrow",
+    "requests",
+    "httplib2",
+    "googleapiclient.discovery",
+    "youtube_transcript_api",
+    "aiohttp",
+)
+IMPORT_BUDGET = 0.05
+
+_IMPORT_PROBE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+seconds = time.perf_counter() - start
+print(json.dumps([seconds, [m for m in sys.argv[2:] if m in sys.modules]]))
+"""
+
+
+class BenchmarkResult(NamedTuple):
+    """Measurements of one workload run."""
+
+    workload: str
+    rows: int
+    requests: int
+    wall_time: float
+    peak_memory: int
+
+    @property
+    def requests_per_second(self) -> float:
+        """Requests served per second of wall time."""
+        if self.wall_time <= 0:
+            return 0.0
+        return self.requests / self.wall_time
+
+
+def _client(server: MockYouTubeServer) -> TubeFramesClient:
+    """Create an uncached client talking to the mock server."""
+    return TubeFramesClient(
+        BENCHMARK_KEY,
+        base_url=server.base_url,
+        retry=RetryPolicy(backoff=0.01, max_backoff=0.1),
+    )
+
+
+def search_500_captions(server: MockYouTubeServer) -> int:
+    """Search 500 videos with statistics and captions."""
+    client = _client(server)
+    try:
+        search = Search(
+            "benchmark",
+            caption=True,
+            maxres=500,
+            accepted_caption_lang=["en"],
+            client=client,
+            caption_workers=CAPTION_WORKERS,
+        )
+        return len(search.df)
+    finally:
+        client.close()
+
+
+def channels_100(server: MockYouTubeServer) -> int:
+    """Pull the latest 50 uploads of 100 channels, with captions."""
+    client = _client(server)
+    channel_ids = ["UC{:022d}".format(n) for n in range(100)]
+    try:
+        info = ChannelInfo(
+            channel_ids,
+            max_results=50,
+            accepted_caption_lang=["en"],
+            client=client,
+            caption_workers=CAPTION_WORKERS,
+        )
+        return len(info.df)
+    finally:
+        client.close()
+
+
+def async_search_500_captions(server: MockYouTubeServer) -> int:
+    """Search 500 videos with captions through AsyncSearch."""
+    from tubeframes.aio import AsyncSearch, AsyncTubeFramesClient
+
+    async def run() -> int:
+        async with AsyncTubeFramesClient(
+            BENCHMARK_KEY,
+            base_url=server.base_url,
+            retry=RetryPolicy(backoff=0.01, max_backoff=0.1),
+        ) as client:
+            search = await AsyncSearch.create(
+                "benchmark",
+                caption=True,
+                maxres=500,
+                accepted_caption_lang=["en"],
+                client=client,
+                caption_workers=CAPTION_WORKERS,
+            )
+            return len(search.df)
+
+    return asyncio.run(run())
+
+
+class ImportResult(NamedTuple):
+    """Cold import measurement of one module."""
+
+    module: str
+    seconds: float
+    heavy_modules: List[str]
+
+
+def measure_import(module: str, repeat: int = 5) -> ImportResult:
+    """
+    Time the import of a module in fresh interpreters.
+
+    Args:
+        module: Module name, e.g. "tubeframes"
+        repeat: Number of interpreters started; the fastest run is kept
+
+    Returns:
+        ImportResult: Import time in seconds and the heavy dependencies the
+        import loaded
+    """
+    command = [sys.executable, "-c", _IMPORT_PROBE, module]
+    runs = []
+    for _ in range(max(1, repeat)):
+        output = subprocess.run(
+            command + list(HEAVY_MODULES),
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        ).stdout
+        runs.append(json.loads(output))
+    seconds = min(run[0] for run in runs)
+    return ImportResult(module, seconds, runs[0][1])
+
+
+def format_import_results(results: List[ImportResult]) -> str:
+    """
+    Format import measurements as a text table.
+
+    Args:
+        results: Results of measure_import
+
+    Returns:
+        str: One line per module below a header
+    """
+    lines = ["{:<22}{:>10}  {}".format("module", "ms", "heavy modules")]
+    for result in results:
+        lines.append(
+            "{:<22}{:>10.1f}  {}".format(
+                result.module,
+                result.seconds * 1000,
+                ", ".join(result.heavy_modules) or "-",
+            )
+        )
+    return "\n".join(lines)
+
+
+WORKLOADS: Dict[str, Callable[[MockYouTubeServer], int]] = {
+    "search-500-captions": search_500_captions,
+    "channels-100": channels_100,
+    "async-search-500-captions": async_search_500_captions,
+}
+
+
+def run_workload(
+    name: str, server: MockYouTubeServer, trace_memory: bool = True
+) -> BenchmarkResult:
+    """
+    Run one workload against a running mock server.
+
+    Args:
+        name: Key of the workload in WORKLOADS
+        server: Running mock server
+        trace_memory: Whether to measure the peak memory with tracemalloc,
+            which slows Python code down
+
+    Returns:
+        BenchmarkResult: Rows returned, requests served, wall time in
+        seconds and peak traced memory in bytes
+    """
+    workload = WORKLOADS[name]
+    server.reset()
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        rows = workload(server)
+        wall_time = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return BenchmarkResult(name, rows, server.total_requests, wall_time, peak)
+
+
+def run_benchmarks(
+    workloads: Optional[List[str]] = None,
+    latency: float = 0.0,
+    error_rate: float = 0.0,
+    repeat: int = 1,
+    trace_memory: bool = True,
+) -> List[BenchmarkResult]:
+    """
+    Run workloads against a fresh mock server.
+
+    Args:
+        workloads: Names of the workloads, all if None
+        latency: Seconds added by the server to every response
+        error_rate: Share of API and transcript requests answered with
+            HTTP 503
+        repeat: Number of runs of each workload
+        trace_memory: Whether to measure the peak memory
+
+    Returns:
+        List[BenchmarkResult]: One result per run
+    """
+    if workloads is None:
+        workloads = list(WORKLOADS)
+    results = []
+    server = MockYouTubeServer(Fixtures(), latency, error_rate)
+    with server, server.patch_transcripts():
+        for name in workloads:
+            for _ in range(repeat):
+                results.append(run_workload(name, server, trace_memory))
+    return results
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    """
+    Format benchmark results as a text table.
+
+    Args:
+        results: Results of run_benchmarks
+
+    Returns:
+        str: One line per run below a header
+    """
+    lines = [
+        "{:<28}{:>7}{:>10}{:>10}{:>10}{:>12}".format(
+            "workload", "rows", "requests", "wall s", "req/s", "peak MiB"
+        )
+    ]
+    for result in results:
+        lines.append(
+            "{:<28}{:>7}{:>10}{:>10.2f}{:>10.1f}{:>12.1f}".format(
+                result.workload,
+                result.rows,
+                result.requests,
+                result.wall_time,
+                result.requests_per_second,
+                result.peak_memory / 2 ** 20,
+            )
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "workloads",
+        nargs="*",
+        help="workloads to run, all by default: " + ", ".join(WORKLOADS),
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="seconds added to every response",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="share of API requests answered with HTTP 503",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="runs of each workload"
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip tracemalloc, which slows Python code down",
+    )
+    parser.add_argument(
+        "--imports",
+        action="store_true",
+        help="measure cold import times instead of running workloads",
+    )
+    parser.add_argument(
+        "--import-budget",
+        type=float,
+        default=IMPORT_BUDGET,
+        help="seconds allowed for a bare 'import tubeframes'",
+    )
+    args = parser.parse_args(argv)
+    if args.imports:
+        results = [
+            measure_import(module, max(args.repeat, 5))
+            for module in IMPORT_TARGETS
+        ]
+        print(format_import_results(results))
+        package = results[0]
+        if package.heavy_modules or package.seconds > args.import_budget:
+            parser.exit(
+                1,
+                "import tubeframes exceeds its budget of {:.0f} ms\n".format(
+                    args.import_budget * 1000
+                ),
+            )
+        return
+
+    unknown = [name for name in args.workloads if name not in WORKLOADS]
+    if unknown:
+        parser.error("unknown workloads: " + ", ".join(unknown))
+    results = run_benchmarks(
+        args.workloads or None,
+        args.latency,
+        args.error_rate,
+        args.repeat,
+        not args.no_memory,
+    )
+    print(format_results(results))
+
+
+if __name__ == "__main__":
+    main()
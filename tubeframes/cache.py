@@ -0,0 +1,401 @@
+from typing import Dict, Any, List, Optional, NamedTuple
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import urlencode
+
+from tubeframes.config.constants import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_RESPONSE_TTL,
+    DEFAULT_RESPONSE_CACHE_SIZE,
+    DEFAULT_TRANSCRIPT_TTL,
+    DEFAULT_TRANSCRIPT_CACHE_SIZE,
+)
+
+
+class CachedResponse(NamedTuple):
+    """A response read from the cache."""
+
+    data: Dict[str, Any]
+    etag: Optional[str]
+    fresh: bool
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of YouTube Data API responses.
+
+    Responses are keyed by endpoint and normalized query parameters. A
+    response younger than the endpoint's TTL is served without a request;
+    an older one is revalidated with its ETag through ``If-None-Match``.
+    When the stored bodies exceed ``max_bytes``, the least recently used
+    responses are evicted.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: Optional[Dict[str, float]] = None,
+        max_bytes: int = DEFAULT_RESPONSE_CACHE_SIZE,
+    ) -> None:
+        """
+        Initialize the response cache.
+
+        Args:
+            path: SQLite file, by default inside the tubeframes cache dir
+            ttl: Seconds a response stays fresh, per endpoint. Endpoints
+                missing from the mapping are not cached.
+            max_bytes: Maximum total size of the stored bodies
+        """
+        if path is None:
+            os.makedirs(DEFAULT_CACHE_DIR, exist_ok=True)
+            path = os.path.join(DEFAULT_CACHE_DIR, "responses.sqlite")
+        self._ttl = dict(DEFAULT_RESPONSE_TTL)
+        if ttl is not None:
+            self._ttl.update(ttl)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, etag TEXT, body BLOB NOT NULL, "
+                "size INTEGER NOT NULL, stored REAL NOT NULL, "
+                "accessed REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed "
+                "ON responses (accessed)"
+            )
+
+    @staticmethod
+    def make_key(resource: str, params: Dict[str, Any]) -> str:
+        """
+        Build the cache key of a request.
+
+        Args:
+            resource: API resource name
+            params: Query parameters, without the developer key
+
+        Returns:
+            str: Endpoint followed by the sorted, non-empty parameters
+        """
+        query = sorted(
+            (k, str(v))
+            for k, v in params.items()
+            if v is not None and k != "key"
+        )
+        return resource + "?" + urlencode(query)
+
+    def caches(self, resource: str) -> bool:
+        """
+        Check whether responses of an endpoint are cached.
+
+        Args:
+            resource: API resource name
+
+        Returns:
+            bool: True if the endpoint has a TTL
+        """
+        return resource in self._ttl
+
+    def get(
+        self, resource: str, params: Dict[str, Any]
+    ) -> Optional[CachedResponse]:
+        """
+        Read a cached response.
+
+        Args:
+            resource: API resource name
+            params: Query parameters, without the developer key
+
+        Returns:
+            Optional[CachedResponse]: Cached response or None on a miss
+        """
+        if not self.caches(resource):
+            return None
+        key = self.make_key(resource, params)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, body, stored FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE responses SET accessed = ? WHERE key = ?",
+                    (now, key),
+                )
+        etag, body, stored = row
+        data = json.loads(zlib.decompress(body).decode("utf-8"))
+        return CachedResponse(data, etag, now - stored < self._ttl[resource])
+
+    def set(
+        self,
+        resource: str,
+        params: Dict[str, Any],
+        data: Dict[str, Any],
+        etag: Optional[str] = None,
+    ) -> None:
+        """
+        Store a response.
+
+        Args:
+            resource: API resource name
+            params: Query parameters, without the developer key
+            data: Decoded JSON response
+            etag: ETag of the response, read from the body if None
+        """
+        if not self.caches(resource):
+            return
+        if etag is None:
+            etag = data.get("etag")
+        body = zlib.compress(json.dumps(data).encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, etag, body, size, stored, accessed) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        self.make_key(resource, params),
+                        etag,
+                        body,
+                        len(body),
+                        now,
+                        now,
+                    ),
+                )
+                self._evict()
+
+    def touch(self, resource: str, params: Dict[str, Any]) -> None:
+        """
+        Mark a cached response as fresh after a successful revalidation.
+
+        Args:
+            resource: API resource name
+            params: Query parameters, without the developer key
+        """
+        now = time.time()
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE responses SET stored = ?, accessed = ? "
+                    "WHERE key = ?",
+                    (now, now, self.make_key(resource, params)),
+                )
+
+    def _evict(self) -> None:
+        """Delete least recently used responses above the size limit."""
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self._max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self._max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def clear(self) -> None:
+        """Delete every cached response."""
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class CachedTranscript(NamedTuple):
+    """A transcript lookup read from the cache."""
+
+    status: str
+    segments: Optional[List[Dict[str, Any]]]
+
+
+class TranscriptCache:
+    """
+    SQLite-backed store of transcript segments.
+
+    Lookups are keyed by (video_id, language) and record one of four
+    outcomes, each with its own expiry: ``"found"`` with the transcript
+    segments, ``"missing"`` when the video has no transcript in that
+    language, ``"disabled"`` when the video has transcripts disabled and
+    ``"failed"`` when the lookup failed for another reason (the last two
+    stored under the language ``"*"``). Segments are stored compressed and
+    content-addressed, so identical transcripts are kept once. When the
+    stored segments exceed ``max_bytes``, the least recently used ones are
+    evicted together with the lookups pointing to them.
+    """
+
+    FOUND = "found"
+    MISSING = "missing"
+    DISABLED = "disabled"
+    FAILED = "failed"
+    ANY_LANGUAGE = "*"
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: Optional[Dict[str, float]] = None,
+        max_bytes: int = DEFAULT_TRANSCRIPT_CACHE_SIZE,
+    ) -> None:
+        """
+        Initialize the transcript cache.
+
+        Args:
+            path: SQLite file, by default inside the tubeframes cache dir
+            ttl: Seconds a lookup stays valid, per outcome ("found",
+                "missing", "disabled" and "failed")
+            max_bytes: Maximum total size of the stored segments
+        """
+        if path is None:
+            os.makedirs(DEFAULT_CACHE_DIR, exist_ok=True)
+            path = os.path.join(DEFAULT_CACHE_DIR, "transcripts.sqlite")
+        self._ttl = dict(DEFAULT_TRANSCRIPT_TTL)
+        if ttl is not None:
+            self._ttl.update(ttl)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS lookups ("
+                "video_id TEXT NOT NULL, lang TEXT NOT NULL, "
+                "status TEXT NOT NULL, digest TEXT, expires REAL NOT NULL, "
+                "PRIMARY KEY (video_id, lang))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS segments ("
+                "digest TEXT PRIMARY KEY, data BLOB NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+
+    def get(self, video_id: str, lang: str) -> Optional[CachedTranscript]:
+        """
+        Read a transcript lookup.
+
+        Args:
+            video_id: YouTube video ID
+            lang: Language code, or "*" for the disabled marker
+
+        Returns:
+            Optional[CachedTranscript]: Cached lookup, None if unknown or
+            expired
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT l.status, s.data FROM lookups l "
+                "LEFT JOIN segments s ON s.digest = l.digest "
+                "WHERE l.video_id = ? AND l.lang = ? AND l.expires > ?",
+                (video_id, lang, now),
+            ).fetchone()
+            if row is None:
+                return None
+            status, data = row
+            if status == self.FOUND:
+                if data is None:
+                    return None
+                with self._conn:
+                    self._conn.execute(
+                        "UPDATE segments SET accessed = ? WHERE digest = ("
+                        "SELECT digest FROM lookups "
+                        "WHERE video_id = ? AND lang = ?)",
+                        (now, video_id, lang),
+                    )
+        segments = None
+        if data is not None:
+            segments = json.loads(zlib.decompress(data).decode("utf-8"))
+        return CachedTranscript(status, segments)
+
+    def set(
+        self,
+        video_id: str,
+        lang: str,
+        status: str,
+        segments: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Store a transcript lookup.
+
+        Args:
+            video_id: YouTube video ID
+            lang: Language code, or "*" for the disabled and failed
+                markers
+            status: "found", "missing", "disabled" or "failed"
+            segments: Transcript segments when status is "found"
+        """
+        now = time.time()
+        digest = None
+        data = None
+        if segments is not None:
+            raw = json.dumps(segments, sort_keys=True).encode("utf-8")
+            digest = hashlib.sha256(raw).hexdigest()
+            data = zlib.compress(raw)
+        with self._lock:
+            with self._conn:
+                if data is not None:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO segments "
+                        "(digest, data, size, accessed) VALUES (?, ?, ?, ?)",
+                        (digest, data, len(data), now),
+                    )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO lookups "
+                    "(video_id, lang, status, digest, expires) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (video_id, lang, status, digest, now + self._ttl[status]),
+                )
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used segments above the size limit."""
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM segments"
+        ).fetchone()
+        if total <= self._max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT digest, size FROM segments ORDER BY accessed"
+        ).fetchall()
+        evicted = []
+        for digest, size in rows:
+            if total <= self._max_bytes:
+                break
+            evicted.append((digest,))
+            total -= size
+        self._conn.executemany(
+            "DELETE FROM lookups WHERE digest = ?", evicted
+        )
+        self._conn.executemany(
+            "DELETE FROM segments WHERE digest = ?", evicted
+        )
+
+    def clear(self) -> None:
+        """Delete every cached transcript lookup."""
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM lookups")
+                self._conn.execute("DELETE FROM segments")
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,13 +1,44 @@
-from typing import List, Union, Dict, Optional
+from typing import List, Union, Dict, Iterator, Optional, Set, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import pandas as pd
 
+from tubeframes.cache import TranscriptCache
+from tubeframes.client import TubeFramesClient, get_default_client
+from tubeframes.config.constants import (
+    CAPTION_FORMATS,
+    CHANNEL_INFO_COLUMNS,
+    CONTENT_DETAILS_COLUMNS,
+    DEFAULT_CHANNEL_WORKERS,
+    DEFAULT_THUMBNAIL_WORKERS,
+    MAX_IDS_PER_REQUEST,
+)
+from tubeframes.fields import (
+    playlist_items_request,
+    select_columns,
+    statistics_fields,
+)
+from tubeframes.metrics import Metrics, RequestEvent
+from tubeframes.quota import QuotaBudgetExceeded, estimate_quota
+from tubeframes.retry import QuotaExceededError
+from tubeframes.sink import ParquetSink
+from tubeframes.state import ChannelMark, ChannelSyncState
+from tubeframes.thumbnails import ThumbnailStore
 from tubeframes.utils import (
     get_dev_key,
-    create_tubeframes_client,
-    get_video_captions,
+    chunk_ids,
+    get_videos_captions,
+    get_videos_caption_segments,
+    get_videos_statistics,
     process_thumbnails,
     create_df_from_items,
+    CaptionTable,
+    join_captions,
 )
+from tubeframes.where import Condition, Where
+
+logger = logging.getLogger(__name__)
 
 
 class ChannelInfo:
@@ -19,6 +50,19 @@ class ChannelInfo:
         max_results: int = 10,
         accepted_caption_lang: Optional[List[str]] = None,
         developer_key: Optional[str] = None,
+        client: Optional[TubeFramesClient] = None,
+        caption_workers: int = 1,
+        caption_rate_limit: Optional[float] = None,
+        transcript_cache: Optional[TranscriptCache] = None,
+        lazy: bool = False,
+        channel_workers: int = DEFAULT_CHANNEL_WORKERS,
+        sync_state: Optional[ChannelSyncState] = None,
+        dtype_backend: str = "numpy_nullable",
+        caption_format: str = "joined",
+        columns: Optional[List[str]] = None,
+        where: Optional[List[Condition]] = None,
+        keep_raw: bool = True,
+        content_details: bool = False,
     ) -> None:
         """
         Initialize the class to get information about videos from channels.
@@ -28,97 +72,891 @@ class ChannelInfo:
             max_results: Maximum number of results per channel.
             accepted_caption_lang: List of accepted languages for captions.
             developer_key: YouTube API developer key.
+            client: Shared API client, reused across instances if None.
+            caption_workers: Number of captions fetched concurrently.
+            caption_rate_limit: Maximum caption fetches started per second.
+            transcript_cache: Local store of previously fetched transcripts.
+            lazy: Whether to wait for the first access to ``raw_data`` or
+                ``df`` before fetching. Use it together with
+                ``iter_channels`` to stream results without building a frame.
+            channel_workers: Number of channels crawled concurrently.
+            sync_state: High-water marks of previous runs. When given, only
+                videos uploaded since the last sync of each channel are
+                fetched, and the marks advance once rows are delivered.
+            dtype_backend: "numpy_nullable" for pandas nullable dtypes or
+                "pyarrow" for an Arrow-backed DataFrame.
+            caption_format: "joined" for one caption string per video in
+                ``df``, or "segments" to keep timed segments in the separate
+                ``captions`` table.
+            columns: Output columns to keep, all if None. Only the API
+                fields behind them are requested; captions are fetched only
+                with the "caption" column (or ``caption_format="segments"``)
+                and statistics only with a count column. channelId and
+                videoId are always kept.
+            where: Conditions every video meets, as ``(column, operator,
+                value)`` or ``(column, callable)`` tuples, as in Search.
+                Playlist item conditions run before statistics are
+                requested, and count conditions before captions are
+                fetched.
+            keep_raw: Whether ``raw_data`` keeps the full playlist items.
+                If False, each channel's items are reduced to their
+                contentDetails once parsed, which saves memory in
+                long-running processes holding many instances.
+            content_details: Whether videos also get the duration in
+                seconds, definition and hasCaption columns, requested in
+                the same videos call as the counts.
+
+        Raises:
+            ValueError: If caption_format is not supported, a column is
+                unknown or a condition is invalid.
         """
+        if caption_format not in CAPTION_FORMATS:
+            raise ValueError(
+                "caption_format must be one of {}".format(CAPTION_FORMATS)
+            )
         if accepted_caption_lang is not None:
             self._accepted_caption_lang = accepted_caption_lang
         else:
             self._accepted_caption_lang = ["pt", "en"]
-        self._developer_key = get_dev_key(developer_key)
+        self._caption_workers = caption_workers
+        self._caption_rate_limit = caption_rate_limit
+        self._transcript_cache = transcript_cache
+        if client is None:
+            client = get_default_client(get_dev_key(developer_key))
+        self._client = client
+        self._developer_key = client.developer_key
 
         if isinstance(channel_ids, str):
             channel_ids = [channel_ids]
 
         self._channel_ids = channel_ids
         self._max_results = max_results
-        self._youtube = create_tubeframes_client(self._developer_key)
+        self._channel_workers = channel_workers
+        self._sync_state = sync_state
+        self._dtype_backend = dtype_backend
+        self._caption_format = caption_format
+        self._content_details = content_details
+        available = self._available_columns()
+        self._columns = None
+        if columns is not None:
+            self._columns = select_columns(
+                columns, available, ["channelId", "videoId"]
+            )
+        self._where = Where(where, available)
+        if self._where.needs("captions") and caption_format != "joined":
+            raise ValueError(
+                'where conditions on caption need caption_format="joined"'
+            )
+        # Columns whose fields are requested: the output columns and the
+        # ones read by the where conditions
+        self._fetch_columns = self._columns
+        if self._columns is not None and self._where:
+            self._fetch_columns = select_columns(
+                [name for name, _ in self._columns] + self._where.columns,
+                available,
+            )
+
+        self._keep_raw = keep_raw
+        self._raw_data = None
+        self._df = None
+        self._captions = None
+        self._caption_text = None
+        # Videos whose statistics could not be fetched, kept from the marks
+        # when a count condition drops them
+        self._missing_statistics = set()
+        self.metrics = Metrics()
+        if not lazy:
+            self._load()
+
+    @property
+    def raw_data(self) -> Dict:
+        """Data obtained from the API, fetched on first access if lazy."""
+        if self._raw_data is None:
+            self._load()
+        return self._raw_data
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """DataFrame with video information, built on first access if lazy."""
+        if self._raw_data is None:
+            self._load()
+        return self._df
+
+    @property
+    def captions(self) -> Optional[pd.DataFrame]:
+        """
+        Caption segments with the columns videoId, lang, start, duration
+        and text, one row per segment. None unless
+        ``caption_format="segments"``.
+        """
+        if self._raw_data is None:
+            self._load()
+        return self._captions
+
+    @property
+    def caption_text(self) -> Optional[pd.Series]:
+        """Caption text per videoId, joined from ``captions`` when read."""
+        if self._caption_text is None and self.captions is not None:
+            self._caption_text = join_captions(self.captions)
+        return self._caption_text
+
+    def estimate_cost(self) -> int:
+        """
+        Estimate the quota units of the pull without making any request.
+
+        The estimate assumes every channel returns max_results videos.
+
+        Returns:
+            int: Quota units for channels, playlistItems and statistics
+            calls.
+        """
+        channels = len(self._channel_ids)
+        videos = channels * self._max_results
+        calls = {
+            "channels": -(-channels // MAX_IDS_PER_REQUEST),
+            "playlistItems": channels
+            * max(1, -(-self._max_results // MAX_IDS_PER_REQUEST)),
+        }
+        if self._statistics_fields() != "":
+            calls["videos"] = -(-videos // MAX_IDS_PER_REQUEST)
+        scheduler = self._client.scheduler
+        if scheduler is not None:
+            return scheduler.estimate(calls)
+        return estimate_quota(calls)
+
+    @property
+    def columns(self) -> List[Tuple[str, str]]:
+        """Stable output columns and their kinds, used by sinks."""
+        if self._columns is not None:
+            return self._columns
+        return self._available_columns()
+
+    def _available_columns(self) -> List[Tuple[str, str]]:
+        """Every output column and its kind."""
+        if self._content_details:
+            return CHANNEL_INFO_COLUMNS + CONTENT_DETAILS_COLUMNS
+        return CHANNEL_INFO_COLUMNS
+
+    def _fetched(self, name: str) -> bool:
+        """Whether the fields of a column are requested."""
+        return self._fetch_columns is None or any(
+            column == name for column, _ in self._fetch_columns
+        )
+
+    def _statistics_fields(self) -> Optional[str]:
+        """
+        Get the partial-response selector of the statistics calls.
+
+        Returns:
+            Optional[str]: None for full statistics, or "" if no count
+            column is selected and no call is needed.
+        """
+        columns = self._fetch_columns
+        if columns is None:
+            if not self._content_details:
+                return None
+            columns = self._available_columns()
+        fields = statistics_fields([name for name, _ in columns])
+        return "" if fields is None else fields
+
+    def _emit(self, event: RequestEvent) -> None:
+        """
+        Report a request to the client hooks and to ``metrics``.
+
+        Events reach ``metrics`` per call rather than through a hook
+        registered on the client, so instances sharing a client only
+        record their own requests.
+        """
+        self._client.emit(event, self.metrics)
+
+    def _load(self) -> None:
+        """Fetch every channel and build the DataFrame."""
+        self._raw_data, video_data = self._fetch_channel_videos()
+        caption_table = None
+        if self._caption_format == "segments":
+            caption_table = CaptionTable()
+        video_data = self._enrich(video_data, caption_table)
+        self._df = self._build_dataframe(video_data)
+        if caption_table is not None:
+            with self.metrics.phase("frame"):
+                self._captions = caption_table.to_frame(self._dtype_backend)
+        delivered = defaultdict(set)
+        for video_info in video_data:
+            delivered[video_info["channelId"]].add(video_info["videoId"])
+        for channel_id, response in self._raw_data.items():
+            self._record_sync(channel_id, response, delivered[channel_id])
+
+    def iter_channels(self) -> Iterator[List[Dict]]:
+        """
+        Fetch channel by channel, yielding enriched rows for each one.
+
+        Channels are requested only as iteration proceeds and are not kept.
+        Each call fetches again; ``raw_data`` and ``df`` are not affected.
+        With a sync state, the mark of a channel advances when the next
+        channel is requested.
+
+        Yields:
+            List[Dict]: Rows of one channel, with captions and statistics.
+
+        Raises:
+            ValueError: If captions are requested as segments, which only
+                ``captions`` holds.
+        """
+        for _, video_data in self.iter_channel_rows():
+            yield video_data
+
+    def iter_channel_rows(self) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        Fetch channel by channel, like ``iter_channels``, with channel IDs.
+
+        Channels that are not found or fail are skipped, so the IDs tell
+        which requested channels the rows belong to.
+
+        Yields:
+            Tuple[str, List[Dict]]: Channel ID and the rows of the channel.
+
+        Raises:
+            ValueError: If captions are requested as segments, which only
+                ``captions`` holds.
+        """
+        for channel_id, response, video_data in self._crawl_channel_rows():
+            yield channel_id, video_data
+            self._record_sync(
+                channel_id,
+                response,
+                {video_info["videoId"] for video_info in video_data},
+            )
+
+    def _crawl_channel_rows(self) -> Iterator[Tuple[str, Dict, List[Dict]]]:
+        """
+        Crawl the channels and enrich their rows, in channel order.
+
+        Yields:
+            Tuple[str, Dict, List[Dict]]: Channel ID, its uploads and its
+            enriched rows.
+        """
+        self._check_streamable()
+        crawl = self._crawl_channels()
+        while True:
+            try:
+                with self.metrics.phase("paging"):
+                    channel_id, response = next(crawl)
+            except StopIteration:
+                return
+            except (QuotaExceededError, QuotaBudgetExceeded) as e:
+                logger.warning("Stopping channel fetch early: %s", e)
+                return
+            if response is None:
+                continue
+            video_data = self._parse_playlist_items(channel_id, response)
+            yield channel_id, response, self._enrich(video_data)
+
+    def _record_sync(
+        self, channel_id: str, response: Dict, delivered: Set[str]
+    ) -> None:
+        """
+        Advance the sync mark of a channel past the delivered uploads.
 
-        self.raw_data = self._fetch_channel_videos()
-        self.df = self._build_dataframe()
+        Uploads that a count condition dropped because their statistics
+        could not be fetched are not recorded, and the mark does not move
+        past them, so the next run fetches them again. Uploads rejected by
+        the conditions themselves are recorded as known.
 
-    def _fetch_channel_videos(self) -> Dict:
+        Args:
+            channel_id: YouTube channel ID.
+            response: Uploads of the channel returned by this run.
+            delivered: IDs of the videos delivered for the channel.
+        """
+        if self._sync_state is None:
+            return
+        uploads = self._parse_playlist_items(channel_id, response)
+        lost = {
+            video_info["videoId"]
+            for video_info in uploads
+            if video_info["videoId"] not in delivered
+            and video_info["videoId"] in self._missing_statistics
+        }
+        self._sync_state.update(
+            channel_id,
+            response["playlistId"],
+            [v for v in uploads if v["videoId"] not in lost],
+            complete=not lost and len(response["items"]) < self._max_results,
+            oldest=min((v["publishedAt"] for v in uploads), default=None),
+        )
+
+    def write_to(self, sink) -> int:
+        """
+        Stream enriched rows into a sink, channel by channel.
+
+        Only objects created with ``lazy=True`` whose channels were not
+        loaded yet can be streamed; write ``df`` otherwise, rather than
+        fetching the channels a second time.
+
+        Args:
+            sink: Object with a ``write_rows(rows)`` method, such as a
+                ParquetSink or ArrowSink built with ``self.columns``.
+
+        Returns:
+            int: Number of rows written.
+
+        Raises:
+            ValueError: If the channels are already loaded.
+        """
+        self._check_unloaded()
+        rows_written = 0
+        for video_data in self.iter_channels():
+            sink.write_rows(video_data)
+            rows_written += len(video_data)
+        return rows_written
+
+    def to_parquet(self, path: str, **kwargs) -> str:
+        """
+        Stream enriched rows into a Parquet file or dataset directory.
+
+        With a sync state and a dataset directory, each run appends a part
+        file holding only the new uploads. Marks advance once the file is
+        closed.
+
+        Like ``write_to``, this requires a lazy object not loaded yet.
+
+        Args:
+            path: Output file, or a directory to add a new part file to.
+            **kwargs: Extra arguments for ParquetSink.
+
+        Returns:
+            str: Path of the written file.
+
+        Raises:
+            ValueError: If the channels are already loaded.
+        """
+        self._check_unloaded()
+        self._check_streamable()
+        synced = []
+        with ParquetSink(path, self.columns, **kwargs) as sink:
+            for channel_id, response, video_data in self._crawl_channel_rows():
+                sink.write_rows(video_data)
+                delivered = {v["videoId"] for v in video_data}
+                synced.append((channel_id, response, delivered))
+        for channel_id, response, delivered in synced:
+            self._record_sync(channel_id, response, delivered)
+        return sink.path
+
+    def _check_streamable(self) -> None:
+        """Refuse to stream caption segments, which rows cannot carry."""
+        if self._caption_format == "segments":
+            raise ValueError(
+                'caption_format="segments" cannot be streamed; read the '
+                "segments from captions, or stream joined captions"
+            )
+
+    def _check_unloaded(self) -> None:
+        """Refuse to stream channels that are already held in memory."""
+        if self._raw_data is not None:
+            raise ValueError(
+                "Channels are already loaded; write df, or create the "
+                "ChannelInfo with lazy=True to stream them"
+            )
+
+    def download_thumbnails(
+        self,
+        store: Optional[ThumbnailStore] = None,
+        workers: int = DEFAULT_THUMBNAIL_WORKERS,
+    ) -> pd.DataFrame:
+        """
+        Download the thumbnails of the channel videos.
+
+        Thumbnails are fetched concurrently over the pooled session of the
+        client, in the best available resolution, and recorded in
+        ``metrics``. Videos already in the store are skipped.
+
+        Args:
+            store: Content-addressed thumbnail store, the default store in
+                the tubeframes cache dir if None.
+            workers: Number of thumbnails downloaded concurrently.
+
+        Returns:
+            pd.DataFrame: One row per video with the columns videoId,
+            status, tier, sha256, size and path.
+        """
+        video_ids = list(self.df["videoId"]) if len(self.df) else []
+        own_store = store is None
+        if own_store:
+            store = ThumbnailStore()
+        try:
+            return store.download(
+                video_ids,
+                self._client.session,
+                workers,
+                hook=self._emit,
+            )
+        finally:
+            if own_store:
+                store.close()
+
+    def _fetch_channel_videos(self) -> Tuple[Dict, List[Dict]]:
         """
         Get videos from specified channels.
 
+        Each channel's uploads are parsed as they arrive, and compacted
+        right away unless ``keep_raw`` is set.
+
         Returns:
-            Dict: Dictionary with data obtained from the API.
+            Tuple[Dict, List[Dict]]: Data obtained from the API by channel,
+            and the video rows parsed from it.
         """
         all_data = {}
+        video_data = []
 
-        for channel_id in self._channel_ids:
-            try:
-                response = (
-                    self._youtube.activities()
-                    .list(
-                        part="snippet,contentDetails",
-                        channelId=channel_id,
-                        maxResults=self._max_results,
+        try:
+            with self.metrics.phase("paging"):
+                for channel_id, response in self._crawl_channels():
+                    if response is None:
+                        continue
+                    video_data.extend(
+                        self._parse_playlist_items(channel_id, response)
                     )
-                    .execute()
+                    if not self._keep_raw:
+                        response = self._compact_response(response)
+                    all_data[channel_id] = response
+        except (QuotaExceededError, QuotaBudgetExceeded) as e:
+            # Later channels would fail the same way
+            logger.warning("Stopping channel fetch early: %s", e)
+
+        return all_data, video_data
+
+    @staticmethod
+    def _compact_response(response: Dict) -> Dict:
+        """
+        Keep only what sync marks need of a channel's uploads.
+
+        Args:
+            response: Uploads of the channel.
+
+        Returns:
+            Dict: Uploads playlist and the contentDetails of its items.
+        """
+        return {
+            "playlistId": response["playlistId"],
+            "items": [
+                {"contentDetails": item["contentDetails"]}
+                for item in response["items"]
+                if "contentDetails" in item
+            ],
+        }
+
+    def _crawl_channels(self) -> Iterator[Tuple[str, Optional[Dict]]]:
+        """
+        Fetch the uploads of every channel, in channel order.
+
+        Uploads playlists are resolved for up to 50 channels per
+        channels.list call, and the playlists of each batch are paged by
+        ``channel_workers`` concurrent threads.
+
+        Yields:
+            Tuple[str, Optional[Dict]]: Channel ID and its uploads, None on
+            error.
+
+        Raises:
+            QuotaExceededError: If the API daily quota is exhausted.
+            QuotaBudgetExceeded: If the quota scheduler refuses a call.
+        """
+        with ThreadPoolExecutor(max_workers=self._channel_workers) as executor:
+            for batch in chunk_ids(self._channel_ids, MAX_IDS_PER_REQUEST):
+                playlists = self._resolve_uploads(batch)
+                responses = executor.map(
+                    lambda channel_id: self._fetch_channel(
+                        channel_id, playlists.get(channel_id)
+                    ),
+                    batch,
                 )
+                for channel_id, response in zip(batch, responses):
+                    yield channel_id, response
+
+    def _resolve_uploads(self, channel_ids: List[str]) -> Dict[str, str]:
+        """
+        Get the uploads playlists of up to 50 channels with one call.
+
+        Args:
+            channel_ids: YouTube channel IDs.
+
+        Returns:
+            Dict[str, str]: Uploads playlist ID keyed by channel ID. Unknown
+            channels are missing.
+
+        Raises:
+            QuotaExceededError: If the API daily quota is exhausted.
+            QuotaBudgetExceeded: If the quota scheduler refuses the call.
+        """
+        playlists = {}
+        if self._sync_state is not None:
+            playlists = self._sync_state.playlists(channel_ids)
+        missing = [c for c in channel_ids if c not in playlists]
+        if not missing:
+            return playlists
+
+        try:
+            response = self._client.get(
+                "channels", self._channels_params(missing), self.metrics
+            )
+        except (QuotaExceededError, QuotaBudgetExceeded):
+            raise
+        except Exception as e:
+            logger.warning("Error resolving uploads playlists: %s", e)
+            return playlists
+        playlists.update(self._parse_channels(response))
+        return playlists
 
-                all_data[channel_id] = response
-            except Exception as e:
-                print(
-                    f"Error fetching videos for channel {channel_id}: ",
-                    str(e),
+    def _fetch_channel(
+        self, channel_id: str, playlist_id: Optional[str]
+    ) -> Optional[Dict]:
+        """
+        Get the latest uploads of one channel.
+
+        The uploads playlist is paged until ``max_results`` videos are
+        collected, the playlist ends or, with a sync state, a video seen by
+        a previous sync is reached.
+
+        Args:
+            channel_id: YouTube channel ID.
+            playlist_id: Uploads playlist of the channel, None if unknown.
+
+        Returns:
+            Optional[Dict]: Playlist ID and playlistItems items, None on
+            error.
+
+        Raises:
+            QuotaExceededError: If the API daily quota is exhausted.
+            QuotaBudgetExceeded: If the quota scheduler refuses a call.
+        """
+        if playlist_id is None:
+            logger.warning("Skipping channel %s: not found", channel_id)
+            return None
+
+        mark = None
+        if self._sync_state is not None:
+            mark = self._sync_state.get(channel_id)
+
+        items = []
+        seen = set()
+        page_token = None
+        try:
+            while len(items) < self._max_results:
+                response = self._client.get(
+                    "playlistItems",
+                    self._playlist_items_params(
+                        playlist_id,
+                        self._max_results - len(items),
+                        page_token,
+                        self._fetch_columns,
+                    ),
+                    self.metrics,
+                )
+                new_items, caught_up = self._new_items(
+                    response.get("items", []), mark
                 )
+                # Uploads shifting while paging repeat items on later pages
+                for item in new_items:
+                    video_id = item.get("contentDetails", {}).get("videoId")
+                    if video_id not in seen:
+                        seen.add(video_id)
+                        items.append(item)
+                page_token = response.get("nextPageToken")
+                if caught_up or page_token is None:
+                    break
+        except (QuotaExceededError, QuotaBudgetExceeded):
+            raise
+        except Exception as e:
+            logger.warning(
+                "Skipping channel %s after failed request: %s", channel_id, e
+            )
+            return None
 
-        return all_data
+        return {"playlistId": playlist_id, "items": items[:self._max_results]}
 
-    def _build_dataframe(self) -> pd.DataFrame:
+    @staticmethod
+    def _new_items(
+        items: List[Dict], mark: Optional[ChannelMark]
+    ) -> Tuple[List[Dict], bool]:
+        """
+        Keep the playlist items uploaded since the last sync.
+
+        Uploads playlists list the newest videos first, so everything after
+        the first video older than the mark, or known and not newer than
+        it, was already synced. Known videos newer than the mark were
+        returned by a sync capped at ``max_results`` and are skipped.
+
+        Args:
+            items: playlistItems items of one page.
+            mark: Sync mark of the channel, None to keep every item.
+
+        Returns:
+            Tuple[List[Dict], bool]: New items, and whether known content
+            was reached.
+        """
+        if mark is None:
+            return items, False
+        new_items = []
+        for item in items:
+            details = item.get("contentDetails", {})
+            published_at = details.get("videoPublishedAt")
+            newer = (
+                mark.published_at is not None
+                and published_at is not None
+                and published_at > mark.published_at
+            )
+            if details.get("videoId") in mark.video_ids:
+                if newer:
+                    continue
+                return new_items, True
+            if (
+                mark.published_at is not None
+                and published_at is not None
+                and published_at < mark.published_at
+            ):
+                return new_items, True
+            new_items.append(item)
+        return new_items, False
+
+    @staticmethod
+    def _channels_params(channel_ids: List[str]) -> Dict:
+        """
+        Build the query parameters of a channels.list call.
+
+        Args:
+            channel_ids: Up to 50 YouTube channel IDs.
+
+        Returns:
+            Dict: Query parameters.
+        """
+        return {
+            "part": "contentDetails",
+            "id": ",".join(channel_ids),
+            "maxResults": MAX_IDS_PER_REQUEST,
+            "fields": "items(id,contentDetails/relatedPlaylists/uploads)",
+        }
+
+    @staticmethod
+    def _parse_channels(response: Dict) -> Dict[str, str]:
+        """
+        Read the uploads playlists from a channels.list response.
+
+        Args:
+            response: channels.list response.
+
+        Returns:
+            Dict[str, str]: Uploads playlist ID keyed by channel ID.
+        """
+        playlists = {}
+        for item in response.get("items", []):
+            details = item.get("contentDetails", {})
+            related = details.get("relatedPlaylists", {})
+            if "uploads" in related:
+                playlists[item["id"]] = related["uploads"]
+        return playlists
+
+    @staticmethod
+    def _playlist_items_params(
+        playlist_id: str,
+        max_results: int,
+        page_token: Optional[str] = None,
+        columns: Optional[List[Tuple[str, str]]] = None,
+    ) -> Dict:
+        """
+        Build the query parameters of a playlistItems.list call.
+
+        Args:
+            playlist_id: YouTube playlist ID.
+            max_results: Number of items still wanted.
+            page_token: Token for pagination.
+            columns: Selected output columns; the request is limited to
+                their fields if given.
+
+        Returns:
+            Dict: Query parameters.
+        """
+        params = {
+            "part": "snippet,contentDetails",
+            "playlistId": playlist_id,
+            "maxResults": min(max_results, MAX_IDS_PER_REQUEST),
+            "pageToken": page_token,
+        }
+        if columns is not None:
+            params["part"], params["fields"] = playlist_items_request(
+                [name for name, _ in columns]
+            )
+        return params
+
+    def _build_dataframe(self, video_data: List[Dict]) -> pd.DataFrame:
         """
         Build a DataFrame from the collected data.
 
+        Args:
+            video_data: Enriched rows of every channel.
+
         Returns:
             pd.DataFrame: DataFrame with video information and captions.
         """
+        # Create DataFrame from collected items
+        with self.metrics.phase("frame"):
+            return create_df_from_items(
+                video_data,
+                self.columns,
+                dtype_backend=self._dtype_backend,
+                select=self._columns is not None,
+            )
+
+    @staticmethod
+    def _parse_playlist_items(channel_id: str, response: Dict) -> List[Dict]:
+        """
+        Build video rows from the uploads playlist of a channel.
+
+        Args:
+            channel_id: YouTube channel ID.
+            response: Playlist items of the channel.
+
+        Returns:
+            List[Dict]: One row per uploaded video.
+        """
         video_data = []
+        for item in response.get("items", []):
+            details = item.get("contentDetails", {})
+            video_id = details.get("videoId")
 
-        for channel_id, response in self.raw_data.items():
-            if "items" not in response:
+            # Private and deleted videos have no publication date
+            if not video_id or "videoPublishedAt" not in details:
                 continue
 
-            for item in response["items"]:
-                if item["snippet"]["type"] != "upload":
-                    continue
+            # Extract information from snippet
+            snippet = item.get("snippet", {})
 
-                # Only process items that have a videoId
-                if "upload" not in item.get("contentDetails", {}):
-                    continue
+            # Build the dictionary with video information
+            video_info = {
+                "channelId": channel_id,
+                "videoId": video_id,
+                "title": snippet.get("title"),
+                "description": snippet.get("description"),
+                "publishedAt": details["videoPublishedAt"],
+            }
 
-                video_id = item["contentDetails"]["upload"].get("videoId")
-                if not video_id:
-                    continue
+            # Process thumbnails
+            video_info = process_thumbnails(snippet, video_info)
 
-                # Extract information from snippet
-                snippet = item["snippet"]
-
-                # Build the dictionary with video information
-                video_info = {
-                    "channelId": channel_id,
-                    "videoId": video_id,
-                    "title": snippet.get("title"),
-                    "description": snippet.get("description"),
-                    "publishedAt": snippet.get("publishedAt"),
-                    "caption": get_video_captions(
-                        video_id, self._accepted_caption_lang
-                    ),
-                }
+            video_data.append(video_info)
+        return video_data
 
-                # Process thumbnails
-                video_info = process_thumbnails(snippet, video_info)
+    def _enrich(
+        self,
+        video_data: List[Dict],
+        caption_table: Optional[CaptionTable] = None,
+    ) -> List[Dict]:
+        """
+        Filter and enrich playlist rows, cheapest stage first.
 
-                video_data.append(video_info)
+        Statistics are requested only for the rows kept by the playlist
+        item conditions, and captions only for the rows kept by the count
+        conditions.
 
-        # Create DataFrame from collected items
-        return create_df_from_items(video_data)
+        Args:
+            video_data: Rows built from playlist items.
+            caption_table: Table receiving caption segments instead of the
+                ``caption`` column.
+
+        Returns:
+            List[Dict]: Kept rows with their statistics and captions.
+        """
+        video_data = self._where.apply(video_data, "snippet")
+        video_data = self._where.apply(
+            self._add_statistics(video_data), "statistics"
+        )
+        video_data = self._add_captions(video_data, caption_table)
+        return self._where.apply(video_data, "captions")
+
+    def _add_captions(
+        self,
+        video_data: List[Dict],
+        caption_table: Optional[CaptionTable] = None,
+    ) -> List[Dict]:
+        """
+        Add captions to the collected rows.
+
+        Args:
+            video_data: List of dictionaries with video information.
+            caption_table: Table receiving caption segments instead of the
+                ``caption`` column.
+
+        Returns:
+            List[Dict]: Rows updated with their captions, in the same order.
+        """
+        video_ids = [video_info["videoId"] for video_info in video_data]
+        if not video_data:
+            return video_data
+        if caption_table is None and not self._fetched("caption"):
+            return video_data
+        if caption_table is not None:
+            with self.metrics.phase("captions"):
+                found = get_videos_caption_segments(
+                    video_ids,
+                    self._accepted_caption_lang,
+                    workers=self._caption_workers,
+                    rate_limit=self._caption_rate_limit,
+                    cache=self._transcript_cache,
+                    hook=self._emit,
+                )
+            caption_table.add_found(video_ids, found)
+            return video_data
+
+        with self.metrics.phase("captions"):
+            captions = get_videos_captions(
+                video_ids,
+                self._accepted_caption_lang,
+                workers=self._caption_workers,
+                rate_limit=self._caption_rate_limit,
+                cache=self._transcript_cache,
+                hook=self._emit,
+            )
+        for video_info, caption in zip(video_data, captions):
+            video_info["caption"] = caption
+        return video_data
+
+    def _add_statistics(self, video_data: List[Dict]) -> List[Dict]:
+        """
+        Add video statistics to the collected rows.
+
+        Statistics for all channels are requested together, in batches of
+        up to 50 videos per call. Unlike in Search, every upload is kept:
+        videos whose statistics could not be fetched, including all of
+        them when the quota runs out, keep missing counts.
+
+        Args:
+            video_data: List of dictionaries with video information.
+
+        Returns:
+            List[Dict]: Rows updated with their statistics, in the same order.
+        """
+        video_ids = [video_info["videoId"] for video_info in video_data]
+        fields = self._statistics_fields()
+        if not video_ids or fields == "":
+            return video_data
+
+        try:
+            with self.metrics.phase("statistics"):
+                statistics = get_videos_statistics(
+                    video_ids,
+                    self._developer_key,
+                    self._client,
+                    fields,
+                    self.metrics,
+                )
+        except (QuotaExceededError, QuotaBudgetExceeded) as e:
+            logger.warning(
+                "Keeping %d videos without statistics: %s", len(video_ids), e
+            )
+            self._missing_statistics.update(video_ids)
+            return video_data
+
+        self._missing_statistics.update(
+            video_id for video_id in video_ids if video_id not in statistics
+        )
+        for video_info in video_data:
+            video_info.update(statistics.get(video_info["videoId"], {}))
+        return video_data
@@ -0,0 +1,432 @@
+"""
+Resumable, sharded crawls of many search terms or channels.
+
+A job spec lists search terms or channel IDs. ``submit`` splits it into
+shards in a SQLite work queue, ``run`` drains the queue on a process pool
+and writes one Parquet file per term or channel, and ``status`` reports
+progress. Every finished unit is checkpointed, so running a job again
+after a crash only redoes unfinished units::
+
+    tubeframes submit crawl.sqlite spec.json
+    tubeframes run crawl.sqlite --processes 4 --output data
+    tubeframes status crawl.sqlite
+"""
+
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import hashlib
+import json
+import logging
+import os
+import socket
+
+from tubeframes.config.constants import (
+    DEFAULT_LEASE,
+    DEFAULT_MAX_ATTEMPTS,
+    YOUTUBE_API_BASE_URL,
+)
+from tubeframes.retry import RetryPolicy, QuotaExceededError
+from tubeframes.workqueue import WorkQueue, Shard
+
+# The crawl classes load pandas and the HTTP stack, so they are imported
+# by the workers only and ``submit`` or ``status`` start quickly
+if TYPE_CHECKING:  # pragma: no cover
+    from tubeframes.channel_info import ChannelInfo
+    from tubeframes.client import TubeFramesClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT_DIR = "tubeframes-output"
+
+
+class _QuotaWatch(RetryPolicy):
+    """Retry policy remembering whether the daily quota ran out."""
+
+    exhausted = False
+
+    def on_http_error(self, error, attempt: int) -> float:
+        try:
+            return super().on_http_error(error, attempt)
+        except QuotaExceededError:
+            self.exhausted = True
+            raise
+
+
+def load_spec(path: str) -> Dict[str, Any]:
+    """
+    Read a job spec.
+
+    The spec is a JSON object with ``job`` (name), ``kind`` ("search" or
+    "channels"), ``units`` and optionally ``options`` (extra Search or
+    ChannelInfo arguments) and ``shard_size``. ``units`` is a list, or the
+    path of a text file with one term or channel ID per line, relative to
+    the spec.
+
+    Args:
+        path: JSON file
+
+    Returns:
+        Dict[str, Any]: Spec with ``units`` as a list
+
+    Raises:
+        ValueError: If a required key is missing
+    """
+    with open(path, encoding="utf-8") as fh:
+        spec = json.load(fh)
+    missing = [key for key in ("job", "kind", "units") if key not in spec]
+    if missing:
+        raise ValueError("Job spec misses {}".format(missing))
+    if isinstance(spec["units"], str):
+        units_path = os.path.join(os.path.dirname(path), spec["units"])
+        with open(units_path, encoding="utf-8") as fh:
+            spec["units"] = [line.strip() for line in fh if line.strip()]
+    return spec
+
+
+def unit_path(output: str, job: str, unit: str) -> str:
+    """
+    Get the Parquet file of one unit.
+
+    Args:
+        output: Output directory
+        job: Job name
+        unit: Search term or channel ID
+
+    Returns:
+        str: File inside the job's dataset directory
+    """
+    digest = hashlib.sha1(unit.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(output, job, "part-{}.parquet".format(digest))
+
+
+def _write_unit(
+    path: str, columns: List[Tuple[str, str]], rows: Iterator[List[Dict]]
+) -> int:
+    """
+    Write the rows of a unit to its file, replacing it atomically.
+
+    A hidden temporary file is written first, so an interrupted unit never
+    leaves a partial file in the dataset.
+
+    Args:
+        path: Parquet file of the unit
+        columns: Output columns and kinds
+        rows: Batches of enriched rows
+
+    Returns:
+        int: Number of rows written
+    """
+    directory, name = os.path.split(path)
+    os.makedirs(directory, exist_ok=True)
+    temporary = os.path.join(directory, "." + name + ".tmp")
+    from tubeframes.sink import ParquetSink
+
+    written = 0
+    try:
+        with ParquetSink(temporary, columns) as sink:
+            for batch in rows:
+                sink.write_rows(batch)
+                written += len(batch)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    os.replace(temporary, path)
+    return written
+
+
+def _search_units(
+    shard: Shard, client: "TubeFramesClient"
+) -> Iterator[Tuple[str, List, Optional[Iterator[List[Dict]]]]]:
+    """
+    Create the searches of a shard, before any request is made.
+
+    Returns:
+        Iterator: Each term with its output columns and lazy rows
+
+    Raises:
+        TypeError: If a job option is unknown
+        ValueError: If a job option has an invalid value
+    """
+    from tubeframes.search import Search
+
+    searches = [
+        Search(term, lazy=True, client=client, **shard.job.options)
+        for term in shard.units
+    ]
+    return (
+        (term, search.columns, search.iter_pages())
+        for term, search in zip(shard.units, searches)
+    )
+
+
+def _channel_units(
+    shard: Shard, client: "TubeFramesClient"
+) -> Iterator[Tuple[str, List, Optional[Iterator[List[Dict]]]]]:
+    """
+    Create the channel crawl of a shard, before any request is made.
+
+    Returns:
+        Iterator: Each channel with its output columns and rows, None if
+        lost
+
+    Raises:
+        TypeError: If a job option is unknown
+        ValueError: If a job option has an invalid value
+    """
+    from tubeframes.channel_info import ChannelInfo
+
+    info = ChannelInfo(
+        shard.units, lazy=True, client=client, **shard.job.options
+    )
+    return _channel_rows(shard, info)
+
+
+def _channel_rows(
+    shard: Shard, info: "ChannelInfo"
+) -> Iterator[Tuple[str, List, Optional[Iterator[List[Dict]]]]]:
+    """Yield each channel with its output columns and rows, None if lost."""
+    pending = iter(shard.units)
+    for channel_id, video_data in info.iter_channel_rows():
+        # Channels come in order, so the ones before were skipped
+        for unit in pending:
+            if unit == channel_id:
+                yield unit, info.columns, iter([video_data])
+                break
+            yield unit, info.columns, None
+    for unit in pending:
+        yield unit, info.columns, None
+
+
+def run_shard(
+    queue: WorkQueue,
+    shard: Shard,
+    client: "TubeFramesClient",
+    output: str,
+) -> bool:
+    """
+    Process the units of a claimed shard, checkpointing each one.
+
+    Args:
+        queue: Work queue the shard was claimed from
+        shard: Claimed shard
+        client: API client whose retry policy is a quota watch
+        output: Output directory
+
+    Returns:
+        bool: False if the quota ran out and the worker should stop
+    """
+    kind = shard.job.kind
+    units = _search_units if kind == "search" else _channel_units
+    try:
+        crawl = units(shard, client)
+    except Exception as e:
+        # Every unit of the job fails the same way, so each one counts an
+        # attempt and the job ends failed instead of being retried forever
+        error = "{}: {}".format(type(e).__name__, e)
+        logger.warning("Invalid options of job %s: %s", shard.job.name, error)
+        for unit in shard.units:
+            queue.fail(shard, unit, error)
+        return True
+
+    remaining = list(shard.units)
+    try:
+        for unit, columns, rows in crawl:
+            written, error = 0, "channel not found or not fetched"
+            if rows is not None:
+                try:
+                    path = unit_path(output, shard.job.name, unit)
+                    written, error = _write_unit(path, columns, rows), None
+                except QuotaExceededError:
+                    raise
+                except Exception as e:
+                    error = "{}: {}".format(type(e).__name__, e)
+            # Results cut short by the quota are redone by a later run
+            if client.retry.exhausted:
+                break
+            remaining.remove(unit)
+            if error is None:
+                if not queue.complete(shard, unit, written):
+                    logger.warning(
+                        "Unit %r of %s was claimed by another worker after "
+                        "the lease ran out",
+                        unit,
+                        kind,
+                    )
+            else:
+                logger.warning("Unit %r of %s failed: %s", unit, kind, error)
+                queue.fail(shard, unit, error)
+    except QuotaExceededError:
+        pass
+    finally:
+        if remaining:
+            queue.release(shard, remaining)
+    return not client.retry.exhausted
+
+
+def run_worker(
+    queue_path: str,
+    job: Optional[str] = None,
+    output: str = DEFAULT_OUTPUT_DIR,
+    developer_key: Optional[str] = None,
+    base_url: str = YOUTUBE_API_BASE_URL,
+    lease: float = DEFAULT_LEASE,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> int:
+    """
+    Claim and process shards until the queue is drained.
+
+    Args:
+        queue_path: SQLite file of the work queue
+        job: Only work on this job, any job if None
+        output: Output directory, with one dataset directory per job
+        developer_key: YouTube API developer key
+        base_url: Root URL of the API, e.g. of a MockYouTubeServer
+        lease: Seconds a claimed shard stays with this worker
+        max_attempts: Attempts before a unit is marked failed
+
+    Returns:
+        int: Number of shards processed
+    """
+    from tubeframes.client import TubeFramesClient
+    from tubeframes.utils import get_dev_key
+
+    worker = "{}:{}".format(socket.gethostname(), os.getpid())
+    queue = WorkQueue(queue_path, lease, max_attempts)
+    client = TubeFramesClient(
+        get_dev_key(developer_key), base_url=base_url, retry=_QuotaWatch()
+    )
+    shards = 0
+    try:
+        while True:
+            shard = queue.claim(worker, job)
+            if shard is None:
+                break
+            shards += 1
+            if not run_shard(queue, shard, client, output):
+                logger.warning("Quota exhausted, stopping worker %s", worker)
+                break
+    finally:
+        client.close()
+        queue.close()
+    return shards
+
+
+def run(
+    queue_path: str,
+    job: Optional[str] = None,
+    processes: int = 1,
+    **kwargs
+) -> int:
+    """
+    Drain a work queue with a pool of worker processes.
+
+    Args:
+        queue_path: SQLite file of the work queue
+        job: Only work on this job, any job if None
+        processes: Number of worker processes, 1 to work in this process
+        **kwargs: Other arguments of run_worker
+
+    Returns:
+        int: Number of shards processed
+    """
+    if processes <= 1:
+        return run_worker(queue_path, job, **kwargs)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [
+            executor.submit(run_worker, queue_path, job, **kwargs)
+            for _ in range(processes)
+        ]
+        return sum(future.result() for future in futures)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="tubeframes", description=__doc__.split("\n\n")[0]
+    )
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    submit = commands.add_parser("submit", help="add a job to a queue")
+    submit.add_argument("queue", help="SQLite file of the work queue")
+    submit.add_argument("spec", help="JSON job spec")
+    submit.set_defaults(job=None)
+
+    run_parser = commands.add_parser("run", help="work through a queue")
+    run_parser.add_argument("queue", help="SQLite file of the work queue")
+    run_parser.add_argument("--job", help="only run this job")
+    run_parser.add_argument(
+        "--output",
+        default=DEFAULT_OUTPUT_DIR,
+        help="output directory, one Parquet dataset per job",
+    )
+    run_parser.add_argument(
+        "--processes", type=int, default=1, help="worker processes"
+    )
+    run_parser.add_argument(
+        "--developer-key", help="API key, YOUTUBE_DEVELOPER_KEY by default"
+    )
+    run_parser.add_argument(
+        "--base-url", default=YOUTUBE_API_BASE_URL, help="API root URL"
+    )
+    run_parser.add_argument(
+        "--lease",
+        type=float,
+        default=DEFAULT_LEASE,
+        help="seconds before a silent worker's shard is claimed again",
+    )
+    run_parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=DEFAULT_MAX_ATTEMPTS,
+        help="attempts before a unit is marked failed",
+    )
+
+    status = commands.add_parser("status", help="show job progress")
+    status.add_argument("queue", help="SQLite file of the work queue")
+    status.add_argument("--job", help="only show this job")
+
+    retry = commands.add_parser("retry", help="retry failed units")
+    retry.add_argument("queue", help="SQLite file of the work queue")
+    retry.add_argument("--job", help="only retry this job")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(name)s %(message)s"
+    )
+
+    if args.command == "run":
+        shards = run(
+            args.queue,
+            args.job,
+            args.processes,
+            output=args.output,
+            developer_key=args.developer_key,
+            base_url=args.base_url,
+            lease=args.lease,
+            max_attempts=args.max_attempts,
+        )
+        print("Processed {} shards".format(shards))
+    queue = WorkQueue(args.queue)
+    try:
+        if args.command == "submit":
+            spec = load_spec(args.spec)
+            added = queue.submit(
+                spec["job"],
+                spec["kind"],
+                spec["units"],
+                spec.get("options"),
+                spec.get("shard_size"),
+            )
+            print("Added {} units to job {}".format(added, spec["job"]))
+        elif args.command == "retry":
+            print("Reset {} failed units".format(queue.retry_failed(args.job)))
+        print(queue.status(args.job).to_string())
+    finally:
+        queue.close()
+
+
+if __name__ == "__main__":
+    main()
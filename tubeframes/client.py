@@ -0,0 +1,369 @@
+from typing import Dict, Any, List, Mapping, Optional
+import hashlib
+import logging
+import os
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from googleapiclient.discovery_cache.base import Cache
+from googleapiclient.errors import HttpError
+
+from tubeframes.cache import ResponseCache
+from tubeframes.quota import QuotaScheduler
+from tubeframes.retry import RetryPolicy
+from tubeframes.metrics import RequestEvent, RequestHook, emit
+from tubeframes.config.constants import (
+    QUOTA_COSTS,
+    YOUTUBE_API_SERVICE_NAME,
+    YOUTUBE_API_VERSION,
+    YOUTUBE_API_BASE_URL,
+    DEFAULT_CACHE_DIR,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def http_error(
+    status: int, headers: Mapping[str, str], content: bytes, uri: str
+) -> HttpError:
+    """
+    Convert an error response into a googleapiclient HttpError.
+
+    Args:
+        status: HTTP status code
+        headers: Response headers
+        content: Response body
+        uri: Requested URL
+
+    Returns:
+        HttpError: Error compatible with the discovery-based client
+    """
+    import httplib2
+
+    info = {k.lower(): v for k, v in headers.items()}
+    info["status"] = str(status)
+    return HttpError(httplib2.Response(info), content, uri=uri)
+
+
+class DiscoveryFileCache(Cache):
+    """On-disk cache for the API discovery document."""
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        """
+        Initialize the discovery cache.
+
+        Args:
+            cache_dir: Directory where discovery documents are stored
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(DEFAULT_CACHE_DIR, "discovery")
+        self._cache_dir = cache_dir
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self._cache_dir, digest + ".json")
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        Get a cached discovery document.
+
+        Args:
+            url: Discovery document URL
+
+        Returns:
+            Optional[str]: Cached document or None if not cached
+        """
+        try:
+            with open(self._path(url), "r", encoding="utf-8") as fh:
+                return fh.read()
+        except OSError:
+            return None
+
+    def set(self, url: str, content: str) -> None:
+        """
+        Store a discovery document.
+
+        Args:
+            url: Discovery document URL
+            content: Discovery document
+        """
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            tmp_path = self._path(url) + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                fh.write(content)
+            os.replace(tmp_path, self._path(url))
+        except OSError:
+            pass
+
+
+class TubeFramesClient:
+    """
+    Shared access layer to the YouTube Data API.
+
+    A client keeps one pooled keep-alive HTTP session for all REST calls
+    and builds the discovery-based API resource only once. It is safe to
+    share one client between threads and between Search and ChannelInfo
+    instances.
+    """
+
+    def __init__(
+        self,
+        dev_key: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        discovery_cache_dir: Optional[str] = None,
+        base_url: str = YOUTUBE_API_BASE_URL,
+        cache: Optional[ResponseCache] = None,
+        scheduler: Optional[QuotaScheduler] = None,
+        retry: Optional[RetryPolicy] = None,
+        hooks: Optional[List[RequestHook]] = None,
+    ) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            dev_key: YouTube API developer key
+            pool_size: Maximum number of pooled connections per host
+            timeout: Timeout in seconds for each HTTP request
+            discovery_cache_dir: Directory for the cached discovery document
+            base_url: Root URL of the REST endpoints
+            cache: Response cache for list calls
+            scheduler: Quota scheduler charging and pacing every call
+            retry: Retry policy for transient errors, a default
+                RetryPolicy if None
+            hooks: Callables receiving a RequestEvent for every API call,
+                retry and cache hit, and for every transcript fetch made
+                through this client
+        """
+        self._developer_key = dev_key
+        self._base_url = base_url
+        self.cache = cache
+        self.scheduler = scheduler
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.hooks = list(hooks or [])
+        self._timeout = timeout
+        self._discovery_cache = DiscoveryFileCache(discovery_cache_dir)
+        self._youtube = None
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @property
+    def developer_key(self) -> str:
+        """YouTube API developer key used by this client."""
+        return self._developer_key
+
+    @property
+    def youtube(self):
+        """
+        Discovery-based YouTube API resource, built on first access.
+
+        The discovery document is cached on disk, so later processes do not
+        download it again.
+        """
+        if self._youtube is None:
+            from googleapiclient.discovery import build
+
+            with self._lock:
+                if self._youtube is None:
+                    self._youtube = build(
+                        YOUTUBE_API_SERVICE_NAME,
+                        YOUTUBE_API_VERSION,
+                        developerKey=self._developer_key,
+                        cache=self._discovery_cache,
+                        static_discovery=False,
+                    )
+        return self._youtube
+
+    def add_hook(self, hook: RequestHook) -> None:
+        """
+        Register an instrumentation hook.
+
+        Args:
+            hook: Callable receiving a RequestEvent per request
+        """
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        """
+        Unregister an instrumentation hook.
+
+        Args:
+            hook: Callable registered with add_hook
+        """
+        if hook in self.hooks:
+            self.hooks.remove(hook)
+
+    def emit(
+        self, event: RequestEvent, hook: Optional[RequestHook] = None
+    ) -> None:
+        """
+        Pass a request event to the registered hooks.
+
+        Args:
+            event: Request event
+            hook: Extra hook of the caller, such as the metrics of the
+                Search or ChannelInfo making the request
+        """
+        hooks = self.hooks if hook is None else self.hooks + [hook]
+        if hooks:
+            emit(hooks, event)
+
+    def _emit_request(
+        self,
+        resource: str,
+        sent: float,
+        response: Optional[requests.Response],
+        hook: Optional[RequestHook] = None,
+    ) -> None:
+        """Emit the event of one HTTP attempt."""
+        if not self.hooks and hook is None:
+            return
+        cache = None
+        if self.cache is not None:
+            revalidated = response is not None and response.status_code == 304
+            cache = "revalidated" if revalidated else "miss"
+        if self.scheduler is not None:
+            quota = self.scheduler.cost(resource)
+        else:
+            quota = QUOTA_COSTS.get(resource, 1)
+        self.emit(
+            RequestEvent(
+                resource,
+                time.perf_counter() - sent,
+                response.status_code if response is not None else None,
+                len(response.content) if response is not None else 0,
+                quota,
+                cache,
+            ),
+            hook,
+        )
+
+    def get(
+        self,
+        resource: str,
+        params: Dict[str, Any],
+        hook: Optional[RequestHook] = None,
+    ) -> Dict:
+        """
+        Call a list endpoint of the YouTube Data API.
+
+        With a response cache, fresh cached responses are returned without a
+        request and stale ones are revalidated with ``If-None-Match``. With a
+        quota scheduler, every request is charged and paced; cache hits are
+        free. Transient errors are retried according to the retry policy.
+        Every attempt and cache hit is reported to the hooks.
+
+        Args:
+            resource: API resource name, e.g. "search" or "videos"
+            params: Query parameters, without the developer key
+            hook: Callable receiving the events of this call only, besides
+                the registered hooks
+
+        Returns:
+            Dict: Decoded JSON response
+
+        Raises:
+            HttpError: If the API answers with an error status
+            QuotaExceededError: If the API reports the daily quota exhausted
+            QuotaBudgetExceeded: If the scheduler refuses the call
+        """
+        start = time.perf_counter()
+        query = {k: v for k, v in params.items() if v is not None}
+        cached = self.cache.get(resource, query) if self.cache else None
+        if cached is not None and cached.fresh:
+            self.emit(
+                RequestEvent(
+                    resource, time.perf_counter() - start, None, 0, 0, "hit"
+                ),
+                hook,
+            )
+            return cached.data
+
+        headers = {}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+
+        attempt = 0
+        while True:
+            if self.scheduler is not None:
+                self.scheduler.acquire(resource)
+            wait = self.retry.before_request()
+            if wait > 0:
+                time.sleep(wait)
+            sent = time.perf_counter()
+            try:
+                response = self.session.get(
+                    self._base_url + resource,
+                    params=dict(query, key=self._developer_key),
+                    headers=headers,
+                    timeout=self._timeout,
+                )
+                self._emit_request(resource, sent, response, hook)
+                if response.status_code >= 400:
+                    raise http_error(
+                        response.status_code,
+                        response.headers,
+                        response.content,
+                        response.url,
+                    )
+            except HttpError as e:
+                delay = self.retry.on_http_error(e, attempt)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._emit_request(resource, sent, None, hook)
+                delay = self.retry.on_transport_error(e, attempt)
+            else:
+                break
+            logger.warning(
+                "%s request failed (attempt %d), retrying in %.1fs",
+                resource,
+                attempt + 1,
+                delay,
+            )
+            time.sleep(delay)
+            attempt += 1
+
+        self.retry.on_success()
+        if response.status_code == 304 and cached is not None:
+            self.cache.touch(resource, query)
+            return cached.data
+
+        data = response.json()
+        if self.cache is not None:
+            self.cache.set(resource, query, data, response.headers.get("ETag"))
+        return data
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self.session.close()
+
+
+_default_clients: Dict[str, TubeFramesClient] = {}
+_default_clients_lock = threading.Lock()
+
+
+def get_default_client(dev_key: str) -> TubeFramesClient:
+    """
+    Get the process-wide client for a developer key.
+
+    Args:
+        dev_key: YouTube API developer key
+
+    Returns:
+        TubeFramesClient: Shared client, created on first use
+    """
+    with _default_clients_lock:
+        client = _default_clients.get(dev_key)
+        if client is None:
+            client = TubeFramesClient(dev_key)
+            _default_clients[dev_key] = client
+    return client
@@ -1,7 +1,237 @@
 """Constants used in modules."""
 
+import os
+
 YOUTUBE_API_SERVICE_NAME = "youtube"
 YOUTUBE_API_VERSION = "v3"
-YOUTUBE_API_URL = (
-    "https://www.googleapis.com/youtube/" + YOUTUBE_API_VERSION + "/videos"
+YOUTUBE_API_BASE_URL = (
+    "https://www.googleapis.com/youtube/" + YOUTUBE_API_VERSION + "/"
+)
+YOUTUBE_API_URL = YOUTUBE_API_BASE_URL + "videos"
+
+# Maximum number of comma-separated IDs accepted by a single list call
+MAX_IDS_PER_REQUEST = 50
+
+# Local directory for on-disk caches (discovery document, responses, ...)
+DEFAULT_CACHE_DIR = os.environ.get(
+    "TUBEFRAMES_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "tubeframes"),
+)
+
+# HTTP connection pool and timeout defaults
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 180
+
+# Seconds a cached API response stays fresh, per endpoint. Older responses
+# are revalidated with their ETag.
+DEFAULT_RESPONSE_TTL = {
+    "search": 6 * 3600,
+    "videos": 3600,
+    "activities": 3600,
+    "channels": 7 * 86400,
+    "playlistItems": 3600,
+}
+
+# Maximum total size in bytes of the compressed cached responses
+DEFAULT_RESPONSE_CACHE_SIZE = 256 * 1024 * 1024
+
+# Seconds a cached transcript lookup stays valid, per outcome: a found
+# transcript, no transcript in the requested language, transcripts
+# disabled for the video, and a failed lookup (unavailable video, blocked
+# or failed request), retried soon
+DEFAULT_TRANSCRIPT_TTL = {
+    "found": 30 * 24 * 3600,
+    "missing": 24 * 3600,
+    "disabled": 7 * 24 * 3600,
+    "failed": 3600,
+}
+
+# Maximum total size in bytes of the compressed cached transcripts
+DEFAULT_TRANSCRIPT_CACHE_SIZE = 512 * 1024 * 1024
+
+# Stable output columns and their kinds ("string", "int", "timestamp",
+# "duration" for ISO 8601 durations stored as seconds, or "bool"), per
+# result type
+_COUNT_COLUMNS = [
+    ("viewCount", "int"),
+    ("likeCount", "int"),
+    ("favoriteCount", "int"),
+    ("commentCount", "int"),
+]
+VIDEO_SEARCH_COLUMNS = [
+    ("videoId", "string"),
+    ("publishedAt", "timestamp"),
+    ("channelId", "string"),
+    ("title", "string"),
+    ("description", "string"),
+    ("channelTitle", "string"),
+    ("liveBroadcastContent", "string"),
+    ("publishTime", "timestamp"),
+    ("thumbnailUrl", "string"),
+] + _COUNT_COLUMNS + [
+    ("video_caption", "string"),
+]
+CHANNEL_SEARCH_COLUMNS = [
+    ("channelId", "string"),
+    ("publishedAt", "timestamp"),
+    ("title", "string"),
+    ("description", "string"),
+    ("channelTitle", "string"),
+    ("liveBroadcastContent", "string"),
+    ("publishTime", "timestamp"),
+    ("thumbnailUrl", "string"),
+]
+CHANNEL_INFO_COLUMNS = [
+    ("channelId", "string"),
+    ("videoId", "string"),
+    ("title", "string"),
+    ("description", "string"),
+    ("publishedAt", "timestamp"),
+    ("caption", "string"),
+    ("thumbnailUrl", "string"),
+] + _COUNT_COLUMNS
+
+# Video details from the contentDetails part, added to Search and
+# ChannelInfo results with content_details=True. "hasCaption" is the API's
+# caption availability flag.
+CONTENT_DETAILS_COLUMNS = [
+    ("duration", "duration"),
+    ("definition", "string"),
+    ("hasCaption", "bool"),
+]
+
+# Terms that found each result of Search.many
+TERMS_COLUMN = ("terms", "list")
+
+# Kind of every known output column, used to type DataFrame columns
+COLUMN_KINDS = dict(
+    VIDEO_SEARCH_COLUMNS
+    + CHANNEL_SEARCH_COLUMNS
+    + CHANNEL_INFO_COLUMNS
+    + CONTENT_DETAILS_COLUMNS
+    + [TERMS_COLUMN]
+)
+
+# Partial-response paths of the API fields read for each output column,
+# per request. The ID columns and the fields needed to page or to filter
+# rows are always requested.
+_THUMBNAIL_FIELDS = [
+    "snippet/thumbnails/maxres/url",
+    "snippet/thumbnails/high/url",
+    "snippet/thumbnails/default/url",
+]
+SEARCH_COLUMN_FIELDS = {
+    "publishedAt": ["snippet/publishedAt"],
+    "channelId": ["snippet/channelId"],
+    "title": ["snippet/title"],
+    "description": ["snippet/description"],
+    "channelTitle": ["snippet/channelTitle"],
+    "liveBroadcastContent": ["snippet/liveBroadcastContent"],
+    "publishTime": ["snippet/publishTime"],
+    "thumbnailUrl": _THUMBNAIL_FIELDS,
+}
+SEARCH_PAGE_FIELDS = [
+    "kind",
+    "etag",
+    "regionCode",
+    "pageInfo",
+    "nextPageToken",
+]
+STATISTICS_COLUMN_FIELDS = {
+    name: ["statistics/" + name] for name, _ in _COUNT_COLUMNS
+}
+# contentDetails key behind each video details column
+CONTENT_DETAILS_KEYS = {
+    "duration": "duration",
+    "definition": "definition",
+    "hasCaption": "caption",
+}
+CONTENT_DETAILS_COLUMN_FIELDS = {
+    name: ["contentDetails/" + key]
+    for name, key in CONTENT_DETAILS_KEYS.items()
+}
+PLAYLIST_ITEM_COLUMN_FIELDS = {
+    "title": ["snippet/title"],
+    "description": ["snippet/description"],
+    "thumbnailUrl": _THUMBNAIL_FIELDS,
+}
+PLAYLIST_ITEM_FIELDS = [
+    "nextPageToken",
+    "items/contentDetails/videoId",
+    "items/contentDetails/videoPublishedAt",
+]
+
+# ISO 8601 durations as sent by the API, e.g. PT1H2M3S or P1DT5M, and the
+# seconds in each of their units
+ISO_DURATION_PATTERN = (
+    r"^P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?"
+    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?$"
 )
+DURATION_UNITS = {
+    "weeks": 7 * 24 * 3600,
+    "days": 24 * 3600,
+    "hours": 3600,
+    "minutes": 60,
+    "seconds": 1,
+}
+
+# Enrichment stages at which ``where`` predicates run, in order: search
+# snippets or playlist items, video statistics, then captions
+WHERE_STAGES = ("snippet", "statistics", "captions")
+
+# Full-text caption index: tokenizer of the FTS5 tables (accents folded,
+# so "cafe" finds "café") and bm25 weight of each indexed video field
+CAPTION_INDEX_TOKENIZER = "unicode61 remove_diacritics 2"
+CAPTION_INDEX_WEIGHTS = {"title": 10.0, "description": 2.0, "caption": 1.0}
+
+# Columns with few distinct values, stored as categoricals in DataFrames
+CATEGORICAL_COLUMNS = ["channelId", "channelTitle"]
+
+# Ways of returning captions: one joined string per video, or a separate
+# table with one row per timed segment
+CAPTION_FORMATS = ("joined", "segments")
+
+# Default number of channels crawled concurrently by ChannelInfo
+DEFAULT_CHANNEL_WORKERS = 8
+
+# Default number of terms paged concurrently by Search.many
+DEFAULT_TERM_WORKERS = 4
+
+# Thumbnail host and the image of each resolution tier, tried in order
+# until one exists
+THUMBNAIL_BASE_URL = "https://i.ytimg.com/vi/"
+THUMBNAIL_TIERS = [
+    ("maxres", "maxresdefault.jpg"),
+    ("high", "hqdefault.jpg"),
+    ("default", "default.jpg"),
+]
+
+# Default number of thumbnails downloaded concurrently, one per pooled
+# connection, and bytes written per chunk while streaming to disk
+DEFAULT_THUMBNAIL_WORKERS = DEFAULT_POOL_SIZE
+THUMBNAIL_CHUNK_SIZE = 64 * 1024
+
+# Work queue of the crawl runner: units per shard by job kind (one
+# channels.list call resolves a shard of channels), seconds a claimed
+# shard stays with a silent worker, and attempts before a unit fails
+DEFAULT_SHARD_SIZES = {"search": 10, "channels": 50}
+DEFAULT_LEASE = 600.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Default number of rows per Parquet row group / Arrow record batch
+DEFAULT_ROW_GROUP_SIZE = 10000
+
+# Quota units charged per call, per endpoint
+QUOTA_COSTS = {
+    "search": 100,
+    "videos": 1,
+    "activities": 1,
+    "channels": 1,
+    "playlistItems": 1,
+}
+
+# Default daily quota of a YouTube Data API project
+DEFAULT_DAILY_QUOTA = 10000
+
+# The daily quota resets at midnight Pacific Time (UTC-8, DST ignored)
+QUOTA_RESET_UTC_OFFSET = -8 * 3600
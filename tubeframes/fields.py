@@ -0,0 +1,154 @@
+from typing import Dict, List, Optional, Tuple
+
+from tubeframes.config.constants import (
+    CONTENT_DETAILS_COLUMN_FIELDS,
+    SEARCH_COLUMN_FIELDS,
+    SEARCH_PAGE_FIELDS,
+    STATISTICS_COLUMN_FIELDS,
+    PLAYLIST_ITEM_COLUMN_FIELDS,
+    PLAYLIST_ITEM_FIELDS,
+)
+
+
+def fields_selector(paths: List[str]) -> str:
+    """
+    Build a partial-response ``fields`` selector from field paths.
+
+    Paths sharing a prefix are grouped, e.g. ``["items/id",
+    "items/snippet/title"]`` gives ``"items(id,snippet/title)"``.
+
+    Args:
+        paths: Slash-separated field paths
+
+    Returns:
+        str: Selector for the ``fields`` query parameter
+    """
+    tree: Dict[str, Dict] = {}
+    for path in paths:
+        node = tree
+        for name in path.split("/"):
+            node = node.setdefault(name, {})
+
+    def render(name: str, children: Dict[str, Dict]) -> str:
+        if not children:
+            return name
+        if len(children) == 1:
+            (child, grandchildren), = children.items()
+            return name + "/" + render(child, grandchildren)
+        return "{}({})".format(
+            name, ",".join(render(k, v) for k, v in children.items())
+        )
+
+    return ",".join(render(name, children) for name, children in tree.items())
+
+
+def select_columns(
+    columns: Optional[List[str]],
+    available: List[Tuple[str, str]],
+    required: Optional[List[str]] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Select output columns, keeping their canonical order and kinds.
+
+    Args:
+        columns: Requested column names, every available column if None
+        available: Column names and kinds of the result type
+        required: Columns always kept, such as the ID column
+
+    Returns:
+        List[Tuple[str, str]]: Selected column names and kinds
+
+    Raises:
+        ValueError: If a requested column is not available
+    """
+    if columns is None:
+        return list(available)
+    names = {name for name, _ in available}
+    unknown = [name for name in columns if name not in names]
+    if unknown:
+        raise ValueError(
+            "Unknown columns {}, available columns are {}".format(
+                unknown, [name for name, _ in available]
+            )
+        )
+    wanted = set(columns) | set(required or [])
+    return [(name, kind) for name, kind in available if name in wanted]
+
+
+def _paths(columns: List[str], column_fields: Dict[str, List[str]]):
+    """Field paths of the columns present in a mapping."""
+    return [
+        path
+        for name in columns
+        for path in column_fields.get(name, [])
+    ]
+
+
+def search_fields(columns: List[str], id_key: str) -> str:
+    """
+    Get the ``fields`` selector of a search.list call.
+
+    Args:
+        columns: Output column names
+        id_key: ID field of the searched item type
+
+    Returns:
+        str: Selector for the page fields and the snippets of the columns
+    """
+    paths = ["items/id/" + id_key]
+    paths += ["items/" + p for p in _paths(columns, SEARCH_COLUMN_FIELDS)]
+    return fields_selector(SEARCH_PAGE_FIELDS + paths)
+
+
+def statistics_fields(columns: List[str]) -> Optional[str]:
+    """
+    Get the ``fields`` selector of a videos.list statistics call.
+
+    Args:
+        columns: Output column names
+
+    Returns:
+        Optional[str]: Selector for the requested counts and video
+        details, None if none is requested and the call can be skipped
+    """
+    paths = _paths(columns, STATISTICS_COLUMN_FIELDS)
+    paths += _paths(columns, CONTENT_DETAILS_COLUMN_FIELDS)
+    if not paths:
+        return None
+    return fields_selector(["items/id"] + ["items/" + p for p in paths])
+
+
+def videos_part(fields: Optional[str]) -> str:
+    """
+    Get the ``part`` list of a videos.list call from its selector.
+
+    Args:
+        fields: Selector built by statistics_fields, None for full
+            statistics
+
+    Returns:
+        str: "statistics", "contentDetails" or both
+    """
+    if fields is None:
+        return "statistics"
+    parts = [p for p in ("statistics", "contentDetails") if p in fields]
+    return ",".join(parts)
+
+
+def playlist_items_request(columns: List[str]) -> Tuple[str, str]:
+    """
+    Get the ``part`` list and ``fields`` selector of playlistItems.list.
+
+    The video ID and publication date are always requested, to page and to
+    keep sync marks.
+
+    Args:
+        columns: Output column names
+
+    Returns:
+        Tuple[str, str]: Parts and selector
+    """
+    paths = _paths(columns, PLAYLIST_ITEM_COLUMN_FIELDS)
+    part = "snippet,contentDetails" if paths else "contentDetails"
+    paths = PLAYLIST_ITEM_FIELDS + ["items/" + p for p in paths]
+    return part, fields_selector(paths)
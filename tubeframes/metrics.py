@@ -0,0 +1,209 @@
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Any,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+from contextlib import contextmanager
+import logging
+import threading
+import time
+
+if TYPE_CHECKING:  # pragma: no cover - pandas is imported on use
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+TRANSCRIPT_ENDPOINT = "transcripts"
+
+
+class RequestEvent(NamedTuple):
+    """
+    One API call or transcript fetch, as passed to instrumentation hooks.
+
+    ``endpoint`` is the API resource ("search", "videos", ...) or
+    "transcripts". ``latency`` is the time spent waiting for the response,
+    without quota pacing or backoff. ``status`` is the HTTP status, or None
+    for cache hits and connection errors. ``size`` is the payload size in
+    bytes, ``quota`` the API units charged, and ``cache`` is "hit",
+    "revalidated" or "miss", or None when no cache is configured.
+    """
+
+    endpoint: str
+    latency: float
+    status: Optional[int]
+    size: int
+    quota: int
+    cache: Optional[str]
+
+    @property
+    def failed(self) -> bool:
+        """Whether the request failed."""
+        return self.cache != "hit" and (
+            self.status is None or self.status >= 400
+        )
+
+
+RequestHook = Callable[[RequestEvent], None]
+
+
+def emit(hooks: List[RequestHook], event: RequestEvent) -> None:
+    """
+    Pass an event to instrumentation hooks.
+
+    A failing hook is logged and skipped, so instrumentation never breaks
+    a crawl.
+
+    Args:
+        hooks: Callables receiving the event
+        event: Request event
+    """
+    for hook in list(hooks):
+        try:
+            hook(event)
+        except Exception:
+            logger.exception("Instrumentation hook %r failed", hook)
+
+
+class Metrics:
+    """
+    Request counts and phase timings of one Search or ChannelInfo.
+
+    A Metrics object is a request hook: the instance passes it along with
+    each of its own requests, so it aggregates the events of that instance
+    per endpoint even when several instances share a client.
+    Phases add up the wall time spent paging, requesting statistics,
+    fetching captions and building the DataFrame; phases are summed over
+    repeated runs such as several ``iter_pages`` calls. The asyncio classes
+    run phases concurrently, so there the phases can add up to more than
+    the wall time.
+    """
+
+    PHASES = ("paging", "statistics", "captions", "frame")
+    FIELDS = ("requests", "errors", "cache_hits", "bytes", "quota", "latency")
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self._lock = threading.Lock()
+        self._phases = dict.fromkeys(self.PHASES, 0.0)
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+
+    def __call__(self, event: RequestEvent) -> None:
+        """
+        Record a request event.
+
+        Args:
+            event: Request event
+        """
+        with self._lock:
+            stats = self._endpoints.setdefault(
+                event.endpoint, dict.fromkeys(self.FIELDS, 0)
+            )
+            stats["requests"] += 1
+            stats["errors"] += int(event.failed)
+            stats["cache_hits"] += int(event.cache == "hit")
+            stats["bytes"] += event.size
+            stats["quota"] += event.quota
+            stats["latency"] += event.latency
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Add the wall time of a block to a phase.
+
+        Args:
+            name: Phase name, such as "paging"
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._phases[name] = self._phases.get(name, 0.0) + elapsed
+
+    @property
+    def phases(self) -> Dict[str, float]:
+        """Seconds spent in each phase."""
+        with self._lock:
+            return dict(self._phases)
+
+    @property
+    def requests(self) -> int:
+        """Number of requests, cache hits included."""
+        return self._total("requests")
+
+    @property
+    def quota(self) -> int:
+        """API quota units charged."""
+        return self._total("quota")
+
+    @property
+    def bytes(self) -> int:
+        """Payload bytes received."""
+        return self._total("bytes")
+
+    def _total(self, field: str) -> Any:
+        with self._lock:
+            return sum(stats[field] for stats in self._endpoints.values())
+
+    def to_frame(self) -> "pd.DataFrame":
+        """
+        Get the request statistics per endpoint.
+
+        Returns:
+            pd.DataFrame: One row per endpoint with requests, errors, cache
+            hits, bytes, quota units and total latency in seconds
+        """
+        import pandas as pd
+
+        with self._lock:
+            data = {k: dict(v) for k, v in self._endpoints.items()}
+        df = pd.DataFrame.from_dict(
+            data, orient="index", columns=list(self.FIELDS)
+        )
+        df.index.name = "endpoint"
+        return df
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get the totals and the phase breakdown.
+
+        Returns:
+            Dict[str, Any]: Totals of every field and seconds per phase
+        """
+        with self._lock:
+            totals = {
+                field: sum(s[field] for s in self._endpoints.values())
+                for field in self.FIELDS
+            }
+        totals["phases"] = self.phases
+        return totals
+
+    def reset(self) -> None:
+        """Forget every recorded event and phase."""
+        with self._lock:
+            self._phases = dict.fromkeys(self.PHASES, 0.0)
+            self._endpoints = {}
+
+    def __repr__(self) -> str:
+        summary = self.summary()
+        phases = ", ".join(
+            "{}={:.3f}s".format(name, seconds)
+            for name, seconds in summary["phases"].items()
+        )
+        return (
+            "Metrics(requests={}, errors={}, cache_hits={}, bytes={}, "
+            "quota={}, phases: {})".format(
+                summary["requests"],
+                summary["errors"],
+                summary["cache_hits"],
+                summary["bytes"],
+                summary["quota"],
+                phases,
+            )
+        )
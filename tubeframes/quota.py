@@ -0,0 +1,191 @@
+from typing import Dict, Optional
+import json
+import os
+import threading
+import time
+
+from tubeframes.config.constants import (
+    QUOTA_COSTS,
+    DEFAULT_DAILY_QUOTA,
+    QUOTA_RESET_UTC_OFFSET,
+)
+from tubeframes.ratelimit import RateLimiter
+
+
+def estimate_quota(
+    calls: Dict[str, int], costs: Optional[Dict[str, int]] = None
+) -> int:
+    """
+    Estimate the quota units of a set of calls.
+
+    Args:
+        calls: Number of calls per endpoint
+        costs: Unit cost per endpoint, the API defaults if None
+
+    Returns:
+        int: Total quota units
+    """
+    if costs is None:
+        costs = QUOTA_COSTS
+    return sum(costs.get(resource, 1) * n for resource, n in calls.items())
+
+
+class QuotaBudgetExceeded(Exception):
+    """Raised when a call would exceed the configured quota budget."""
+
+
+class QuotaScheduler:
+    """
+    Quota accounting and pacing for YouTube Data API calls.
+
+    Every call is charged the unit cost of its endpoint (100 for
+    search.list, 1 for videos.list, ...). Calls that would exceed the daily
+    budget are refused with QuotaBudgetExceeded, and an optional per-minute
+    budget paces calls with a token bucket. Expensive calls (cost above 1)
+    are also refused when they would eat into ``enrichment_reserve``, so
+    that cheap statistics calls for results already found can still run
+    when the budget is tight.
+    """
+
+    def __init__(
+        self,
+        daily_budget: int = DEFAULT_DAILY_QUOTA,
+        per_minute: Optional[int] = None,
+        costs: Optional[Dict[str, int]] = None,
+        enrichment_reserve: int = 0,
+        path: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            daily_budget: Units that may be spent per quota day
+            per_minute: Units that may be spent per minute, or None
+            costs: Unit cost per endpoint, merged over the defaults
+            enrichment_reserve: Units kept for calls costing 1 unit
+            path: JSON file keeping the units spent today, so the daily
+                budget holds across runs
+        """
+        self._costs = dict(QUOTA_COSTS)
+        if costs is not None:
+            self._costs.update(costs)
+        self._daily_budget = daily_budget
+        self._enrichment_reserve = enrichment_reserve
+        self._path = path
+        self._lock = threading.Lock()
+        self._limiter = RateLimiter(
+            per_minute / 60.0 if per_minute else None, burst=per_minute or 1
+        )
+        self._day = self._quota_day()
+        self._used = 0
+        self._load()
+
+    @staticmethod
+    def _quota_day() -> int:
+        """Number of the current quota day."""
+        return int((time.time() + QUOTA_RESET_UTC_OFFSET) // 86400)
+
+    def _load(self) -> None:
+        """Read the units spent today from the state file."""
+        if self._path is None:
+            return
+        try:
+            with open(self._path, "r", encoding="utf-8") as fh:
+                state = json.load(fh)
+        except (OSError, ValueError):
+            return
+        if state.get("day") == self._day:
+            self._used = int(state.get("used", 0))
+
+    def _save(self) -> None:
+        """Write the units spent today to the state file."""
+        if self._path is None:
+            return
+        tmp_path = self._path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump({"day": self._day, "used": self._used}, fh)
+        os.replace(tmp_path, self._path)
+
+    def cost(self, resource: str) -> int:
+        """
+        Get the unit cost of one call.
+
+        Args:
+            resource: API resource name
+
+        Returns:
+            int: Quota units charged per call
+        """
+        return self._costs.get(resource, 1)
+
+    def estimate(self, calls: Dict[str, int]) -> int:
+        """
+        Estimate the cost of a job without making any call.
+
+        Args:
+            calls: Number of calls per endpoint
+
+        Returns:
+            int: Total quota units
+        """
+        return estimate_quota(calls, self._costs)
+
+    @property
+    def used(self) -> int:
+        """Units spent in the current quota day."""
+        with self._lock:
+            self._roll_day()
+            return self._used
+
+    @property
+    def remaining(self) -> int:
+        """Units left in the current quota day."""
+        return max(0, self._daily_budget - self.used)
+
+    def _roll_day(self) -> None:
+        day = self._quota_day()
+        if day != self._day:
+            self._day = day
+            self._used = 0
+
+    def reserve(self, resource: str) -> float:
+        """
+        Charge one call without blocking.
+
+        Args:
+            resource: API resource name
+
+        Returns:
+            float: Seconds to wait before making the call
+
+        Raises:
+            QuotaBudgetExceeded: If the call does not fit in the budget
+        """
+        cost = self.cost(resource)
+        with self._lock:
+            self._roll_day()
+            remaining = self._daily_budget - self._used
+            if cost > 1:
+                remaining -= self._enrichment_reserve
+            if cost > remaining:
+                raise QuotaBudgetExceeded(
+                    f"A {resource} call costs {cost} units but only "
+                    f"{max(0, remaining)} are available"
+                )
+            self._used += cost
+            self._save()
+        return self._limiter.reserve(cost)
+
+    def acquire(self, resource: str) -> None:
+        """
+        Charge one call, waiting for the per-minute budget if needed.
+
+        Args:
+            resource: API resource name
+
+        Raises:
+            QuotaBudgetExceeded: If the call does not fit in the budget
+        """
+        wait = self.reserve(resource)
+        if wait > 0:
+            time.sleep(wait)
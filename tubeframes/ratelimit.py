@@ -0,0 +1,152 @@
+from typing import Optional
+from collections import deque
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how often calls may start.
+
+    A limiter with a rate of None never waits.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: int = 1) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Maximum sustained number of calls per second, or None
+            burst: Number of calls that may start back to back
+        """
+        self._rate = rate
+        self._burst = max(1, burst)
+        self._tokens = float(self._burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Current number of calls allowed per second."""
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate: Optional[float]) -> None:
+        with self._lock:
+            if self._rate is not None:
+                self._refill(time.monotonic())
+            else:
+                self._tokens = float(self._burst)
+                self._updated = time.monotonic()
+            self._rate = rate
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+
+    def reserve(self, amount: float = 1) -> float:
+        """
+        Take tokens without blocking.
+
+        Args:
+            amount: Number of tokens the call consumes
+
+        Returns:
+            float: Seconds the caller must wait before starting the call
+        """
+        if self._rate is None:
+            return 0.0
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= amount
+            return -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+    def acquire(self, amount: float = 1) -> None:
+        """
+        Block until a call is allowed to start.
+
+        Args:
+            amount: Number of tokens the call consumes
+        """
+        wait = self.reserve(amount)
+        if wait > 0:
+            time.sleep(wait)
+
+
+class AdaptiveThrottle:
+    """
+    Request pacing that adapts to throttling signals from the server.
+
+    Requests are unlimited until the server reports throttling. The
+    allowed rate is then cut to a fraction of the recently observed rate
+    and raised again additively after each successful request, until the
+    limit is lifted altogether.
+    """
+
+    def __init__(
+        self,
+        min_rate: float = 0.5,
+        max_rate: float = 100.0,
+        decrease: float = 0.5,
+        increase: float = 0.1,
+    ) -> None:
+        """
+        Initialize the throttle.
+
+        Args:
+            min_rate: Lowest rate in requests per second
+            max_rate: Rate above which the limit is lifted
+            decrease: Factor applied to the rate on each throttling signal
+            increase: Requests per second added after each success
+        """
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._decrease = decrease
+        self._increase = increase
+        self._limiter = RateLimiter()
+        self._starts = deque(maxlen=32)
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Current number of requests allowed per second, None if unlimited."""
+        return self._limiter.rate
+
+    def reserve(self) -> float:
+        """
+        Register a request start without blocking.
+
+        Returns:
+            float: Seconds to wait before starting the request
+        """
+        wait = self._limiter.reserve()
+        with self._lock:
+            self._starts.append(time.monotonic() + wait)
+        return wait
+
+    def _observed_rate(self) -> float:
+        """Rate of the recent request starts, max_rate if unknown."""
+        if len(self._starts) < 2:
+            return self._max_rate
+        elapsed = self._starts[-1] - self._starts[0]
+        if elapsed <= 0:
+            return self._max_rate
+        return (len(self._starts) - 1) / elapsed
+
+    def throttled(self) -> None:
+        """Slow down after the server reported throttling."""
+        with self._lock:
+            rate = self._limiter.rate
+            if rate is None:
+                rate = min(self._observed_rate(), self._max_rate)
+            self._limiter.rate = max(self._min_rate, rate * self._decrease)
+
+    def succeeded(self) -> None:
+        """Speed up again after a successful request."""
+        with self._lock:
+            rate = self._limiter.rate
+            if rate is None:
+                return
+            rate += self._increase
+            self._limiter.rate = None if rate >= self._max_rate else rate
@@ -0,0 +1,180 @@
+from typing import Optional, Set
+from email.utils import parsedate_to_datetime
+import random
+import time
+from googleapiclient.errors import HttpError
+
+from tubeframes.ratelimit import AdaptiveThrottle
+
+
+class QuotaExceededError(HttpError):
+    """Raised when the API reports that the daily quota is exhausted."""
+
+
+def error_reasons(error: HttpError) -> Set[str]:
+    """
+    Get the reasons reported in an API error body.
+
+    Args:
+        error: Error raised for an API response
+
+    Returns:
+        Set[str]: Reasons such as "quotaExceeded" or "rateLimitExceeded"
+    """
+    details = getattr(error, "error_details", None)
+    if not isinstance(details, list):
+        return set()
+    return {
+        detail["reason"]
+        for detail in details
+        if isinstance(detail, dict) and "reason" in detail
+    }
+
+
+def retry_after(error: HttpError) -> Optional[float]:
+    """
+    Read the Retry-After header of an API error.
+
+    Args:
+        error: Error raised for an API response
+
+    Returns:
+        Optional[float]: Seconds to wait, None if the header is missing
+    """
+    value = error.resp.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Retry rules shared by the sync and async clients.
+
+    Transient failures (HTTP 429 and 5xx, rate-limit reasons, connection
+    errors and timeouts) are retried with exponential backoff and full
+    jitter, or after the delay given by Retry-After. ``quotaExceeded`` is
+    not retried: waiting does not help until the quota resets, so a
+    QuotaExceededError is raised at once. With ``adaptive`` enabled,
+    throttling responses also lower the request rate of the client.
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+    QUOTA_REASONS = {"quotaExceeded", "dailyLimitExceeded"}
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        backoff: float = 1.0,
+        max_backoff: float = 64.0,
+        jitter: bool = True,
+        adaptive: bool = True,
+    ) -> None:
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_retries: Maximum number of retries per request
+            backoff: Base delay in seconds, doubled on every retry
+            max_backoff: Maximum delay in seconds
+            jitter: Whether to draw each delay uniformly below its cap
+            adaptive: Whether to slow down when throttling is detected
+        """
+        self.max_retries = max_retries
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._jitter = jitter
+        self.throttle = AdaptiveThrottle() if adaptive else None
+
+    def delay(self, attempt: int, after: Optional[float] = None) -> float:
+        """
+        Get the delay before a retry.
+
+        Args:
+            attempt: Number of the failed attempt, starting at 0
+            after: Delay requested by the server, if any
+
+        Returns:
+            float: Seconds to wait
+        """
+        if after is not None:
+            return min(after, self._max_backoff)
+        cap = min(self._max_backoff, self._backoff * 2 ** attempt)
+        return random.uniform(0, cap) if self._jitter else cap
+
+    def before_request(self) -> float:
+        """
+        Register a request start.
+
+        Returns:
+            float: Seconds to wait before sending the request
+        """
+        if self.throttle is None:
+            return 0.0
+        return self.throttle.reserve()
+
+    def on_success(self) -> None:
+        """Register a successful response."""
+        if self.throttle is not None:
+            self.throttle.succeeded()
+
+    def on_http_error(self, error: HttpError, attempt: int) -> float:
+        """
+        Decide whether an API error is retried.
+
+        Must be called from the ``except`` block handling the error.
+
+        Args:
+            error: Error raised for an API response
+            attempt: Number of the failed attempt, starting at 0
+
+        Returns:
+            float: Seconds to wait before retrying
+
+        Raises:
+            QuotaExceededError: If the daily quota is exhausted
+            HttpError: If the error is not retried
+        """
+        reasons = error_reasons(error)
+        if reasons & self.QUOTA_REASONS:
+            raise QuotaExceededError(
+                error.resp, error.content, uri=error.uri
+            ) from error
+
+        status = error.resp.status
+        throttled = status == 429 or bool(reasons & self.RATE_LIMIT_REASONS)
+        if not throttled and status not in self.RETRY_STATUSES:
+            raise error
+        if throttled and self.throttle is not None:
+            self.throttle.throttled()
+        if attempt >= self.max_retries:
+            raise error
+        return self.delay(attempt, retry_after(error))
+
+    def on_transport_error(self, error: Exception, attempt: int) -> float:
+        """
+        Decide whether a connection error or timeout is retried.
+
+        Must be called from the ``except`` block handling the error.
+
+        Args:
+            error: Connection error or timeout
+            attempt: Number of the failed attempt, starting at 0
+
+        Returns:
+            float: Seconds to wait before retrying
+
+        Raises:
+            Exception: The original error once retries are exhausted
+        """
+        if attempt >= self.max_retries:
+            raise error
+        return self.delay(attempt)
@@ -1,18 +1,43 @@
-from typing import List, Dict, Optional
-import time
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import requests
 import pandas as pd
 from googleapiclient.errors import HttpError
 
 
+from tubeframes.cache import TranscriptCache
+from tubeframes.config.constants import (
+    VIDEO_SEARCH_COLUMNS,
+    CONTENT_DETAILS_COLUMNS,
+    CHANNEL_SEARCH_COLUMNS,
+    CATEGORICAL_COLUMNS,
+    CAPTION_FORMATS,
+    DEFAULT_TERM_WORKERS,
+    DEFAULT_THUMBNAIL_WORKERS,
+    TERMS_COLUMN,
+)
+from tubeframes.fields import search_fields, select_columns, statistics_fields
+from tubeframes.metrics import Metrics, RequestEvent
+from tubeframes.quota import QuotaBudgetExceeded, estimate_quota
+from tubeframes.retry import QuotaExceededError
+from tubeframes.sink import ParquetSink
+from tubeframes.client import TubeFramesClient, get_default_client
+from tubeframes.thumbnails import ThumbnailStore
 from tubeframes.utils import (
     get_dev_key,
-    create_tubeframes_client,
-    get_video_captions,
-    get_video_statistics,
+    get_videos_captions,
+    get_videos_caption_segments,
+    get_videos_statistics,
+    merge_statistics,
     process_thumbnails,
-    create_df_from_items,
+    FrameBuilder,
+    CaptionTable,
+    join_captions,
 )
+from tubeframes.where import CAPTION_COLUMNS, Condition, Where
+
+logger = logging.getLogger(__name__)
 
 
 class Search:
@@ -28,6 +53,17 @@ class Search:
         accepted_caption_lang: Optional[List[str]] = None,
         item_type: str = "video",
         developer_key: Optional[str] = None,
+        client: Optional[TubeFramesClient] = None,
+        caption_workers: int = 1,
+        caption_rate_limit: Optional[float] = None,
+        transcript_cache: Optional[TranscriptCache] = None,
+        lazy: bool = False,
+        dtype_backend: str = "numpy_nullable",
+        caption_format: str = "joined",
+        columns: Optional[List[str]] = None,
+        where: Optional[List[Condition]] = None,
+        keep_raw: bool = True,
+        content_details: bool = False,
     ) -> None:
         """
         Initialize the Search class.
@@ -39,15 +75,526 @@ class Search:
             accepted_caption_lang: List of accepted languages for captions
             item_type: Type of item to search for ("video" or "channel")
             developer_key: YouTube API developer key
+            client: Shared API client, reused across searches if None
+            caption_workers: Number of captions fetched concurrently
+            caption_rate_limit: Maximum caption fetches started per second
+            transcript_cache: Local store of previously fetched transcripts
+            lazy: Whether to wait for the first access to ``raw`` or ``df``
+                before searching. Use it together with ``iter_pages`` or
+                ``iter_rows`` to stream results without building a frame.
+            dtype_backend: "numpy_nullable" for pandas nullable dtypes or
+                "pyarrow" for an Arrow-backed DataFrame
+            caption_format: "joined" for one caption string per video in
+                ``df``, or "segments" to keep timed segments in the separate
+                ``captions`` table
+            columns: Output columns to keep, all if None. Only the API
+                fields behind them are requested, and statistics are not
+                requested at all without a count column. The ID column,
+                and the caption column when captions are requested, are
+                always kept.
+            where: Conditions every result meets, as ``(column, operator,
+                value)`` or ``(column, callable)`` tuples. Each one runs at
+                the earliest stage that can check it: snippet conditions
+                before statistics are requested, and count conditions
+                before captions are fetched.
+            keep_raw: Whether ``raw`` keeps the full result pages. If
+                False, each page is released once its rows are parsed and
+                ``raw`` only keeps the page metadata, which saves memory
+                in long-running processes holding many searches.
+            content_details: Whether video results also get the duration
+                in seconds, definition and hasCaption columns. They are
+                requested in the same videos call as the counts.
+
+        Raises:
+            ValueError: If caption_format is not supported, a column is
+                unknown or a condition is invalid
         """
+        if caption_format not in CAPTION_FORMATS:
+            raise ValueError(
+                "caption_format must be one of {}".format(CAPTION_FORMATS)
+            )
         if accepted_caption_lang is None:
             accepted_caption_lang = ["pt", "en"]
         self._accepted_caption_lang = accepted_caption_lang
-        self._developer_key = get_dev_key(developer_key)
-        self.raw = self._consolidate_search(term, maxres, item_type)
-        self.df = self._build_dataframe(
-            item_type=item_type, caption=caption
+        self._caption_workers = caption_workers
+        self._caption_rate_limit = caption_rate_limit
+        self._transcript_cache = transcript_cache
+        if client is None:
+            client = get_default_client(get_dev_key(developer_key))
+        self._client = client
+        self._developer_key = client.developer_key
+        self._term = term
+        self._maxres = maxres
+        self._item_type = item_type
+        self._caption = caption
+        self._dtype_backend = dtype_backend
+        self._caption_format = caption_format
+        self._content_details = content_details
+        joined = caption and caption_format == "joined"
+        self._columns = self._select_columns(
+            columns, item_type, joined, content_details
+        )
+        self._where = self._parse_where(
+            where, item_type, joined, content_details
+        )
+        # Columns whose fields are requested: the output columns and the
+        # ones read by the where conditions
+        self._fetch_columns = self._columns
+        if self._columns is not None and self._where:
+            self._fetch_columns = self._select_columns(
+                [name for name, _ in self._columns] + self._where.columns,
+                item_type,
+                joined,
+                content_details,
+            )
+        self._terms = None
+        self._term_workers = DEFAULT_TERM_WORKERS
+        self._keep_raw = keep_raw
+        self._raw = None
+        self._df = None
+        self._captions = None
+        self._caption_text = None
+        self.metrics = Metrics()
+        if not lazy:
+            self._load()
+
+    @classmethod
+    def many(
+        cls,
+        terms: List[str],
+        term_workers: int = DEFAULT_TERM_WORKERS,
+        lazy: bool = False,
+        **kwargs
+    ) -> "Search":
+        """
+        Search several terms, enriching every result only once.
+
+        Terms are paged concurrently and their results merged by ID, in
+        term order, before statistics and captions are requested once per
+        unique video. The ``terms`` column lists the terms that found each
+        result. ``maxres`` applies to each term.
+
+        Args:
+            terms: YouTube search terms
+            term_workers: Number of terms paged concurrently
+            lazy: Whether to wait for the first access to ``raw`` or ``df``
+            **kwargs: Other arguments of Search
+
+        Returns:
+            Search: Search over every term, with ``raw`` holding the result
+            pages keyed by term
+
+        Raises:
+            ValueError: If no term is given
+        """
+        terms = list(dict.fromkeys(terms))
+        if not terms:
+            raise ValueError("At least one search term is required")
+        search = cls(terms[0], lazy=True, **kwargs)
+        search._terms = terms
+        search._term_workers = term_workers
+        if search._columns is not None:
+            search._columns = search._columns + [TERMS_COLUMN]
+        if not lazy:
+            search._load()
+        return search
+
+    @property
+    def raw(self) -> Union[List[Dict], Dict[str, List[Dict]]]:
+        """
+        Search result pages, fetched on first access in lazy mode. Pages
+        are keyed by term for searches created with ``many``, and hold no
+        items with ``keep_raw=False``.
+        """
+        if self._raw is None:
+            self._load()
+        return self._raw
+
+    @property
+    def df(self) -> Optional[pd.DataFrame]:
+        """Search results DataFrame, built on first access in lazy mode."""
+        if self._raw is None:
+            self._load()
+        return self._df
+
+    @property
+    def captions(self) -> Optional[pd.DataFrame]:
+        """
+        Caption segments with the columns videoId, lang, start, duration
+        and text, one row per segment. None unless captions are requested
+        with ``caption_format="segments"``.
+        """
+        if self._raw is None:
+            self._load()
+        return self._captions
+
+    @property
+    def caption_text(self) -> Optional[pd.Series]:
+        """Caption text per videoId, joined from ``captions`` when read."""
+        if self._caption_text is None and self.captions is not None:
+            self._caption_text = join_captions(self.captions)
+        return self._caption_text
+
+    def _emit(self, event: RequestEvent) -> None:
+        """
+        Report a request to the client hooks and to ``metrics``.
+
+        Events reach ``metrics`` per call rather than through a hook
+        registered on the client, so instances sharing a client only
+        record their own requests.
+        """
+        self._client.emit(event, self.metrics)
+
+    def _load(self) -> None:
+        """Fetch every page and build the DataFrame."""
+        if self._terms is None:
+            pages = self._iter_search(
+                self._term, self._maxres, self._item_type
+            )
+            self._raw = list(pages) if self._keep_raw else []
+        else:
+            pages = self._search_terms()
+            self._raw = dict(pages) if self._keep_raw else {}
+        if self._keep_raw:
+            pages = self._raw if self._terms is None else self._raw.items()
+        else:
+            # Each page is released once parsed
+            pages = self._compact_pages(pages)
+        caption_table = None
+        if self._caption and self._caption_format == "segments":
+            caption_table = CaptionTable()
+        self._df = self._build_dataframe(
+            pages,
+            item_type=self._item_type,
+            caption=self._caption,
+            caption_table=caption_table,
+        )
+        if caption_table is not None:
+            with self.metrics.phase("frame"):
+                self._captions = caption_table.to_frame(self._dtype_backend)
+
+    def _compact_pages(self, pages: Iterable) -> Iterator:
+        """
+        Pass result pages on, keeping only their metadata in ``raw``.
+
+        Args:
+            pages: Result pages, or (term, pages) pairs of a multi-term
+                search
+
+        Yields:
+            Result pages or (term, pages) pairs, unchanged
+        """
+
+        def compact(search_req: Dict) -> Dict:
+            return {k: v for k, v in search_req.items() if k != "items"}
+
+        for page in pages:
+            yield page
+            if self._terms is None:
+                self._raw.append(compact(page))
+            else:
+                term, term_pages = page
+                self._raw[term] = [compact(p) for p in term_pages]
+
+    def iter_pages(self) -> Iterator[List[Dict]]:
+        """
+        Search page by page, yielding enriched rows as each page arrives.
+
+        Pages are requested only as iteration proceeds and are not kept, so
+        memory stays flat however many results are requested. Each call
+        runs the search again; ``raw`` and ``df`` are not affected. For
+        searches created with ``many``, every term is paged first and the
+        unique results are then enriched and yielded 50 at a time.
+
+        Yields:
+            List[Dict]: Rows of one page, with statistics and captions
+
+        Raises:
+            ValueError: If captions are requested as segments, which only
+                ``captions`` holds
+        """
+        self._check_streamable()
+        id_key = self._id_key(self._item_type)
+        if id_key is None:
+            return
+
+        if self._terms is None:
+            pages = self._iter_search(
+                self._term, self._maxres, self._item_type
+            )
+        else:
+            pages = self._search_terms()
+        for items_data in self._row_batches(pages, id_key):
+            if self._item_type == "video":
+                items_data = self._add_video_details(
+                    items_data, self._caption
+                )
+            yield items_data
+
+    def iter_rows(self) -> Iterator[Dict]:
+        """
+        Search page by page, yielding enriched rows one at a time.
+
+        Yields:
+            Dict: One row, with statistics and captions
+        """
+        for items_data in self.iter_pages():
+            for video_info in items_data:
+                yield video_info
+
+    def estimate_cost(self) -> int:
+        """
+        Estimate the quota units of the search without making any request.
+
+        The estimate assumes every requested page exists. Cached responses
+        cost nothing, so the actual spend may be lower.
+
+        Returns:
+            int: Quota units for search pages and statistics calls
+        """
+        _, pages = self._page_size(self._maxres)
+        pages *= len(self._terms or [self._term])
+        calls = {"search": pages}
+        if self._item_type == "video" and self._statistics_fields() != "":
+            calls["videos"] = pages
+        scheduler = self._client.scheduler
+        if scheduler is not None:
+            return scheduler.estimate(calls)
+        return estimate_quota(calls)
+
+    @property
+    def columns(self) -> List[Tuple[str, str]]:
+        """Stable output columns and their kinds, used by sinks."""
+        if self._columns is not None:
+            return self._columns
+        columns = self._available_columns(
+            self._item_type, self._content_details
         )
+        if self._terms is not None:
+            return columns + [TERMS_COLUMN]
+        return columns
+
+    def _statistics_fields(self) -> Optional[str]:
+        """
+        Get the partial-response selector of the statistics calls.
+
+        Returns:
+            Optional[str]: None for full statistics, or "" if no count
+            column is selected and no call is needed
+        """
+        columns = self._fetch_columns
+        if columns is None:
+            if not self._content_details:
+                return None
+            columns = self._available_columns("video", True)
+        fields = statistics_fields([name for name, _ in columns])
+        return "" if fields is None else fields
+
+    @staticmethod
+    def _parse_where(
+        where: Optional[List[Condition]],
+        item_type: str = "video",
+        caption: bool = False,
+        content_details: bool = False,
+    ) -> Where:
+        """
+        Parse the where conditions of a search.
+
+        Args:
+            where: Conditions, or None to keep every result
+            item_type: Type of item searched for
+            caption: Whether a caption column is added
+            content_details: Whether video detail columns are added
+
+        Returns:
+            Where: Predicates grouped by stage
+
+        Raises:
+            ValueError: If a condition is invalid, or checks captions that
+                are not joined into rows
+        """
+        available = Search._available_columns(item_type, content_details)
+        parsed = Where(where, available)
+        if parsed.needs("captions") and not caption:
+            raise ValueError(
+                "where conditions on {} need caption=True and "
+                'caption_format="joined"'.format(CAPTION_COLUMNS[0])
+            )
+        return parsed
+
+    @classmethod
+    def _select_columns(
+        cls,
+        columns: Optional[List[str]],
+        item_type: str = "video",
+        caption: bool = False,
+        content_details: bool = False,
+    ) -> Optional[List[Tuple[str, str]]]:
+        """
+        Select the requested output columns.
+
+        Args:
+            columns: Requested column names, or None for all columns
+            item_type: Type of item searched for
+            caption: Whether a caption column is added
+            content_details: Whether video detail columns are added
+
+        Returns:
+            Optional[List[Tuple[str, str]]]: Selected columns and kinds, None
+            if every column is kept
+
+        Raises:
+            ValueError: If a column is unknown
+        """
+        if columns is None:
+            return None
+        available = cls._available_columns(item_type, content_details)
+        if item_type == "video":
+            required = ["videoId"] + (["video_caption"] if caption else [])
+        else:
+            required = [cls._id_key(item_type)]
+        return select_columns(columns, available, required)
+
+    @staticmethod
+    def _available_columns(
+        item_type: str = "video", content_details: bool = False
+    ) -> List[Tuple[str, str]]:
+        """
+        Get every output column of an item type and their kinds.
+
+        Args:
+            item_type: Type of item searched for
+            content_details: Whether video detail columns are added
+
+        Returns:
+            List[Tuple[str, str]]: Column names and kinds
+        """
+        if item_type != "video":
+            return CHANNEL_SEARCH_COLUMNS
+        if content_details:
+            return VIDEO_SEARCH_COLUMNS + CONTENT_DETAILS_COLUMNS
+        return VIDEO_SEARCH_COLUMNS
+
+    def write_to(self, sink) -> int:
+        """
+        Stream enriched rows into a sink while paging proceeds.
+
+        Only searches created with ``lazy=True`` whose results were not
+        loaded yet can be streamed; write ``df`` otherwise, rather than
+        running the search a second time.
+
+        Args:
+            sink: Object with a ``write_rows(rows)`` method, such as a
+                ParquetSink or ArrowSink built with ``self.columns``
+
+        Returns:
+            int: Number of rows written
+
+        Raises:
+            ValueError: If the results are already loaded
+        """
+        self._check_unloaded()
+        rows_written = 0
+        for items_data in self.iter_pages():
+            sink.write_rows(items_data)
+            rows_written += len(items_data)
+        return rows_written
+
+    def to_parquet(self, path: str, **kwargs) -> str:
+        """
+        Stream enriched rows into a Parquet file or dataset directory.
+
+        Like ``write_to``, this requires a lazy search not loaded yet.
+
+        Args:
+            path: Output file, or a directory to add a new part file to
+            **kwargs: Extra arguments for ParquetSink
+
+        Returns:
+            str: Path of the written file
+
+        Raises:
+            ValueError: If the results are already loaded
+        """
+        self._check_unloaded()
+        self._check_streamable()
+        with ParquetSink(path, self.columns, **kwargs) as sink:
+            self.write_to(sink)
+        return sink.path
+
+    def _check_streamable(self) -> None:
+        """Refuse to stream caption segments, which rows cannot carry."""
+        if self._caption and self._caption_format == "segments":
+            raise ValueError(
+                'caption_format="segments" cannot be streamed; read the '
+                "segments from captions, or stream joined captions"
+            )
+
+    def _check_unloaded(self) -> None:
+        """Refuse to stream results that are already held in memory."""
+        if self._raw is not None:
+            raise ValueError(
+                "Results are already loaded; write df, or create the "
+                "Search with lazy=True to stream them"
+            )
+
+    def download_thumbnails(
+        self,
+        store: Optional[ThumbnailStore] = None,
+        workers: int = DEFAULT_THUMBNAIL_WORKERS,
+    ) -> pd.DataFrame:
+        """
+        Download the thumbnails of the result videos.
+
+        Thumbnails are fetched concurrently over the pooled session of the
+        client, in the best available resolution, and recorded in
+        ``metrics``. Videos already in the store are skipped.
+
+        Args:
+            store: Content-addressed thumbnail store, the default store in
+                the tubeframes cache dir if None
+            workers: Number of thumbnails downloaded concurrently
+
+        Returns:
+            pd.DataFrame: One row per video with the columns videoId,
+            status, tier, sha256, size and path
+
+        Raises:
+            ValueError: If the search is not a video search
+        """
+        if self._item_type != "video":
+            raise ValueError("Thumbnails are downloaded for videos only")
+        df = self.df
+        video_ids = [] if df is None else list(df.index)
+        own_store = store is None
+        if own_store:
+            store = ThumbnailStore()
+        try:
+            return store.download(
+                video_ids,
+                self._client.session,
+                workers,
+                hook=self._emit,
+            )
+        finally:
+            if own_store:
+                store.close()
+
+    @classmethod
+    def _page_size(cls, maxres: int) -> Tuple[int, int]:
+        """
+        Split the requested number of results into pages.
+
+        Args:
+            maxres: Maximum number of results
+
+        Returns:
+            Tuple[int, int]: Results per page and number of pages
+        """
+        if maxres <= cls.DEFAULT_MAX_RES:
+            return maxres, 1
+        pages = -(-maxres // cls.DEFAULT_MAX_RES)
+        return cls.DEFAULT_MAX_RES, pages
 
     def _consolidate_search(
         self, term: str, maxres: int, item_type: str
@@ -63,27 +610,97 @@ class Search:
         Returns:
             List[Dict]: List of search result pages
         """
-        if maxres <= self.DEFAULT_MAX_RES:
-            results = maxres
-            maxres = 0
-        else:
-            results = self.DEFAULT_MAX_RES
-            maxres -= self.DEFAULT_MAX_RES
+        return list(self._iter_search(term, maxres, item_type))
+
+    def _iter_search(
+        self, term: str, maxres: int, item_type: str
+    ) -> Iterator[Dict]:
+        """
+        Request search result pages one at a time.
+
+        Args:
+            term: Search term
+            maxres: Maximum number of results
+            item_type: Type of item to search for
+
+        Yields:
+            Dict: Search result page
+        """
+        results, pages = self._page_size(maxres)
 
         search_list = self._search_from_term(term, results, item_type)
-        consolidated_search = [search_list]
-        while "nextPageToken" in search_list.keys() and maxres > 0:
-            time.sleep(0.1)  # Avoid request overload
-            consolidated_search.append(
-                self._search_from_term(
+        yield search_list
+        pages -= 1
+        while "nextPageToken" in search_list.keys() and pages > 0:
+            try:
+                search_list = self._search_from_term(
                     term,
                     results,
                     item_type=item_type,
                     page_token=search_list["nextPageToken"],
                 )
+            except (QuotaExceededError, QuotaBudgetExceeded) as e:
+                # Keep the remaining budget for the pages already found
+                logger.warning("Stopping search early: %s", e)
+                return
+            yield search_list
+            pages -= 1
+
+    def _search_terms(self) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        Page every term of a multi-term search concurrently.
+
+        Terms whose search fails are logged and skipped. Once the quota is
+        exhausted, the terms already paged are kept and the rest dropped.
+
+        Yields:
+            Tuple[str, List[Dict]]: Term and its result pages, in term order
+
+        Raises:
+            QuotaExceededError: If the quota is exhausted before any term
+            QuotaBudgetExceeded: If the scheduler refuses the first term
+        """
+        done = 0
+        with ThreadPoolExecutor(max_workers=self._term_workers) as executor:
+            results = executor.map(self._search_term, self._terms)
+            try:
+                for term, pages in zip(self._terms, results):
+                    yield term, pages
+                    done += 1
+            except (QuotaExceededError, QuotaBudgetExceeded) as e:
+                if done == 0:
+                    raise
+                logger.warning(
+                    "Stopping search after %d of %d terms: %s",
+                    done,
+                    len(self._terms),
+                    e,
+                )
+
+    def _search_term(self, term: str) -> List[Dict]:
+        """
+        Get the result pages of one term of a multi-term search.
+
+        Args:
+            term: Search term
+
+        Returns:
+            List[Dict]: Search result pages, empty if the search failed
+        """
+        try:
+            return self._consolidate_search(
+                term, self._maxres, self._item_type
             )
-            maxres -= self.DEFAULT_MAX_RES
-        return consolidated_search
+        except (QuotaExceededError, QuotaBudgetExceeded):
+            raise
+        except (
+            KeyError,
+            TypeError,
+            HttpError,
+            requests.RequestException,
+        ) as e:
+            logger.warning("Skipping term %r after failed search: %s", term, e)
+            return []
 
     def _search_from_term(
         self,
@@ -111,20 +728,74 @@ class Search:
             search_list = self._search_request(
                 term, maxres, page_token, item_type
             )
-            # Validate response
-            if isinstance(search_list, dict):
-                expected_keys = [
-                    "kind", "etag", "regionCode", "pageInfo", "items"
-                ]
-                if not set(search_list.keys()).issuperset(set(expected_keys)):
-                    raise KeyError("Missing expected keys in API response")
-            else:
-                raise TypeError("API response is not a dictionary")
+            self._validate_search_response(search_list)
         except HttpError as e:
-            print(f"An HTTP error {e.resp.status} occurred:\n{e.content}")
+            logger.error(
+                "Search for %r failed with HTTP %s: %s",
+                term,
+                e.resp.status,
+                e.reason,
+            )
             raise
         return search_list
 
+    @staticmethod
+    def _validate_search_response(search_list: Dict) -> None:
+        """
+        Validate a search.list response.
+
+        Args:
+            search_list: Search results
+
+        Raises:
+            KeyError: If expected keys are missing
+            TypeError: If the response is not a dictionary
+        """
+        if isinstance(search_list, dict):
+            expected_keys = ["kind", "etag", "regionCode", "pageInfo", "items"]
+            if not set(search_list.keys()).issuperset(set(expected_keys)):
+                raise KeyError("Missing expected keys in API response")
+        else:
+            raise TypeError("API response is not a dictionary")
+
+    @staticmethod
+    def _search_params(
+        term: str,
+        maxres: int = 50,
+        page_token: Optional[str] = None,
+        item_type: str = "video",
+        columns: Optional[List[Tuple[str, str]]] = None,
+    ) -> Dict:
+        """
+        Build the query parameters of a search.list call.
+
+        Args:
+            term: Search term
+            maxres: Maximum number of results
+            page_token: Token for pagination
+            item_type: Type of item to search for
+            columns: Selected output columns; the request is limited to
+                their fields if given
+
+        Returns:
+            Dict: Query parameters
+        """
+        params = {
+            "q": term,
+            "part": "id,snippet",
+            "maxResults": maxres,
+            "pageToken": page_token,
+            "type": item_type,
+            "safeSearch": "none",
+        }
+        id_key = Search._id_key(item_type)
+        if columns is not None and id_key is not None:
+            fields = search_fields([name for name, _ in columns], id_key)
+            params["fields"] = fields
+            if "snippet" not in fields:
+                params["part"] = "id"
+        return params
+
     def _search_request(
         self,
         term: str,
@@ -144,96 +815,321 @@ class Search:
         Returns:
             Dict: Search results
         """
-        tubeframes_client = create_tubeframes_client(self._developer_key)
-        search_response = (
-            tubeframes_client.search()
-            .list(
-                q=term,
-                part="id,snippet",
-                maxResults=maxres,
-                pageToken=page_token,
-                type=item_type,
-                safeSearch="none",
+        with self.metrics.phase("paging"):
+            search_response = self._client.get(
+                "search",
+                self._search_params(
+                    term, maxres, page_token, item_type, self._fetch_columns
+                ),
+                self.metrics,
             )
-            .execute()
-        )
         return search_response
 
+    @staticmethod
+    def _id_key(item_type: str) -> Optional[str]:
+        """
+        Get the ID field of a search item type.
+
+        Args:
+            item_type: Type of item searched for
+
+        Returns:
+            Optional[str]: ID field name or None for unsupported types
+        """
+        return {"video": "videoId", "channel": "channelId"}.get(item_type)
+
+    @staticmethod
+    def _parse_page(search_req: Dict, id_key: str) -> List[Dict]:
+        """
+        Build rows from the snippets of one search result page.
+
+        Args:
+            search_req: Search result page
+            id_key: ID field of the searched item type
+
+        Returns:
+            List[Dict]: One row per valid search item
+        """
+        items_data = []
+        for search_item in search_req["items"]:
+            if not ("id" in search_item and id_key in search_item["id"]):
+                continue
+
+            item_id = search_item["id"][id_key]
+            # Missing when no snippet field was requested
+            snippet = search_item.get("snippet", {})
+
+            # Prepare basic video info from snippet
+            video_info = snippet.copy()
+            video_info[id_key] = item_id
+
+            # Process thumbnails
+            video_info = process_thumbnails(snippet, video_info)
+
+            items_data.append(video_info)
+        return items_data
+
+    def _row_batches(
+        self, pages: Iterable, id_key: str
+    ) -> Iterator[List[Dict]]:
+        """
+        Build rows from search result pages.
+
+        Results repeated on a later page, as happens when the ranking
+        shifts while paging, are dropped before they are enriched.
+
+        Args:
+            pages: Result pages, or (term, pages) pairs of a multi-term
+                search
+            id_key: ID field of the searched item type
+
+        Yields:
+            List[Dict]: Rows of one page, or up to 50 unique rows of a
+            multi-term search
+        """
+        if self._terms is None:
+            seen = set()
+            for search_req in pages:
+                rows = []
+                for item_info in self._parse_page(search_req, id_key):
+                    if item_info[id_key] not in seen:
+                        seen.add(item_info[id_key])
+                        rows.append(item_info)
+                yield self._where.apply(rows, "snippet")
+            return
+
+        rows = self._where.apply(self._merge_terms(pages, id_key), "snippet")
+        for start in range(0, len(rows), self.DEFAULT_MAX_RES):
+            yield rows[start:start + self.DEFAULT_MAX_RES]
+
+    @classmethod
+    def _merge_terms(
+        cls, term_pages: Iterable[Tuple[str, List[Dict]]], id_key: str
+    ) -> List[Dict]:
+        """
+        Merge the results of several terms into one row per ID.
+
+        Args:
+            term_pages: Term and result pages pairs, in term order
+            id_key: ID field of the searched item type
+
+        Returns:
+            List[Dict]: Unique rows in order of first appearance, each with
+            the terms that found it
+        """
+        name = TERMS_COLUMN[0]
+        rows = {}
+        for term, pages in term_pages:
+            for search_req in pages:
+                for item_info in cls._parse_page(search_req, id_key):
+                    known = rows.get(item_info[id_key])
+                    if known is None:
+                        item_info[name] = [term]
+                        rows[item_info[id_key]] = item_info
+                    elif known[name][-1] != term:
+                        known[name].append(term)
+        return list(rows.values())
+
     def _build_dataframe(
-        self, item_type: str = "video", caption: bool = False
+        self,
+        pages: Iterable,
+        item_type: str = "video",
+        caption: bool = False,
+        caption_table: Optional[CaptionTable] = None,
     ) -> Optional[pd.DataFrame]:
         """
         Build a DataFrame from search results.
 
         Args:
+            pages: Result pages, or (term, pages) pairs of a multi-term
+                search
             item_type: Type of item to search for
             caption: Whether to include captions
+            caption_table: Table receiving caption segments instead of a
+                caption column
 
         Returns:
             Optional[pd.DataFrame]: DataFrame with search results or None
         """
-        items_data = []
-        for search_req in self.raw:
-            for search_item in search_req["items"]:
-                try:
-                    if item_type == "video":
-                        id_key = "videoId"
-                    elif item_type == "channel":
-                        id_key = "channelId"
-                    else:
-                        continue
-
-                    if not (
-                        "id" in search_item
-                        and id_key in search_item["id"]
-                        and "snippet" in search_item
-                    ):
-                        continue
-
-                    item_id = search_item["id"][id_key]
-                    snippet = search_item["snippet"]
-
-                    # Prepare basic video info from snippet
-                    video_info = snippet.copy()
-                    video_info[id_key] = item_id
-
-                    # Process thumbnails
-                    video_info = process_thumbnails(snippet, video_info)
-
-                    if item_type == "video":
-                        # Add statistics
-                        item_stats = get_video_statistics(
-                            item_id, self._developer_key
-                        )
-                        video_info.update(item_stats)
-
-                        # Add captions if requested
-                        if caption:
-                            video_caption = get_video_captions(
-                                item_id, self._accepted_caption_lang
-                            )
-                            video_info["video_caption"] = video_caption
-
-                    items_data.append(video_info)
-
-                except (
-                    KeyError,
-                    ValueError,
-                    HttpError,
-                    requests.RequestException,
-                ):
-                    continue
-
-        df = create_df_from_items(items_data)
+        builder = self._frame_builder(
+            item_type, self._dtype_backend, self._columns
+        )
+        id_key = self._id_key(item_type)
+        if id_key is not None:
+            for page_data in self._row_batches(pages, id_key):
+                if item_type == "video":
+                    page_data = self._add_video_details(
+                        page_data, caption, caption_table
+                    )
+                with self.metrics.phase("frame"):
+                    builder.add_rows(page_data)
+
+        with self.metrics.phase("frame"):
+            return self._finalize_dataframe(builder, item_type)
+
+    @classmethod
+    def _frame_builder(
+        cls,
+        item_type: str = "video",
+        dtype_backend: str = "numpy_nullable",
+        columns: Optional[List[Tuple[str, str]]] = None,
+    ) -> FrameBuilder:
+        """
+        Create the column buffers of a result DataFrame.
+
+        Args:
+            item_type: Type of item searched for
+            dtype_backend: "numpy_nullable" or "pyarrow"
+            columns: Selected output columns, every row key if None
+
+        Returns:
+            FrameBuilder: Builder typed for the item type
+        """
+        select = columns is not None
+        if not select:
+            if item_type == "video":
+                columns = VIDEO_SEARCH_COLUMNS
+            else:
+                columns = CHANNEL_SEARCH_COLUMNS
+        # The ID column becomes the index, where categories do not help
+        id_key = cls._id_key(item_type)
+        categorical = [c for c in CATEGORICAL_COLUMNS if c != id_key]
+        return FrameBuilder(columns, categorical, dtype_backend, select)
+
+    @classmethod
+    def _finalize_dataframe(
+        cls, builder: FrameBuilder, item_type: str = "video"
+    ) -> Optional[pd.DataFrame]:
+        """
+        Create the result DataFrame from the buffered rows.
+
+        Args:
+            builder: Column buffers holding the enriched rows
+            item_type: Type of item searched for
+
+        Returns:
+            Optional[pd.DataFrame]: DataFrame with search results or None
+        """
+        df = builder.to_frame()
 
         if not df.empty:
             if item_type == "video":
-                drop_columns = ["likeCount", "viewCount"]
+                drop_columns = [
+                    c for c in ("likeCount", "viewCount") if c in df.columns
+                ]
                 df.dropna(axis=0, how="any", inplace=True, subset=drop_columns)
-                df = df.astype({"likeCount": int, "viewCount": int})
 
-            df.set_index(id_key, inplace=True)
+            df.set_index(cls._id_key(item_type), inplace=True)
             return df
         else:
             print("No results. The DataFrame attribute will be None")
             return None
+
+    def _add_video_details(
+        self,
+        items_data: List[Dict],
+        caption: bool = False,
+        caption_table: Optional[CaptionTable] = None,
+    ) -> List[Dict]:
+        """
+        Add statistics and, optionally, captions to video rows.
+
+        Statistics are requested in batches of up to 50 videos per call,
+        and captions only for the rows kept by the where conditions on
+        counts.
+
+        Args:
+            items_data: List of video rows built from search snippets
+            caption: Whether to include captions
+            caption_table: Table receiving caption segments instead of the
+                ``video_caption`` column
+
+        Returns:
+            List[Dict]: Rows that received statistics
+        """
+        enriched = self._where.apply(
+            self._add_statistics(items_data), "statistics"
+        )
+
+        # Add captions if requested
+        if caption and enriched:
+            with self.metrics.phase("captions"):
+                self._add_captions(enriched, caption_table)
+
+        return self._where.apply(enriched, "captions")
+
+    def _add_statistics(self, items_data: List[Dict]) -> List[Dict]:
+        """
+        Add statistics to video rows.
+
+        With selected columns only the requested counts are fetched, and
+        no call is made when no count column is selected. Videos whose
+        statistics could not be fetched are dropped, the other videos of
+        their batch are kept.
+
+        Args:
+            items_data: List of video rows built from search snippets
+
+        Returns:
+            List[Dict]: Rows that received statistics
+        """
+        fields = self._statistics_fields()
+        if fields == "" or not items_data:
+            return items_data
+
+        video_ids = [video_info["videoId"] for video_info in items_data]
+        try:
+            with self.metrics.phase("statistics"):
+                statistics = get_videos_statistics(
+                    video_ids,
+                    self._developer_key,
+                    self._client,
+                    fields,
+                    self.metrics,
+                )
+        except (QuotaExceededError, QuotaBudgetExceeded) as e:
+            logger.warning(
+                "Dropping %d videos without statistics: %s", len(video_ids), e
+            )
+            return []
+
+        return merge_statistics(items_data, statistics)
+
+    def _add_captions(
+        self,
+        enriched: List[Dict],
+        caption_table: Optional[CaptionTable] = None,
+    ) -> None:
+        """
+        Add captions to video rows.
+
+        Args:
+            enriched: Video rows with statistics
+            caption_table: Table receiving caption segments instead of the
+                ``video_caption`` column
+        """
+        video_ids = [video_info["videoId"] for video_info in enriched]
+        if caption_table is not None:
+            caption_table.add_found(
+                video_ids,
+                get_videos_caption_segments(
+                    video_ids,
+                    self._accepted_caption_lang,
+                    workers=self._caption_workers,
+                    rate_limit=self._caption_rate_limit,
+                    cache=self._transcript_cache,
+                    hook=self._emit,
+                ),
+            )
+            return
+
+        captions = get_videos_captions(
+            video_ids,
+            self._accepted_caption_lang,
+            workers=self._caption_workers,
+            rate_limit=self._caption_rate_limit,
+            cache=self._transcript_cache,
+            hook=self._emit,
+        )
+        for video_info, video_caption in zip(enriched, captions):
+            video_info["video_caption"] = video_caption
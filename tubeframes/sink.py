@@ -0,0 +1,277 @@
+from typing import List, Dict, Any, Optional, Tuple, Union
+import os
+import uuid
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+from tubeframes.config.constants import (
+    DEFAULT_ROW_GROUP_SIZE,
+    DURATION_UNITS,
+    ISO_DURATION_PATTERN,
+)
+
+_ARROW_TYPES = {
+    "string": lambda: pa.string(),
+    "int": lambda: pa.int64(),
+    "timestamp": lambda: pa.timestamp("s", tz="UTC"),
+    "list": lambda: pa.list_(pa.string()),
+    "duration": lambda: pa.int64(),
+    "bool": lambda: pa.bool_(),
+}
+
+# Field metadata marking integer columns parsed from ISO 8601 durations
+_DURATION_METADATA = {b"tubeframes.kind": b"duration"}
+
+
+def arrow_schema(columns: List[Tuple[str, str]]) -> "pa.Schema":
+    """
+    Build an Arrow schema from a list of (column, kind) pairs.
+
+    Args:
+        columns: Column names and kinds ("string", "int", "timestamp",
+            "duration", "bool" or "list" for lists of strings)
+
+    Returns:
+        pa.Schema: Arrow schema with nullable fields. Durations are stored
+        as integer seconds.
+    """
+    _require_pyarrow()
+    return pa.schema(
+        [
+            pa.field(
+                name,
+                _ARROW_TYPES[kind](),
+                metadata=_DURATION_METADATA if kind == "duration" else None,
+            )
+            for name, kind in columns
+        ]
+    )
+
+
+def _duration_seconds(strings: "pa.Array") -> "pa.Array":
+    """
+    Convert ISO 8601 durations to seconds with Arrow compute kernels.
+
+    Each distinct duration is matched once, through a dictionary encoding.
+
+    Args:
+        strings: Duration strings
+
+    Returns:
+        pa.Array: Integer seconds, null for missing or malformed durations
+    """
+    encoded = pc.dictionary_encode(strings)
+    parts = pc.extract_regex(encoded.dictionary, ISO_DURATION_PATTERN)
+    seconds = None
+    for index, factor in enumerate(DURATION_UNITS.values()):
+        digits = pc.struct_field(parts, [index])
+        digits = pc.if_else(pc.equal(digits, ""), "0", digits)
+        term = pc.multiply(pc.cast(digits, pa.int64()), factor)
+        seconds = term if seconds is None else pc.add(seconds, term)
+    return pc.take(seconds, encoded.indices)
+
+
+def _timestamp_seconds(
+    strings: "pa.Array", target: "pa.DataType"
+) -> "pa.Array":
+    """
+    Convert ISO 8601 timestamps to a whole-second timestamp type.
+
+    Timestamps are parsed at nanosecond precision first, so fractional
+    seconds such as ``2022-01-01T00:00:00.500Z`` are accepted and then
+    truncated.
+
+    Args:
+        strings: Timestamp strings
+        target: Timestamp type of the column
+
+    Returns:
+        pa.Array: Timestamps of the target type
+    """
+    parsed = pc.cast(strings, pa.timestamp("ns", tz=target.tz))
+    return pc.cast(parsed, target, safe=False)
+
+
+def rows_to_table(
+    rows: List[Dict[str, Any]], schema: "pa.Schema"
+) -> "pa.Table":
+    """
+    Convert rows into an Arrow table with a fixed schema.
+
+    Columns missing from the schema are dropped and columns missing from
+    the rows are filled with nulls. Counts, flags, ISO 8601 timestamps and
+    durations sent as strings by the API are cast column by column.
+
+    Args:
+        rows: List of row dictionaries
+        schema: Target Arrow schema
+
+    Returns:
+        pa.Table: Table with exactly the schema's columns
+    """
+    _require_pyarrow()
+    arrays = []
+    for field in schema:
+        values = [row.get(field.name) for row in rows]
+        if pa.types.is_string(field.type):
+            arrays.append(pa.array(values, type=pa.string()))
+        elif pa.types.is_list(field.type):
+            arrays.append(pa.array(values, type=field.type))
+        elif field.metadata == _DURATION_METADATA:
+            strings = pa.array(values, type=pa.string())
+            arrays.append(_duration_seconds(strings))
+        elif pa.types.is_timestamp(field.type):
+            strings = pa.array(values, type=pa.string())
+            arrays.append(_timestamp_seconds(strings, field.type))
+        else:
+            values = [None if v is None else str(v) for v in values]
+            strings = pa.array(values, type=pa.string())
+            arrays.append(pc.cast(strings, field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for Parquet and Arrow output: "
+            "pip install tubeframes[parquet]"
+        )
+
+
+class _RowSink:
+    """Buffer rows and write them to an Arrow-based file in batches."""
+
+    def __init__(
+        self,
+        path: str,
+        columns: Union[List[Tuple[str, str]], "pa.Schema"],
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ) -> None:
+        _require_pyarrow()
+        if isinstance(columns, pa.Schema):
+            self.schema = columns
+        else:
+            self.schema = arrow_schema(columns)
+        if os.path.isdir(path):
+            path = os.path.join(
+                path, "part-{}{}".format(uuid.uuid4().hex, self.SUFFIX)
+            )
+        self.path = path
+        self._row_group_size = row_group_size
+        self._buffer = []
+        self._writer = None
+        self.rows_written = 0
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Add rows, writing a batch each time the buffer is full.
+
+        Args:
+            rows: List of row dictionaries
+        """
+        self._buffer.extend(rows)
+        while len(self._buffer) >= self._row_group_size:
+            batch = self._buffer[:self._row_group_size]
+            self._buffer = self._buffer[self._row_group_size:]
+            self._write_table(rows_to_table(batch, self.schema))
+
+    def flush(self) -> None:
+        """Write the buffered rows, even if the batch is not full."""
+        if self._buffer:
+            self._write_table(rows_to_table(self._buffer, self.schema))
+            self._buffer = []
+
+    def _write_table(self, table: "pa.Table") -> None:
+        if self._writer is None:
+            self._writer = self._open()
+        self._writer.write_table(table)
+        self.rows_written += table.num_rows
+
+    def _open(self):
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Flush the buffered rows and close the file."""
+        self.flush()
+        if self._writer is None:
+            self._writer = self._open()
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ParquetSink(_RowSink):
+    """
+    Write rows incrementally to a Parquet file, one row group per batch.
+
+    If ``path`` is an existing directory, a new uniquely named part file is
+    created in it, so every run appends to a dataset readable with
+    ``pandas.read_parquet(directory)`` without rewriting earlier files.
+    """
+
+    SUFFIX = ".parquet"
+
+    def __init__(
+        self,
+        path: str,
+        columns: Union[List[Tuple[str, str]], "pa.Schema"],
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        compression: Optional[str] = "zstd",
+    ) -> None:
+        """
+        Initialize the Parquet sink.
+
+        Args:
+            path: Output file, or a dataset directory
+            columns: Column names and kinds, or an Arrow schema
+            row_group_size: Number of rows per row group
+            compression: Parquet compression codec
+        """
+        super().__init__(path, columns, row_group_size)
+        self._compression = compression
+
+    def _open(self):
+        return pq.ParquetWriter(
+            self.path, self.schema, compression=self._compression
+        )
+
+
+class ArrowSink(_RowSink):
+    """
+    Write rows incrementally to an Arrow IPC file, one record batch per
+    batch of rows.
+
+    If ``path`` is an existing directory, a new uniquely named part file is
+    created in it.
+    """
+
+    SUFFIX = ".arrow"
+
+    def __init__(
+        self,
+        path: str,
+        columns: Union[List[Tuple[str, str]], "pa.Schema"],
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ) -> None:
+        """
+        Initialize the Arrow IPC sink.
+
+        Args:
+            path: Output file, or a dataset directory
+            columns: Column names and kinds, or an Arrow schema
+            row_group_size: Number of rows per record batch
+        """
+        super().__init__(path, columns, row_group_size)
+
+    def _open(self):
+        return pa.ipc.new_file(self.path, self.schema)
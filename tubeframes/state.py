@@ -0,0 +1,188 @@
+from typing import Dict, Any, FrozenSet, List, Optional, NamedTuple
+import os
+import sqlite3
+import threading
+import time
+
+from tubeframes.config.constants import DEFAULT_CACHE_DIR
+
+
+class ChannelMark(NamedTuple):
+    """What a previous sync saw of one channel."""
+
+    playlist_id: str
+    published_at: Optional[str]
+    video_ids: FrozenSet[str]
+
+
+class ChannelSyncState:
+    """
+    SQLite-backed high-water marks for incremental channel syncs.
+
+    For each channel the store keeps its uploads playlist, the newest
+    ``publishedAt`` up to which every upload was returned, and the IDs of
+    the videos already returned. A later sync stops paging the uploads
+    playlist at the first video older than the mark or known and not
+    newer than it, so only new uploads are fetched. Known videos newer
+    than the mark, returned by a sync capped at ``max_results``, are
+    skipped so the older uploads it left out are fetched next.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """
+        Initialize the sync state.
+
+        Args:
+            path: SQLite file, by default inside the tubeframes cache dir
+        """
+        if path is None:
+            os.makedirs(DEFAULT_CACHE_DIR, exist_ok=True)
+            path = os.path.join(DEFAULT_CACHE_DIR, "sync.sqlite")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS channels ("
+                "channel_id TEXT PRIMARY KEY, playlist_id TEXT NOT NULL, "
+                "published_at TEXT, synced REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS videos ("
+                "channel_id TEXT NOT NULL, video_id TEXT NOT NULL, "
+                "published_at TEXT, PRIMARY KEY (channel_id, video_id))"
+            )
+
+    def get(self, channel_id: str) -> Optional[ChannelMark]:
+        """
+        Read the mark of a channel.
+
+        Args:
+            channel_id: YouTube channel ID
+
+        Returns:
+            Optional[ChannelMark]: Mark of the channel, None if never synced.
+            Only the known videos the stop check can meet are loaded: those
+            not older than the mark, or without ``publishedAt``.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT playlist_id, published_at FROM channels "
+                "WHERE channel_id = ?",
+                (channel_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            query, args = (
+                "SELECT video_id FROM videos WHERE channel_id = ?",
+                (channel_id,),
+            )
+            if row[1] is not None:
+                query += " AND (published_at IS NULL OR published_at >= ?)"
+                args += (row[1],)
+            video_ids = self._conn.execute(query, args).fetchall()
+        return ChannelMark(
+            row[0], row[1], frozenset(video_id for (video_id,) in video_ids)
+        )
+
+    def playlists(self, channel_ids: List[str]) -> Dict[str, str]:
+        """
+        Get the known uploads playlists of several channels.
+
+        Args:
+            channel_ids: YouTube channel IDs
+
+        Returns:
+            Dict[str, str]: Uploads playlist ID keyed by channel ID, for the
+            channels synced before
+        """
+        playlists = {}
+        with self._lock:
+            for channel_id in channel_ids:
+                row = self._conn.execute(
+                    "SELECT playlist_id FROM channels WHERE channel_id = ?",
+                    (channel_id,),
+                ).fetchone()
+                if row is not None:
+                    playlists[channel_id] = row[0]
+        return playlists
+
+    def update(
+        self,
+        channel_id: str,
+        playlist_id: str,
+        videos: List[Dict[str, Any]],
+        complete: bool = True,
+        oldest: Optional[str] = None,
+    ) -> None:
+        """
+        Record the videos returned by a sync.
+
+        Args:
+            channel_id: YouTube channel ID
+            playlist_id: Uploads playlist of the channel
+            videos: Rows with "videoId" and "publishedAt"
+            complete: Whether the sync reached the previous mark or the end
+                of the playlist and delivered every new upload. A sync
+                capped at ``max_results`` leaves older new uploads out, so
+                the mark does not move past them: it stays where it was, or
+                at the oldest upload on a first sync, and the videos are
+                only recorded as known.
+            oldest: publishedAt of the oldest upload the sync paged, which
+                may be missing from ``videos``; the oldest of ``videos`` if
+                None
+        """
+        published = [v["publishedAt"] for v in videos if v.get("publishedAt")]
+        with self._lock:
+            with self._conn:
+                row = self._conn.execute(
+                    "SELECT published_at FROM channels WHERE channel_id = ?",
+                    (channel_id,),
+                ).fetchone()
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO videos "
+                    "(channel_id, video_id, published_at) VALUES (?, ?, ?)",
+                    [
+                        (channel_id, v["videoId"], v.get("publishedAt"))
+                        for v in videos
+                    ],
+                )
+                if complete:
+                    # Uploads returned by earlier capped syncs are now
+                    # contiguous with the mark
+                    (mark,) = self._conn.execute(
+                        "SELECT MAX(published_at) FROM videos "
+                        "WHERE channel_id = ?",
+                        (channel_id,),
+                    ).fetchone()
+                elif row is not None:
+                    mark = row[0]
+                elif oldest is not None:
+                    mark = oldest
+                else:
+                    mark = min(published) if published else None
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO channels "
+                    "(channel_id, playlist_id, published_at, synced) "
+                    "VALUES (?, ?, ?, ?)",
+                    (channel_id, playlist_id, mark, time.time()),
+                )
+
+    def clear(self, channel_id: Optional[str] = None) -> None:
+        """
+        Forget the marks of one channel, or of every channel.
+
+        Args:
+            channel_id: YouTube channel ID, all channels if None
+        """
+        where, args = "", ()
+        if channel_id is not None:
+            where, args = " WHERE channel_id = ?", (channel_id,)
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM channels" + where, args)
+                self._conn.execute("DELETE FROM videos" + where, args)
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
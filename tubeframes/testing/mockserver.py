@@ -0,0 +1,812 @@
+from typing import Dict, Any, List, Optional, Tuple
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import urlparse, parse_qs
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import requests
+import youtube_transcript_api as ytapi
+
+from tubeframes.config.constants import MAX_IDS_PER_REQUEST
+
+# Item layouts recorded from YouTube Data API v3 responses. Generated
+# items copy them and only change IDs, titles, dates and counts.
+RECORDED_SEARCH_ITEM = {
+    "kind": "youtube#searchResult",
+    "etag": "q5k97EMVGxODeKcDgp8gnMu79wM",
+    "id": {"kind": "youtube#video", "videoId": "dQw4w9WgXcQ"},
+    "snippet": {
+        "publishedAt": "2009-10-25T06:57:33Z",
+        "channelId": "UCuAXFkgsw1L7xaCfnd5JJOw",
+        "title": "Rick Astley - Never Gonna Give You Up (Official Video)",
+        "description": "The official video for “Never Gonna Give You Up”",
+        "thumbnails": {
+            "default": {
+                "url": "https://i.ytimg.com/vi/dQw4w9WgXcQ/default.jpg",
+                "width": 120,
+                "height": 90,
+            },
+            "medium": {
+                "url": "https://i.ytimg.com/vi/dQw4w9WgXcQ/mqdefault.jpg",
+                "width": 320,
+                "height": 180,
+            },
+            "high": {
+                "url": "https://i.ytimg.com/vi/dQw4w9WgXcQ/hqdefault.jpg",
+                "width": 480,
+                "height": 360,
+            },
+        },
+        "channelTitle": "Rick Astley",
+        "liveBroadcastContent": "none",
+        "publishTime": "2009-10-25T06:57:33Z",
+    },
+}
+RECORDED_VIDEO_ITEM = {
+    "kind": "youtube#video",
+    "etag": "iTUOHhMY1YuQ4hWu4pN5FCJ9SZw",
+    "id": "dQw4w9WgXcQ",
+    "contentDetails": {
+        "duration": "PT3M33S",
+        "dimension": "2d",
+        "definition": "hd",
+        "caption": "true",
+        "licensedContent": True,
+        "contentRating": {},
+        "projection": "rectangular",
+    },
+    "statistics": {
+        "viewCount": "1623749876",
+        "likeCount": "18439312",
+        "favoriteCount": "0",
+        "commentCount": "2401234",
+    },
+}
+RECORDED_PLAYLIST_ITEM = {
+    "kind": "youtube#playlistItem",
+    "etag": "0AvJ5FvJ3pIPfCxuOq0jSyZRdtQ",
+    "id": "VVV1QVhGa2dzdzFMN3hhQ2ZuZDVKSk93LmRRdzR3OVdnWGNR",
+    "snippet": {
+        "publishedAt": "2009-10-25T06:57:33Z",
+        "channelId": "UCuAXFkgsw1L7xaCfnd5JJOw",
+        "title": "Rick Astley - Never Gonna Give You Up (Official Video)",
+        "description": "The official video for “Never Gonna Give You Up”",
+        "thumbnails": RECORDED_SEARCH_ITEM["snippet"]["thumbnails"],
+        "channelTitle": "Rick Astley",
+        "playlistId": "UUuAXFkgsw1L7xaCfnd5JJOw",
+        "position": 0,
+        "resourceId": {"kind": "youtube#video", "videoId": "dQw4w9WgXcQ"},
+    },
+    "contentDetails": {
+        "videoId": "dQw4w9WgXcQ",
+        "videoPublishedAt": "2009-10-25T06:57:33Z",
+    },
+}
+RECORDED_ACTIVITY_ITEM = {
+    "kind": "youtube#activity",
+    "etag": "vM2N8bLLe9X3mNtQZ2sJm6sp2Xw",
+    "id": "MTUxNTcxMTcyMzQ1ODU0NzI4MzE4MTA5NjA=",
+    "snippet": {
+        "publishedAt": "2009-10-25T06:57:33Z",
+        "channelId": "UCuAXFkgsw1L7xaCfnd5JJOw",
+        "title": "Rick Astley - Never Gonna Give You Up (Official Video)",
+        "description": "The official video for “Never Gonna Give You Up”",
+        "thumbnails": RECORDED_SEARCH_ITEM["snippet"]["thumbnails"],
+        "channelTitle": "Rick Astley",
+        "type": "upload",
+    },
+    "contentDetails": {"upload": {"videoId": "dQw4w9WgXcQ"}},
+}
+RECORDED_TRANSCRIPT_SEGMENT = {
+    "text": "We're no strangers to love",
+    "start": 18.64,
+    "duration": 3.24,
+}
+
+# Error bodies returned by the API for injected failures.
+ERROR_REASONS = {
+    403: "quotaExceeded",
+    429: "rateLimitExceeded",
+    500: "backendError",
+    503: "backendError",
+}
+
+
+def _copy(item: Dict[str, Any]) -> Dict[str, Any]:
+    return json.loads(json.dumps(item))
+
+
+def _merge(tree: Dict[str, Dict], other: Dict[str, Dict]) -> None:
+    for name, children in other.items():
+        _merge(tree.setdefault(name, {}), children)
+
+
+def parse_fields(selector: str) -> Dict[str, Dict]:
+    """
+    Parse a partial-response ``fields`` selector into a tree.
+
+    Args:
+        selector: Selector such as ``"items(id,snippet/title)"``
+
+    Returns:
+        Dict[str, Dict]: Selected names, each with its selected children
+
+    Raises:
+        ValueError: If the selector is malformed
+    """
+    tokens = re.findall(r"[^,/()]+|[,/()]", selector.replace(" ", ""))
+    position = 0
+
+    def parse_list() -> Dict[str, Dict]:
+        nonlocal position
+        tree: Dict[str, Dict] = {}
+        while True:
+            _merge(tree, parse_path())
+            if position < len(tokens) and tokens[position] == ",":
+                position += 1
+                continue
+            return tree
+
+    def parse_path() -> Dict[str, Dict]:
+        nonlocal position
+        if position >= len(tokens) or tokens[position] in ",/()":
+            raise ValueError("Malformed fields selector: " + selector)
+        name = tokens[position]
+        position += 1
+        if position < len(tokens) and tokens[position] == "/":
+            position += 1
+            return {name: parse_path()}
+        if position < len(tokens) and tokens[position] == "(":
+            position += 1
+            children = parse_list()
+            if position >= len(tokens) or tokens[position] != ")":
+                raise ValueError("Malformed fields selector: " + selector)
+            position += 1
+            return {name: children}
+        return {name: {}}
+
+    tree = parse_list()
+    if position != len(tokens):
+        raise ValueError("Malformed fields selector: " + selector)
+    return tree
+
+
+def project_fields(data: Any, tree: Dict[str, Dict]) -> Any:
+    """
+    Keep only the selected fields of a response, like the API does.
+
+    Args:
+        data: Decoded JSON response or part of it
+        tree: Selection returned by parse_fields, everything if empty
+
+    Returns:
+        Any: Projected copy of the data
+    """
+    if not tree:
+        return data
+    if isinstance(data, list):
+        return [project_fields(value, tree) for value in data]
+    if not isinstance(data, dict):
+        return data
+    return {
+        name: project_fields(data[name], children)
+        for name, children in tree.items()
+        if name in data
+    }
+
+
+class Fixtures:
+    """
+    Deterministic API data for the mock server.
+
+    Items follow the layout of recorded API responses. Every search term,
+    channel and video yields the same data on every run, so benchmark
+    results are comparable. Subclass and override the methods to replay
+    other recorded data.
+    """
+
+    EPOCH = datetime(2020, 1, 1)
+
+    def __init__(
+        self,
+        total_results: int = 1000,
+        uploads_per_channel: int = 200,
+        transcript_segments: int = 120,
+        transcript_langs: Tuple[str, ...] = ("en",),
+        disabled_ratio: float = 0.1,
+    ) -> None:
+        """
+        Initialize the fixtures.
+
+        Args:
+            total_results: Results available for every search term
+            uploads_per_channel: Videos in every uploads playlist
+            transcript_segments: Segments in every transcript
+            transcript_langs: Languages of the available transcripts
+            disabled_ratio: Share of videos with transcripts disabled
+        """
+        self.total_results = total_results
+        self.uploads_per_channel = uploads_per_channel
+        self.transcript_segments = transcript_segments
+        self.transcript_langs = transcript_langs
+        self.disabled_ratio = disabled_ratio
+
+    @staticmethod
+    def _number(value: str) -> int:
+        digest = hashlib.md5(value.encode("utf-8")).hexdigest()
+        return int(digest[:8], 16)
+
+    def _timestamp(self, minutes: int) -> str:
+        published = self.EPOCH + timedelta(minutes=minutes)
+        return published.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def video_id(self, seed: str, n: int) -> str:
+        """
+        Get the ID of a generated video.
+
+        Args:
+            seed: Search term or playlist the video belongs to
+            n: Position of the video
+
+        Returns:
+            str: Video ID
+        """
+        return "v{:08x}{:05d}".format(self._number(seed), n % 10 ** 5)
+
+    def search_items(
+        self, term: str, item_type: str, start: int, count: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Get one page of search results.
+
+        Args:
+            term: Search term
+            item_type: "video" or "channel"
+            start: Position of the first result
+            count: Number of results
+
+        Returns:
+            List[Dict[str, Any]]: search.list items
+        """
+        items = []
+        for n in range(start, min(start + count, self.total_results)):
+            item = _copy(RECORDED_SEARCH_ITEM)
+            channel_id = "UC{:022d}".format(self._number(term) % 1000 + n)
+            if item_type == "channel":
+                item["id"] = {
+                    "kind": "youtube#channel",
+                    "channelId": channel_id,
+                }
+            else:
+                item["id"]["videoId"] = self.video_id(term, n)
+            snippet = item["snippet"]
+            snippet["channelId"] = channel_id
+            snippet["channelTitle"] = "Channel {}".format(n % 97)
+            snippet["title"] = "{} result {}".format(term, n)
+            snippet["publishedAt"] = self._timestamp(n)
+            snippet["publishTime"] = snippet["publishedAt"]
+            items.append(item)
+        return items
+
+    def video_item(self, video_id: str) -> Dict[str, Any]:
+        """
+        Get the videos.list item of a video.
+
+        Args:
+            video_id: Video ID
+
+        Returns:
+            Dict[str, Any]: videos.list item
+        """
+        item = _copy(RECORDED_VIDEO_ITEM)
+        item["id"] = video_id
+        number = self._number(video_id)
+        item["statistics"]["viewCount"] = str(number % 10 ** 7)
+        item["statistics"]["likeCount"] = str(number % 10 ** 5)
+        item["statistics"]["commentCount"] = str(number % 10 ** 3)
+        item["contentDetails"]["duration"] = "PT{}M{}S".format(
+            number % 60, number % 59
+        )
+        item["contentDetails"]["definition"] = "hd" if number % 2 else "sd"
+        item["contentDetails"]["caption"] = str(number % 3 == 0).lower()
+        return item
+
+    def uploads_playlist(self, channel_id: str) -> str:
+        """
+        Get the uploads playlist of a channel.
+
+        Args:
+            channel_id: Channel ID
+
+        Returns:
+            str: Playlist ID, derived from the channel ID like on YouTube
+        """
+        return "UU" + channel_id[2:]
+
+    def upload_items(
+        self, playlist_id: str, start: int, count: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Get one page of an uploads playlist, newest first.
+
+        Args:
+            playlist_id: Uploads playlist ID
+            start: Position of the first video
+            count: Number of videos
+
+        Returns:
+            List[Dict[str, Any]]: playlistItems.list items
+        """
+        items = []
+        for n in range(start, min(start + count, self.uploads_per_channel)):
+            item = _copy(RECORDED_PLAYLIST_ITEM)
+            video_id = self.video_id(playlist_id, n)
+            published = self._timestamp(-60 * n)
+            item["snippet"]["title"] = "{} upload {}".format(playlist_id, n)
+            item["snippet"]["playlistId"] = playlist_id
+            item["snippet"]["position"] = n
+            item["snippet"]["publishedAt"] = published
+            item["snippet"]["resourceId"]["videoId"] = video_id
+            item["contentDetails"]["videoId"] = video_id
+            item["contentDetails"]["videoPublishedAt"] = published
+            items.append(item)
+        return items
+
+    def activity_items(
+        self, channel_id: str, count: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the latest upload activities of a channel.
+
+        Args:
+            channel_id: Channel ID
+            count: Number of activities
+
+        Returns:
+            List[Dict[str, Any]]: activities.list items
+        """
+        playlist_id = self.uploads_playlist(channel_id)
+        items = []
+        for upload in self.upload_items(playlist_id, 0, count):
+            item = _copy(RECORDED_ACTIVITY_ITEM)
+            item["snippet"].update(
+                title=upload["snippet"]["title"],
+                publishedAt=upload["snippet"]["publishedAt"],
+                channelId=channel_id,
+            )
+            item["contentDetails"]["upload"]["videoId"] = upload[
+                "contentDetails"
+            ]["videoId"]
+            items.append(item)
+        return items
+
+    def transcripts(
+        self, video_id: str
+    ) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Get the transcripts of a video.
+
+        Args:
+            video_id: Video ID
+
+        Returns:
+            Optional[Dict[str, List[Dict[str, Any]]]]: Segments keyed by
+            language, None if transcripts are disabled
+        """
+        number = self._number(video_id)
+        if number % 1000 < self.disabled_ratio * 1000:
+            return None
+        segments = []
+        for n in range(self.transcript_segments):
+            segment = dict(RECORDED_TRANSCRIPT_SEGMENT)
+            segment["start"] = round(n * segment["duration"], 2)
+            segment["text"] = "{} line {}".format(video_id, n)
+            segments.append(segment)
+        return {lang: segments for lang in self.transcript_langs}
+
+    def thumbnail(self, video_id: str, image: str) -> Optional[bytes]:
+        """
+        Get a thumbnail image of a video.
+
+        Every third video has no maxres image, like older uploads.
+
+        Args:
+            video_id: Video ID
+            image: Image name of a resolution tier, e.g. "hqdefault.jpg"
+
+        Returns:
+            Optional[bytes]: Image bytes, None if the tier does not exist
+        """
+        number = self._number(video_id)
+        if image.startswith("maxres") and number % 3 == 0:
+            return None
+        line = "{}/{}\n".format(video_id, image).encode("utf-8")
+        return b"\xff\xd8\xff\xe0" + line * 256
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler dispatching to the owning MockYouTubeServer."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):  # noqa: A002 - stdlib signature
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        owner = self.server.owner
+        status, body = owner.respond(url.path, query)
+        etag = '"{}"'.format(hashlib.md5(body).hexdigest())
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            status, body = 304, b""
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        content_type = "application/json"
+        if status == 200 and url.path.startswith(owner.THUMBNAIL_PATH):
+            content_type = "image/jpeg"
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MockYouTubeServer:
+    """
+    Local stand-in for the YouTube Data API and the transcript host.
+
+    The server answers ``search``, ``videos``, ``activities``, ``channels``
+    and ``playlistItems`` list calls under ``base_url`` with data from a
+    Fixtures instance, honours ``part``, ``fields``, ``maxResults``,
+    ``pageToken`` and ``If-None-Match`` and can add latency and inject
+    errors. Transcripts are served under ``/transcripts/`` and reach
+    tubeframes through ``patch_transcripts``; thumbnails are served under
+    ``thumbnail_url``. Nothing leaves the machine
+    and no quota is spent, which makes it suited for tests and benchmarks.
+    """
+
+    API_PATH = "/youtube/v3/"
+    TRANSCRIPT_PATH = "/transcripts/"
+    THUMBNAIL_PATH = "/vi/"
+
+    def __init__(
+        self,
+        fixtures: Optional[Fixtures] = None,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = 0,
+    ) -> None:
+        """
+        Initialize the server.
+
+        Args:
+            fixtures: Data served, default Fixtures if None
+            latency: Seconds added to every response
+            error_rate: Share of API and transcript requests answered with
+                an error; thumbnail requests never fail
+            error_status: HTTP status of injected errors; 403 reports an
+                exhausted quota, 429 a rate limit
+            seed: Seed of the error injection, for repeatable runs
+        """
+        self.fixtures = fixtures if fixtures is not None else Fixtures()
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests = Counter()
+        self.errors = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+        self._session = None
+
+    @property
+    def url(self) -> str:
+        """Root URL of the running server."""
+        if self._httpd is None:
+            raise RuntimeError("The mock server is not running")
+        host, port = self._httpd.server_address[:2]
+        return "http://{}:{}".format(host, port)
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the API endpoints, for ``TubeFramesClient``."""
+        return self.url + self.API_PATH
+
+    @property
+    def thumbnail_url(self) -> str:
+        """Root URL of the thumbnails, for ``ThumbnailStore``."""
+        return self.url + self.THUMBNAIL_PATH
+
+    @property
+    def total_requests(self) -> int:
+        """Number of requests served so far."""
+        with self._lock:
+            return sum(self.requests.values())
+
+    def start(self) -> "MockYouTubeServer":
+        """
+        Start serving on a free local port in a background thread.
+
+        Returns:
+            MockYouTubeServer: The server itself
+        """
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.owner = self
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, daemon=True
+        )
+        self._thread.start()
+        self._session = requests.Session()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> "MockYouTubeServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def reset(self) -> None:
+        """Reset the request and error counters."""
+        with self._lock:
+            self.requests.clear()
+            self.errors.clear()
+
+    def respond(self, path: str, query: Dict[str, str]) -> Tuple[int, bytes]:
+        """
+        Build the response to one request.
+
+        Args:
+            path: Request path
+            query: Query parameters
+
+        Returns:
+            Tuple[int, bytes]: HTTP status and body, JSON except for
+            thumbnails
+        """
+        if path.startswith(self.TRANSCRIPT_PATH):
+            resource = "transcripts"
+        elif path.startswith(self.THUMBNAIL_PATH):
+            resource = "thumbnails"
+        else:
+            resource = path.rsplit("/", 1)[-1]
+        with self._lock:
+            self.requests[resource] += 1
+            failed = (
+                resource != "thumbnails"
+                and self._random.random() < self.error_rate
+            )
+            if failed:
+                self.errors[resource] += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+        if failed:
+            return self._error(self.error_status)
+
+        if resource == "transcripts":
+            video_id = path[len(self.TRANSCRIPT_PATH):]
+            transcripts = self.fixtures.transcripts(video_id)
+            if transcripts is None:
+                return self._error(404, "transcriptsDisabled")
+            return 200, json.dumps(transcripts).encode("utf-8")
+
+        if resource == "thumbnails":
+            video_id, _, image = path[len(self.THUMBNAIL_PATH):].partition("/")
+            thumbnail = self.fixtures.thumbnail(video_id, image)
+            if thumbnail is None:
+                return self._error(404, "notFound")
+            return 200, thumbnail
+
+        handler = getattr(self, "_" + resource, None)
+        if handler is None or not path.startswith(self.API_PATH):
+            return self._error(404, "notFound")
+        try:
+            data = self._select(handler(query), query)
+        except (KeyError, ValueError):
+            return self._error(400, "badRequest")
+        return 200, json.dumps(data).encode("utf-8")
+
+    @staticmethod
+    def _select(data: Dict[str, Any], query: Dict[str, str]) -> Dict:
+        """Drop the parts and fields the request did not ask for."""
+        if "part" in query:
+            parts = set(query["part"].split(","))
+            for item in data.get("items", []):
+                for part in ("snippet", "contentDetails", "statistics"):
+                    if part not in parts:
+                        item.pop(part, None)
+        if query.get("fields"):
+            data = project_fields(data, parse_fields(query["fields"]))
+        return data
+
+    @staticmethod
+    def _error(status: int, reason: Optional[str] = None) -> Tuple[int, bytes]:
+        reason = reason or ERROR_REASONS.get(status, "backendError")
+        body = {
+            "error": {
+                "code": status,
+                "message": reason,
+                "errors": [{"reason": reason, "domain": "youtube.mock"}],
+            }
+        }
+        return status, json.dumps(body).encode("utf-8")
+
+    @staticmethod
+    def _page(query: Dict[str, str]) -> Tuple[int, int]:
+        count = min(int(query.get("maxResults", 5)), 50)
+        return int(query.get("pageToken") or 0), count
+
+    @staticmethod
+    def _list(kind: str, items: List[Dict], next_page: Optional[int] = None):
+        data = {
+            "kind": kind,
+            "etag": hashlib.md5(kind.encode("utf-8")).hexdigest(),
+            "pageInfo": {"resultsPerPage": len(items)},
+            "items": items,
+        }
+        if next_page is not None:
+            data["nextPageToken"] = str(next_page)
+        return data
+
+    def _search(self, query: Dict[str, str]) -> Dict[str, Any]:
+        start, count = self._page(query)
+        items = self.fixtures.search_items(
+            query.get("q", ""), query.get("type", "video"), start, count
+        )
+        total = self.fixtures.total_results
+        more = start + count < total
+        data = self._list(
+            "youtube#searchListResponse",
+            items,
+            start + count if more else None,
+        )
+        data["regionCode"] = "US"
+        data["pageInfo"]["totalResults"] = total
+        return data
+
+    def _videos(self, query: Dict[str, str]) -> Dict[str, Any]:
+        ids = query["id"].split(",")[:MAX_IDS_PER_REQUEST]
+        # Projected by _select, which runs after the handler
+        query.setdefault("part", "statistics")
+        items = [self.fixtures.video_item(video_id) for video_id in ids]
+        return self._list("youtube#videoListResponse", items)
+
+    def _channels(self, query: Dict[str, str]) -> Dict[str, Any]:
+        ids = query["id"].split(",")[:MAX_IDS_PER_REQUEST]
+        items = [
+            {
+                "kind": "youtube#channel",
+                "id": channel_id,
+                "contentDetails": {
+                    "relatedPlaylists": {
+                        "likes": "",
+                        "uploads": self.fixtures.uploads_playlist(channel_id),
+                    }
+                },
+            }
+            for channel_id in ids
+        ]
+        return self._list("youtube#channelListResponse", items)
+
+    def _playlistItems(self, query: Dict[str, str]) -> Dict[str, Any]:
+        start, count = self._page(query)
+        items = self.fixtures.upload_items(query["playlistId"], start, count)
+        more = start + count < self.fixtures.uploads_per_channel
+        return self._list(
+            "youtube#playlistItemListResponse",
+            items,
+            start + count if more else None,
+        )
+
+    def _activities(self, query: Dict[str, str]) -> Dict[str, Any]:
+        _, count = self._page(query)
+        items = self.fixtures.activity_items(query["channelId"], count)
+        return self._list("youtube#activityListResponse", items)
+
+    def list_transcripts(self, video_id: str) -> "MockTranscriptList":
+        """
+        Drop-in replacement for ``tubeframes.utils.list_transcripts``.
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            MockTranscriptList: Transcripts served by this server
+
+        Raises:
+            TranscriptsDisabled: If the video has no transcripts
+            RequestBlocked: If an injected 429 error is returned
+            YouTubeRequestFailed: If another injected error is returned
+        """
+        response = self._session.get(
+            self.url + self.TRANSCRIPT_PATH + video_id
+        )
+        if response.status_code == 404:
+            raise ytapi.TranscriptsDisabled(video_id)
+        # Raised like youtube_transcript_api reports failed requests
+        if response.status_code == 429:
+            raise ytapi.RequestBlocked(video_id)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            raise ytapi.YouTubeRequestFailed(video_id, e)
+        return MockTranscriptList(video_id, response.json())
+
+    @contextmanager
+    def patch_transcripts(self):
+        """Route the transcript requests of tubeframes to this server."""
+        with mock.patch(
+            "tubeframes.utils.list_transcripts", self.list_transcripts
+        ):
+            yield self
+
+
+class MockTranscript:
+    """Transcript of one language, as returned by the mock server."""
+
+    def __init__(
+        self, video_id: str, language_code: str, segments: List[Dict]
+    ) -> None:
+        self.video_id = video_id
+        self.language_code = language_code
+        self._segments = segments
+
+    def fetch(self) -> List[Dict[str, Any]]:
+        """
+        Get the transcript segments.
+
+        Returns:
+            List[Dict[str, Any]]: Segments with text, start and duration
+        """
+        return [dict(segment) for segment in self._segments]
+
+
+class MockTranscriptList:
+    """Transcripts of one video, mirroring youtube_transcript_api."""
+
+    def __init__(
+        self, video_id: str, transcripts: Dict[str, List[Dict]]
+    ) -> None:
+        self.video_id = video_id
+        self._transcripts = transcripts
+
+    def find_transcript(self, language_codes: List[str]) -> MockTranscript:
+        """
+        Get the transcript in the first available language.
+
+        Args:
+            language_codes: Accepted languages, by priority
+
+        Returns:
+            MockTranscript: Transcript found
+
+        Raises:
+            NoTranscriptFound: If no language is available
+        """
+        for lang in language_codes:
+            if lang in self._transcripts:
+                return MockTranscript(
+                    self.video_id, lang, self._transcripts[lang]
+                )
+        raise ytapi.NoTranscriptFound(self.video_id, language_codes, self)
@@ -0,0 +1,417 @@
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+import json
+import os
+import sqlite3
+import threading
+
+from tubeframes.config.constants import (
+    CAPTION_INDEX_TOKENIZER,
+    CAPTION_INDEX_WEIGHTS,
+    DEFAULT_CACHE_DIR,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - pandas is imported on use
+    import pandas as pd
+
+# Caption columns of Search and ChannelInfo rows
+_CAPTION_KEYS = ("video_caption", "caption")
+
+# Indexed video fields, in the column order of the documents table
+_DOCUMENT_FIELDS = ("title", "description", "caption")
+
+
+def _text(value: Any) -> Optional[str]:
+    """Convert a row value to the text stored in the index."""
+    if value is None:
+        return None
+    # Frame timestamps are UTC; store them like the API does
+    if hasattr(value, "strftime"):
+        return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return str(value)
+
+
+class CaptionIndex:
+    """
+    SQLite FTS5 full-text index of collected captions.
+
+    Each video is one document with its title, description and caption
+    text, ranked with bm25 so title matches weigh most. Caption segments
+    are indexed separately, so a match can be traced back to the moment
+    it is spoken. Adding a video again updates its entry, so the results
+    of later runs can be added incrementally.
+
+    Queries use the FTS5 syntax: words, ``"quoted phrases"``, ``prefix*``
+    and ``AND``, ``OR``, ``NOT``. Accents are folded, so ``cafe`` finds
+    ``café``. Segment matches are found within a segment; a phrase
+    spoken across two segments only matches the whole video.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """
+        Open or create a caption index.
+
+        Args:
+            path: SQLite file, by default inside the tubeframes cache dir
+        """
+        if path is None:
+            os.makedirs(DEFAULT_CACHE_DIR, exist_ok=True)
+            path = os.path.join(DEFAULT_CACHE_DIR, "captions.sqlite")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        tokenize = "tokenize = '{}'".format(CAPTION_INDEX_TOKENIZER)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS videos ("
+                "id INTEGER PRIMARY KEY, video_id TEXT NOT NULL UNIQUE, "
+                "channel_id TEXT, published_at TEXT)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS segments ("
+                "id INTEGER PRIMARY KEY, video INTEGER NOT NULL, "
+                "lang TEXT, start REAL, duration REAL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS segments_video "
+                "ON segments (video)"
+            )
+            # Full-text tables share the rowids of videos and segments
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS documents USING fts5("
+                + ", ".join(_DOCUMENT_FIELDS + (tokenize,))
+                + ")"
+            )
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS segment_text "
+                "USING fts5(text, " + tokenize + ")"
+            )
+            weights = ", ".join(
+                str(CAPTION_INDEX_WEIGHTS[name]) for name in _DOCUMENT_FIELDS
+            )
+            self._conn.execute(
+                "INSERT INTO documents (documents, rank) VALUES (?, ?)",
+                ("rank", "bm25({})".format(weights)),
+            )
+
+    @staticmethod
+    def phrase(text: str) -> str:
+        """
+        Quote text as an FTS5 phrase query.
+
+        Args:
+            text: Words to find next to each other, in order
+
+        Returns:
+            str: Query matching the exact phrase
+        """
+        return '"{}"'.format(text.replace('"', '""'))
+
+    def _video_rowids(self, video_ids: List[str]) -> Dict[str, int]:
+        """Get the rowids of indexed videos by video ID."""
+        return dict(
+            self._conn.execute(
+                "SELECT video_id, id FROM videos "
+                "WHERE video_id IN (SELECT value FROM json_each(?))",
+                (json.dumps(video_ids),),
+            )
+        )
+
+    def add_rows(self, rows: Iterable[Dict]) -> int:
+        """
+        Index result rows, updating videos already in the index.
+
+        Rows are those of ``Search.iter_pages`` or
+        ``ChannelInfo.iter_channels``, so pages can be indexed as they
+        arrive. Fields missing from a row keep their indexed value.
+
+        Args:
+            rows: Rows with videoId and optionally title, description,
+                channelId, publishedAt and video_caption or caption
+
+        Returns:
+            int: Number of videos indexed
+        """
+        entries = {}
+        for row in rows:
+            if row.get("videoId"):
+                entries[str(row["videoId"])] = row
+        if not entries:
+            return 0
+
+        documents = []
+        for row in entries.values():
+            caption = next(
+                (row[key] for key in _CAPTION_KEYS if row.get(key)), None
+            )
+            documents.append(
+                (
+                    _text(row.get("title")),
+                    _text(row.get("description")),
+                    _text(caption),
+                )
+            )
+        with self._lock:
+            with self._conn:
+                known = self._video_rowids(list(entries))
+                self._conn.executemany(
+                    "INSERT INTO videos (video_id, channel_id, published_at) "
+                    "VALUES (?, ?, ?) ON CONFLICT (video_id) DO UPDATE SET "
+                    "channel_id = COALESCE(excluded.channel_id, channel_id), "
+                    "published_at = "
+                    "COALESCE(excluded.published_at, published_at)",
+                    [
+                        (
+                            video_id,
+                            _text(row.get("channelId")),
+                            _text(row.get("publishedAt")),
+                        )
+                        for video_id, row in entries.items()
+                    ],
+                )
+                rowids = self._video_rowids(list(entries))
+                rowids = [rowids[video_id] for video_id in entries]
+                for n, (video_id, rowid) in enumerate(zip(entries, rowids)):
+                    if video_id not in known:
+                        continue
+                    old = self._conn.execute(
+                        "SELECT title, description, caption FROM documents "
+                        "WHERE rowid = ?",
+                        (rowid,),
+                    ).fetchone()
+                    if old is not None:
+                        documents[n] = tuple(
+                            old_value if value is None else value
+                            for value, old_value in zip(documents[n], old)
+                        )
+                self._conn.executemany(
+                    "DELETE FROM documents WHERE rowid = ?",
+                    [(rowid,) for rowid in rowids],
+                )
+                self._conn.executemany(
+                    "INSERT INTO documents (rowid, title, description, "
+                    "caption) VALUES (?, ?, ?, ?)",
+                    [
+                        (rowid,) + document
+                        for rowid, document in zip(rowids, documents)
+                    ],
+                )
+        return len(entries)
+
+    def add_segments(self, captions: "pd.DataFrame") -> int:
+        """
+        Index caption segments, replacing the segments of their videos.
+
+        Args:
+            captions: Caption table with the columns videoId, lang, start,
+                duration and text, as ``Search.captions`` or
+                ``ChannelInfo.captions``
+
+        Returns:
+            int: Number of segments indexed
+        """
+        frame = captions[["videoId", "lang", "start", "duration", "text"]]
+        frame = frame[frame["text"].notna()].astype(object)
+        segments = list(frame.itertuples(index=False, name=None))
+        if not segments:
+            return 0
+        video_ids = list(dict.fromkeys(str(row[0]) for row in segments))
+
+        with self._lock:
+            with self._conn:
+                # Segments may arrive before the rows of their videos
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO videos (video_id) VALUES (?)",
+                    [(video_id,) for video_id in video_ids],
+                )
+                rowids = self._video_rowids(video_ids)
+                videos = json.dumps(list(rowids.values()))
+                select = (
+                    "SELECT id FROM segments WHERE video IN "
+                    "(SELECT value FROM json_each(?)) ORDER BY id"
+                )
+                self._conn.executemany(
+                    "DELETE FROM segment_text WHERE rowid = ?",
+                    self._conn.execute(select, (videos,)).fetchall(),
+                )
+                self._conn.execute(
+                    "DELETE FROM segments WHERE video IN "
+                    "(SELECT value FROM json_each(?))",
+                    (videos,),
+                )
+                self._conn.executemany(
+                    "INSERT INTO segments (video, lang, start, duration) "
+                    "VALUES (?, ?, ?, ?)",
+                    [
+                        (rowids[str(video_id)], lang, start, duration)
+                        for video_id, lang, start, duration, _ in segments
+                    ],
+                )
+                # Rowids grow in insertion order, matching the segments
+                self._conn.executemany(
+                    "INSERT INTO segment_text (rowid, text) VALUES (?, ?)",
+                    [
+                        (rowid, str(segment[4]))
+                        for (rowid,), segment in zip(
+                            self._conn.execute(select, (videos,)), segments
+                        )
+                    ],
+                )
+        return len(segments)
+
+    def add_frame(
+        self,
+        df: "pd.DataFrame",
+        captions: Optional["pd.DataFrame"] = None,
+    ) -> int:
+        """
+        Index a result DataFrame and, optionally, its caption segments.
+
+        Args:
+            df: ``Search.df`` (indexed by videoId) or ``ChannelInfo.df``
+            captions: Caption segments of the videos. Their joined text is
+                indexed as the caption of videos without a caption column.
+
+        Returns:
+            int: Number of videos indexed
+        """
+        if "videoId" not in df.columns:
+            df = df.reset_index()
+        rows = df.astype(object).where(df.notna(), None).to_dict("records")
+        if captions is not None and not any(
+            key in df.columns for key in _CAPTION_KEYS
+        ):
+            from tubeframes.utils import join_captions
+
+            text = join_captions(captions)
+            for row in rows:
+                row["caption"] = text.get(row["videoId"])
+        added = self.add_rows(rows)
+        if captions is not None:
+            self.add_segments(captions)
+        return added
+
+    def _query(self, sql: str, args: tuple) -> List[tuple]:
+        """
+        Run a full-text query.
+
+        Raises:
+            ValueError: If the query is not valid FTS5 syntax
+        """
+        try:
+            with self._lock:
+                return self._conn.execute(sql, args).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(
+                "Invalid full-text query {!r}: {}".format(args[0], e)
+            ) from e
+
+    def search(
+        self, query: str, limit: int = 20, phrase: bool = False
+    ) -> "pd.DataFrame":
+        """
+        Find the videos best matching a query.
+
+        Args:
+            query: FTS5 query over titles, descriptions and captions
+            limit: Maximum number of videos returned
+            phrase: Whether to match the query text as one exact phrase
+
+        Returns:
+            pd.DataFrame: Columns videoId, channelId, publishedAt, title,
+            score (higher is better) and snippet, the best matching part
+            of the caption with matches in brackets
+
+        Raises:
+            ValueError: If the query is not valid FTS5 syntax
+        """
+        import pandas as pd
+
+        if phrase:
+            query = self.phrase(query)
+        rows = self._query(
+            "SELECT videos.video_id, videos.channel_id, videos.published_at, "
+            "documents.title, -documents.rank, "
+            "snippet(documents, 2, '[', ']', '...', 16) "
+            "FROM documents JOIN videos ON videos.id = documents.rowid "
+            "WHERE documents MATCH ? ORDER BY documents.rank LIMIT ?",
+            (query, limit),
+        )
+        df = pd.DataFrame(
+            rows,
+            columns=[
+                "videoId",
+                "channelId",
+                "publishedAt",
+                "title",
+                "score",
+                "snippet",
+            ],
+        )
+        df["publishedAt"] = pd.to_datetime(df["publishedAt"], utc=True)
+        return df
+
+    def find_segments(
+        self,
+        query: str,
+        limit: int = 100,
+        video_ids: Optional[List[str]] = None,
+        phrase: bool = False,
+    ) -> "pd.DataFrame":
+        """
+        Find the caption segments best matching a query.
+
+        Args:
+            query: FTS5 query over segment texts
+            limit: Maximum number of segments returned
+            video_ids: Only search the segments of these videos, e.g. the
+                videoId column returned by ``search``
+            phrase: Whether to match the query text as one exact phrase
+
+        Returns:
+            pd.DataFrame: Columns videoId, lang, start, duration, text and
+            score (higher is better), best match first
+
+        Raises:
+            ValueError: If the query is not valid FTS5 syntax
+        """
+        import pandas as pd
+
+        if phrase:
+            query = self.phrase(query)
+        sql = (
+            "SELECT videos.video_id, segments.lang, segments.start, "
+            "segments.duration, segment_text.text, -segment_text.rank "
+            "FROM segment_text "
+            "JOIN segments ON segments.id = segment_text.rowid "
+            "JOIN videos ON videos.id = segments.video "
+            "WHERE segment_text MATCH ?"
+        )
+        args = [query]
+        if video_ids is not None:
+            sql += (
+                " AND videos.video_id IN (SELECT value FROM json_each(?))"
+            )
+            args.append(json.dumps([str(v) for v in video_ids]))
+        rows = self._query(
+            sql + " ORDER BY segment_text.rank LIMIT ?",
+            tuple(args + [limit]),
+        )
+        return pd.DataFrame(
+            rows,
+            columns=["videoId", "lang", "start", "duration", "text", "score"],
+        )
+
+    def optimize(self) -> None:
+        """Merge the full-text indexes, speeding up later queries."""
+        with self._lock:
+            with self._conn:
+                for table in ("documents", "segment_text"):
+                    self._conn.execute(
+                        "INSERT INTO {0} ({0}) VALUES ('optimize')".format(
+                            table
+                        )
+                    )
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,285 @@
+from typing import TYPE_CHECKING, Dict, Iterable, NamedTuple, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from tubeframes.config.constants import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_THUMBNAIL_WORKERS,
+    DEFAULT_TIMEOUT,
+    THUMBNAIL_BASE_URL,
+    THUMBNAIL_CHUNK_SIZE,
+    THUMBNAIL_TIERS,
+)
+from tubeframes.metrics import RequestEvent, RequestHook, emit
+
+if TYPE_CHECKING:  # pragma: no cover - pandas is imported on use
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Endpoint name of thumbnail downloads in request events
+THUMBNAIL_ENDPOINT = "thumbnails"
+
+# Columns of the frame returned by ThumbnailStore.download
+THUMBNAIL_COLUMNS = ["videoId", "status", "tier", "sha256", "size", "path"]
+
+
+class Thumbnail(NamedTuple):
+    """Outcome of the download of one video's thumbnail."""
+
+    video_id: str
+    # "downloaded", "duplicate" (same image as an already stored file),
+    # "present" (skipped), "missing" (no tier exists) or "failed"
+    status: str
+    tier: Optional[str] = None
+    sha256: Optional[str] = None
+    size: Optional[int] = None
+    path: Optional[str] = None
+
+
+class ThumbnailStore:
+    """
+    Content-addressed store of downloaded thumbnails.
+
+    Images are saved under the SHA-256 of their bytes, so identical images
+    are stored once, and a SQLite index maps each video to its image.
+    Videos already in the store are skipped, so an interrupted or repeated
+    download only fetches what is missing, failed downloads included.
+
+    Downloads run concurrently over one pooled session. Each response is
+    streamed to a temporary file while it is hashed, so no image is held
+    in memory, and moved into place once complete. The resolution tiers
+    (maxres, high, then default) are tried in order by the same worker
+    until one exists.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        base_url: str = THUMBNAIL_BASE_URL,
+    ) -> None:
+        """
+        Open or create a thumbnail store.
+
+        Args:
+            directory: Store directory, by default inside the tubeframes
+                cache dir
+            base_url: Root URL of the thumbnail host, followed by
+                ``<videoId>/<image>``
+        """
+        if directory is None:
+            directory = os.path.join(DEFAULT_CACHE_DIR, "thumbnails")
+        self.directory = directory
+        self._base_url = base_url
+        self._objects = os.path.join(directory, "objects")
+        os.makedirs(self._objects, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(directory, "index.sqlite"), check_same_thread=False
+        )
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS thumbnails ("
+                "video_id TEXT PRIMARY KEY, tier TEXT NOT NULL, "
+                "sha256 TEXT NOT NULL, size INTEGER NOT NULL, "
+                "fetched REAL NOT NULL)"
+            )
+
+    def path(self, digest: str) -> str:
+        """
+        Get the file of an image.
+
+        Args:
+            digest: SHA-256 of the image bytes, in hex
+
+        Returns:
+            str: Path of the image, sharded by the first two hex digits
+        """
+        return os.path.join(self._objects, digest[:2], digest + ".jpg")
+
+    def get(self, video_id: str) -> Optional[Thumbnail]:
+        """
+        Look up the stored thumbnail of a video.
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            Optional[Thumbnail]: Stored thumbnail, None if never downloaded
+            or if its file was removed
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tier, sha256, size FROM thumbnails "
+                "WHERE video_id = ?",
+                (video_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        tier, digest, size = row
+        path = self.path(digest)
+        if not os.path.exists(path):
+            return None
+        return Thumbnail(video_id, "present", tier, digest, size, path)
+
+    def download(
+        self,
+        video_ids: Iterable[str],
+        session: Optional[requests.Session] = None,
+        workers: int = DEFAULT_THUMBNAIL_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+        hook: Optional[RequestHook] = None,
+    ) -> "pd.DataFrame":
+        """
+        Download the thumbnails of videos missing from the store.
+
+        Args:
+            video_ids: YouTube video IDs; repeated IDs are fetched once
+            session: Pooled HTTP session, a new one sized for the workers
+                if None
+            workers: Number of thumbnails downloaded concurrently
+            timeout: Timeout in seconds for each HTTP request
+            hook: Callable receiving a RequestEvent per HTTP request
+
+        Returns:
+            pd.DataFrame: One row per video with the columns videoId,
+            status, tier, sha256, size and path
+        """
+        import pandas as pd
+
+        video_ids = list(dict.fromkeys(video_ids))
+        own_session = session is None
+        if own_session:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+        def fetch(video_id: str) -> Thumbnail:
+            stored = self.get(video_id)
+            if stored is not None:
+                return stored
+            return self._fetch(session, video_id, timeout, hook)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+                thumbnails = list(executor.map(fetch, video_ids))
+        finally:
+            if own_session:
+                session.close()
+        return pd.DataFrame(thumbnails, columns=THUMBNAIL_COLUMNS)
+
+    def _fetch(
+        self,
+        session: requests.Session,
+        video_id: str,
+        timeout: float,
+        hook: Optional[RequestHook] = None,
+    ) -> Thumbnail:
+        """Download the best available tier of one video's thumbnail."""
+        for tier, image in THUMBNAIL_TIERS:
+            url = "{}{}/{}".format(self._base_url, video_id, image)
+            start = time.perf_counter()
+            status, size = None, 0
+            try:
+                response = session.get(url, stream=True, timeout=timeout)
+                with response:
+                    status = response.status_code
+                    if status == 404:
+                        # Read the short error body to reuse the connection
+                        size = len(response.content)
+                        continue
+                    response.raise_for_status()
+                    digest, size, duplicate = self._save(response)
+            except requests.RequestException as e:
+                logger.warning(
+                    "Thumbnail of %s not downloaded: %s", video_id, e
+                )
+                return Thumbnail(video_id, "failed")
+            finally:
+                if hook is not None:
+                    emit(
+                        [hook],
+                        RequestEvent(
+                            THUMBNAIL_ENDPOINT,
+                            time.perf_counter() - start,
+                            status,
+                            size,
+                            0,
+                            None,
+                        ),
+                    )
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO thumbnails VALUES "
+                    "(?, ?, ?, ?, ?)",
+                    (video_id, tier, digest, size, time.time()),
+                )
+            status = "duplicate" if duplicate else "downloaded"
+            return Thumbnail(
+                video_id, status, tier, digest, size, self.path(digest)
+            )
+        return Thumbnail(video_id, "missing")
+
+    def _save(self, response: requests.Response) -> Tuple[str, int, bool]:
+        """
+        Stream a response body into the store.
+
+        Args:
+            response: Streamed HTTP response
+
+        Returns:
+            Tuple[str, int, bool]: SHA-256 in hex, size in bytes, and
+            whether the same image was already stored
+        """
+        digest = hashlib.sha256()
+        size = 0
+        fd, temp_path = tempfile.mkstemp(dir=self._objects, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                for chunk in response.iter_content(THUMBNAIL_CHUNK_SIZE):
+                    digest.update(chunk)
+                    temp_file.write(chunk)
+                    size += len(chunk)
+            hex_digest = digest.hexdigest()
+            path = self.path(hex_digest)
+            if os.path.exists(path):
+                os.remove(temp_path)
+                return hex_digest, size, True
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return hex_digest, size, False
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Summarize the store.
+
+        Returns:
+            Dict[str, int]: Number of indexed videos, of distinct stored
+            images, and their total size in bytes
+        """
+        with self._lock:
+            videos, images, size = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT sha256), "
+                "(SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT "
+                "sha256, size FROM thumbnails)) FROM thumbnails"
+            ).fetchone()
+        return {"videos": videos, "images": images, "bytes": size}
+
+    def close(self) -> None:
+        """Close the index."""
+        with self._lock:
+            self._conn.close()
@@ -1,12 +1,41 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+import logging
 import os
-import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+import re
 import pandas as pd
-from googleapiclient.discovery import build
-import youtube_transcript_api as ytapi
-from tubeframes.config.constants import YOUTUBE_API_SERVICE_NAME
-from tubeframes.config.constants import YOUTUBE_API_VERSION
-from tubeframes.config.constants import YOUTUBE_API_URL
+import requests
+from googleapiclient.errors import HttpError
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+from tubeframes.cache import TranscriptCache
+from tubeframes.client import TubeFramesClient, get_default_client
+from tubeframes.quota import QuotaBudgetExceeded
+from tubeframes.ratelimit import RateLimiter
+from tubeframes.retry import QuotaExceededError
+from tubeframes.metrics import (
+    RequestEvent,
+    RequestHook,
+    TRANSCRIPT_ENDPOINT,
+    emit,
+)
+from tubeframes.config.constants import (
+    MAX_IDS_PER_REQUEST,
+    COLUMN_KINDS,
+    CATEGORICAL_COLUMNS,
+    CONTENT_DETAILS_KEYS,
+    DURATION_UNITS,
+    ISO_DURATION_PATTERN,
+)
+from tubeframes.fields import videos_part
+
+logger = logging.getLogger(__name__)
 
 
 def get_dev_key(dev_key: Optional[str] = None) -> str:
@@ -34,62 +63,427 @@ def create_tubeframes_client(dev_key: str):
     """
     Create YouTube API client.
 
+    The client is built once per developer key and shared afterwards.
+
     Args:
         dev_key: YouTube API developer key
 
     Returns:
         object: YouTube API client
     """
-    return build(
-        YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, developerKey=dev_key
-    )
+    return get_default_client(dev_key).youtube
 
 
-def get_video_captions(
-    video_id: str, accepted_caption_lang: List[str]
-) -> Optional[str]:
+def list_transcripts(video_id: str):
     """
-    Get captions for a specific video.
+    List the transcripts of a video with youtube_transcript_api.
+
+    Supports both the class-level API of older releases and the
+    instance-based API of youtube_transcript_api 1.x.
+
+    Args:
+        video_id: YouTube video ID
+
+    Returns:
+        object: youtube_transcript_api TranscriptList
+    """
+    import youtube_transcript_api as ytapi
+
+    transcript_api = ytapi.YouTubeTranscriptApi
+    if hasattr(transcript_api, "list_transcripts"):
+        return transcript_api.list_transcripts(video_id)
+    return transcript_api().list(video_id)
+
+
+def fetch_transcript_segments(transcript) -> List[Dict[str, Any]]:
+    """
+    Fetch the segments of a transcript as plain dictionaries.
+
+    Args:
+        transcript: youtube_transcript_api Transcript
+
+    Returns:
+        List[Dict[str, Any]]: Segments with text, start and duration
+    """
+    fetched = transcript.fetch()
+    if hasattr(fetched, "to_raw_data"):
+        return fetched.to_raw_data()
+    return [dict(segment) for segment in fetched]
+
+
+def get_video_caption_segments(
+    video_id: str,
+    accepted_caption_lang: List[str],
+    cache: Optional[TranscriptCache] = None,
+    limiter: Optional[RateLimiter] = None,
+    hook: Optional[RequestHook] = None,
+) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    Get the transcript segments of a video in the first accepted language.
 
     Args:
         video_id: YouTube video ID
         accepted_caption_lang: List of accepted languages for captions
+        cache: Transcript cache consulted before, and updated after, each
+            request
+        limiter: Rate limiter acquired before contacting the transcript
+            host; cache hits do not wait
+        hook: Callable receiving a RequestEvent for the fetch
 
     Returns:
-        Optional[str]: Caption text or None if not available
+        Optional[Tuple[str, List[Dict[str, Any]]]]: Language and segments,
+        or None if not available
+    """
+    if hook is None:
+        return _find_caption_segments(
+            video_id, accepted_caption_lang, cache, limiter
+        )[0]
+
+    start = time.perf_counter()
+    found, status = None, None
+    try:
+        found, status = _find_caption_segments(
+            video_id, accepted_caption_lang, cache, limiter
+        )
+        return found
+    finally:
+        hit = status == 0
+        if hit:
+            cache_state = "hit"
+        else:
+            cache_state = "miss" if cache is not None else None
+        size = 0
+        if found is not None:
+            size = sum(len(segment["text"].encode()) for segment in found[1])
+        emit(
+            [hook],
+            RequestEvent(
+                TRANSCRIPT_ENDPOINT,
+                time.perf_counter() - start,
+                None if hit else status,
+                size,
+                0,
+                cache_state,
+            ),
+        )
+
+
+def _find_caption_segments(
+    video_id: str,
+    accepted_caption_lang: List[str],
+    cache: Optional[TranscriptCache],
+    limiter: Optional[RateLimiter],
+) -> Tuple[Optional[Tuple[str, List[Dict[str, Any]]]], Optional[int]]:
+    """
+    Look a transcript up in the cache, then on the transcript host.
+
+    A failure other than a missing or disabled transcript, such as an
+    unavailable video or a blocked request, is logged and only skips
+    this video.
+
+    Returns:
+        Tuple: Language and segments, or None, and the HTTP-like status of
+        the transcript host: 200 if found there, 204 if not available, 0
+        if the answer came from the cache alone and None if the lookup
+        failed
     """
+    if cache is not None and cache.get(video_id, cache.ANY_LANGUAGE):
+        return None, 0
+
+    import youtube_transcript_api as ytapi
+
+    transcript_list = None
     try:
-        transcript_list = ytapi.YouTubeTranscriptApi.list_transcripts(video_id)
         for lang in accepted_caption_lang:
+            cached = cache.get(video_id, lang) if cache is not None else None
+            if cached is not None:
+                if cached.status == TranscriptCache.FOUND:
+                    return (lang, cached.segments), 0
+                continue
+
+            if transcript_list is None:
+                if limiter is not None:
+                    limiter.acquire()
+                transcript_list = list_transcripts(video_id)
             try:
                 transcript = transcript_list.find_transcript([lang])
-                caption = transcript.fetch()
-                df_caption = pd.DataFrame.from_dict(caption)
-                return "; ".join(df_caption["text"])
-            except ytapi._errors.NoTranscriptFound:
+            except ytapi.NoTranscriptFound:
+                if cache is not None:
+                    cache.set(video_id, lang, TranscriptCache.MISSING)
                 continue
-    except ytapi._errors.TranscriptsDisabled:
+            segments = fetch_transcript_segments(transcript)
+            if cache is not None:
+                cache.set(video_id, lang, TranscriptCache.FOUND, segments)
+            return (lang, segments), 200
+    except ytapi.TranscriptsDisabled:
+        if cache is not None:
+            cache.set(
+                video_id, cache.ANY_LANGUAGE, TranscriptCache.DISABLED
+            )
+        return None, 204
+    except (ytapi.CouldNotRetrieveTranscript, requests.RequestException) as e:
+        logger.warning("Captions of %s not retrieved: %s", video_id, e)
+        if cache is not None:
+            cache.set(video_id, cache.ANY_LANGUAGE, TranscriptCache.FAILED)
+        return None, None
+    return None, 204 if transcript_list is not None else 0
+
+
+def get_video_captions(
+    video_id: str,
+    accepted_caption_lang: List[str],
+    cache: Optional[TranscriptCache] = None,
+    limiter: Optional[RateLimiter] = None,
+    hook: Optional[RequestHook] = None,
+) -> Optional[str]:
+    """
+    Get captions for a specific video.
+
+    Args:
+        video_id: YouTube video ID
+        accepted_caption_lang: List of accepted languages for captions
+        cache: Transcript cache consulted before, and updated after, each
+            request
+        limiter: Rate limiter acquired before contacting the transcript host
+        hook: Callable receiving a RequestEvent for the fetch
+
+    Returns:
+        Optional[str]: Caption text or None if not available
+    """
+    found = get_video_caption_segments(
+        video_id, accepted_caption_lang, cache, limiter, hook
+    )
+    if found is None:
         return None
-    return None
+    return "; ".join(segment["text"] for segment in found[1])
+
+
+def get_videos_captions(
+    video_ids: List[str],
+    accepted_caption_lang: List[str],
+    workers: int = 1,
+    rate_limit: Optional[float] = None,
+    cache: Optional[TranscriptCache] = None,
+    hook: Optional[RequestHook] = None,
+) -> List[Optional[str]]:
+    """
+    Get captions for several videos, optionally on a thread pool.
+
+    Args:
+        video_ids: List of YouTube video IDs
+        accepted_caption_lang: List of accepted languages for captions
+        workers: Maximum number of transcripts fetched at the same time
+        rate_limit: Maximum number of transcript fetches started per
+            second against the transcript host, or None for no limit
+        cache: Transcript cache shared by the workers
+        hook: Callable receiving a RequestEvent per fetch
+
+    Returns:
+        List[Optional[str]]: Caption text or None for each video, in the
+        same order as video_ids
+    """
+    limiter = RateLimiter(rate_limit)
+
+    def fetch(video_id: str) -> Optional[str]:
+        return get_video_captions(
+            video_id, accepted_caption_lang, cache, limiter, hook
+        )
+
+    return _map_videos(fetch, video_ids, workers)
+
+
+def get_videos_caption_segments(
+    video_ids: List[str],
+    accepted_caption_lang: List[str],
+    workers: int = 1,
+    rate_limit: Optional[float] = None,
+    cache: Optional[TranscriptCache] = None,
+    hook: Optional[RequestHook] = None,
+) -> List[Optional[Tuple[str, List[Dict[str, Any]]]]]:
+    """
+    Get transcript segments for several videos, optionally on a thread pool.
+
+    Args:
+        video_ids: List of YouTube video IDs
+        accepted_caption_lang: List of accepted languages for captions
+        workers: Maximum number of transcripts fetched at the same time
+        rate_limit: Maximum number of transcript fetches started per
+            second against the transcript host, or None for no limit
+        cache: Transcript cache shared by the workers
+        hook: Callable receiving a RequestEvent per fetch
+
+    Returns:
+        List[Optional[Tuple[str, List[Dict[str, Any]]]]]: Language and
+        segments, or None, for each video in the same order as video_ids
+    """
+    limiter = RateLimiter(rate_limit)
+
+    def fetch(video_id: str) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+        return get_video_caption_segments(
+            video_id, accepted_caption_lang, cache, limiter, hook
+        )
 
+    return _map_videos(fetch, video_ids, workers)
 
-def get_video_statistics(video_id: str, dev_key: str) -> Dict:
+
+def _map_videos(fetch, video_ids: List[str], workers: int) -> List[Any]:
+    """Apply fetch to each video ID, on a thread pool if workers > 1."""
+    if workers <= 1 or len(video_ids) <= 1:
+        return [fetch(video_id) for video_id in video_ids]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(fetch, video_ids))
+
+
+def get_video_statistics(
+    video_id: str, dev_key: str, client: Optional[TubeFramesClient] = None
+) -> Dict:
     """
     Get statistics for a video.
 
     Args:
         video_id: YouTube video ID
         dev_key: YouTube API developer key
+        client: Shared API client, the default one if None
 
     Returns:
         Dict: Video statistics
     """
-    ploads = {"part": "statistics", "id": video_id, "key": dev_key}
+    return get_videos_statistics([video_id], dev_key, client)[video_id]
+
+
+def chunk_ids(
+    ids: List[str], size: int = MAX_IDS_PER_REQUEST
+) -> List[List[str]]:
+    """
+    Split a list of IDs into chunks accepted by a single API call.
+
+    Args:
+        ids: List of YouTube IDs
+        size: Maximum number of IDs per chunk
+
+    Returns:
+        List[List[str]]: Chunks of IDs, preserving order
+    """
+    return [ids[i:i + size] for i in range(0, len(ids), size)]
+
+
+def get_videos_statistics(
+    video_ids: List[str],
+    dev_key: str,
+    client: Optional[TubeFramesClient] = None,
+    fields: Optional[str] = None,
+    hook: Optional[RequestHook] = None,
+) -> Dict[str, Dict]:
+    """
+    Get statistics for several videos, batching up to 50 IDs per call.
+
+    Args:
+        video_ids: List of YouTube video IDs
+        dev_key: YouTube API developer key
+        client: Shared API client, the default one if None
+        fields: Partial-response selector limiting the returned counts;
+            video details are requested when it selects contentDetails
+        hook: Callable receiving a RequestEvent per call, besides the
+            hooks of the client
+
+    Returns:
+        Dict[str, Dict]: Video statistics keyed by video ID. Videos not
+        returned by the API (deleted, private) are absent from the mapping,
+        like videos whose call failed: a failing call is split in halves
+        until the failing IDs are isolated, so the other videos of the
+        batch keep their statistics.
+
+    Raises:
+        QuotaExceededError: If the API reports the daily quota exhausted
+        QuotaBudgetExceeded: If the quota scheduler refuses a call
+    """
+    if client is None:
+        client = get_default_client(dev_key)
+
+    unique_ids = list(dict.fromkeys(video_ids))
+    statistics = {}
+    for ids in chunk_ids(unique_ids):
+        statistics.update(_get_chunk_statistics(ids, client, fields, hook))
+    return statistics
+
+
+def _get_chunk_statistics(
+    video_ids: List[str],
+    client: TubeFramesClient,
+    fields: Optional[str],
+    hook: Optional[RequestHook],
+) -> Dict[str, Dict]:
+    """Get the statistics of up to 50 videos, isolating failing IDs."""
+    ploads = {
+        "part": videos_part(fields),
+        "id": ",".join(video_ids),
+        "fields": fields,
+    }
+    try:
+        response = client.get("videos", ploads, hook)
+        return statistics_from_response(response)
+    except (QuotaExceededError, QuotaBudgetExceeded):
+        raise
+    except (KeyError, ValueError, HttpError, requests.RequestException) as e:
+        if len(video_ids) == 1:
+            logger.warning("No statistics for %s: %s", video_ids[0], e)
+            return {}
+    half = len(video_ids) // 2
+    statistics = _get_chunk_statistics(video_ids[:half], client, fields, hook)
+    statistics.update(
+        _get_chunk_statistics(video_ids[half:], client, fields, hook)
+    )
+    return statistics
+
+
+def statistics_from_response(response: Dict[str, Any]) -> Dict[str, Dict]:
+    """
+    Extract video statistics from a videos.list response.
 
-    response = requests.get(YOUTUBE_API_URL, params=ploads, timeout=180)
+    Video details in the contentDetails part are added under their column
+    names, e.g. ``caption`` as ``hasCaption``.
 
-    stats = response.json()
-    return stats["items"][0]["statistics"]
+    Args:
+        response: Decoded videos.list response
+
+    Returns:
+        Dict[str, Dict]: Video statistics keyed by video ID
+    """
+    statistics = {}
+    for item in response.get("items", []):
+        values = item.get("statistics", {})
+        details = item.get("contentDetails")
+        if details:
+            values = dict(values)
+            for name, key in CONTENT_DETAILS_KEYS.items():
+                if key in details:
+                    values[name] = details[key]
+        statistics[item["id"]] = values
+    return statistics
+
+
+def merge_statistics(
+    items_data: List[Dict], statistics: Dict[str, Dict]
+) -> List[Dict]:
+    """
+    Merge video statistics into rows.
+
+    Args:
+        items_data: List of video rows
+        statistics: Video statistics keyed by video ID
+
+    Returns:
+        List[Dict]: Rows that received statistics, in the same order
+    """
+    enriched = []
+    for video_info in items_data:
+        item_id = video_info["videoId"]
+        if item_id not in statistics:
+            continue
+        video_info.update(statistics[item_id])
+        enriched.append(video_info)
+    return enriched
 
 
 def process_thumbnails(
@@ -116,23 +510,358 @@ def process_thumbnails(
     return video_info
 
 
-def create_df_from_items(items_data: List[Dict[str, Any]]) -> pd.DataFrame:
+def _to_int(value: Any) -> Optional[int]:
+    """Convert an API count, sent as a string, to an int."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_datetime(values: List[Any]) -> pd.DatetimeIndex:
+    """Parse ISO 8601 timestamps in one vectorized pass."""
+    try:
+        return pd.to_datetime(values, utc=True, format="ISO8601")
+    except (TypeError, ValueError):
+        # pandas < 2.0 has no ISO8601 format and infers it instead
+        return pd.to_datetime(values, utc=True)
+
+
+def parse_durations(values: List[Any]) -> pd.api.extensions.ExtensionArray:
     """
-    Create a DataFrame from a list of processed video items.
+    Parse ISO 8601 durations such as ``PT1H2M3S`` into seconds.
+
+    The units are extracted with one vectorized regex pass and combined
+    with column arithmetic, like the Arrow kernels of the Parquet sink.
 
     Args:
-        items_data: List of dictionaries with video information
+        values: Duration strings, None where missing
 
     Returns:
-        pd.DataFrame: DataFrame with video information
+        pd.api.extensions.ExtensionArray: Nullable integer seconds, <NA>
+        for missing or malformed durations
+    """
+    parts = pd.Series(values, dtype="string").str.extract(
+        ISO_DURATION_PATTERN
+    )
+    seconds = pd.Series(0, index=parts.index, dtype="Int64")
+    for unit, factor in DURATION_UNITS.items():
+        seconds += parts[unit].fillna("0").astype("Int64") * factor
+    # Like parse_duration, a duration without any unit is malformed
+    seconds[parts.isna().all(axis=1)] = pd.NA
+    return seconds.array
+
+
+def parse_duration(value: Optional[str]) -> Optional[int]:
+    """
+    Parse one ISO 8601 duration into seconds.
+
+    Args:
+        value: Duration string, e.g. "PT3M33S"
+
+    Returns:
+        Optional[int]: Seconds, None for missing or malformed durations
     """
-    if not items_data:
-        return pd.DataFrame()
+    match = re.match(ISO_DURATION_PATTERN, value or "")
+    if match is None or not any(match.groups()):
+        return None
+    return sum(
+        int(match.group(unit) or 0) * factor
+        for unit, factor in DURATION_UNITS.items()
+    )
+
+
+def _to_bool(value: Any) -> Optional[bool]:
+    """Convert an API flag, sent as "true" or "false", to a bool."""
+    if value is None or isinstance(value, bool):
+        return value
+    return str(value).lower() == "true"
 
-    df = pd.DataFrame(items_data)
 
-    # Convert publishedAt column to datetime
-    if "publishedAt" in df.columns:
-        df["publishedAt"] = pd.to_datetime(df["publishedAt"])
+def _string_dtype(dtype_backend: str):
+    """Dtype of text columns for a DataFrame backend."""
+    if dtype_backend == "pyarrow":
+        return pd.ArrowDtype(pa.string())
+    return pd.StringDtype("pyarrow" if pa is not None else "python")
 
-    return df
+
+class FrameBuilder:
+    """
+    Accumulate rows into per-column buffers and build a typed DataFrame.
+
+    Rows are split into columns as they arrive, so the row dictionaries can
+    be released right away. Each column is then converted once, according
+    to its kind: counts become nullable integers, timestamps UTC datetimes,
+    ISO 8601 durations integer seconds, API flags nullable booleans,
+    strings Arrow-backed strings (when pyarrow is installed), and columns
+    with few distinct values such as ``channelId`` become categoricals.
+    Unknown columns keep the types pandas infers for them.
+    """
+
+    DTYPE_BACKENDS = ("numpy_nullable", "pyarrow")
+
+    def __init__(
+        self,
+        columns: Optional[List[Tuple[str, str]]] = None,
+        categorical: Optional[List[str]] = None,
+        dtype_backend: str = "numpy_nullable",
+        select: bool = False,
+    ) -> None:
+        """
+        Initialize the builder.
+
+        Args:
+            columns: Column names and kinds ("string", "int", "timestamp",
+                "duration", "bool" or "list" for lists of strings), merged
+                over the kinds of the known columns
+            categorical: Columns stored as categoricals, channelId and
+                channelTitle if None
+            dtype_backend: "numpy_nullable" for pandas nullable dtypes or
+                "pyarrow" for a frame backed entirely by Arrow arrays
+            select: Whether to keep only ``columns``, in their order, and
+                skip every other row key
+
+        Raises:
+            ValueError: If dtype_backend is not supported
+            ImportError: If the pyarrow backend is requested without pyarrow
+        """
+        if dtype_backend not in self.DTYPE_BACKENDS:
+            raise ValueError(
+                "dtype_backend must be one of {}".format(self.DTYPE_BACKENDS)
+            )
+        if dtype_backend == "pyarrow" and pa is None:
+            raise ImportError(
+                "pyarrow is required for dtype_backend='pyarrow': "
+                "pip install tubeframes[parquet]"
+            )
+        self._kinds = dict(COLUMN_KINDS)
+        if columns is not None:
+            self._kinds.update(columns)
+        if categorical is None:
+            categorical = CATEGORICAL_COLUMNS
+        self._categorical = set(categorical)
+        self._dtype_backend = dtype_backend
+        self._buffers = {}
+        self._select = None
+        if select and columns is not None:
+            self._select = [name for name, _ in columns]
+            self._buffers = {name: [] for name in self._select}
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def add_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Append rows to the column buffers.
+
+        Args:
+            rows: List of row dictionaries
+        """
+        if self._select is not None:
+            for name in self._select:
+                self._buffers[name].extend(row.get(name) for row in rows)
+            self._length += len(rows)
+            return
+
+        for row in rows:
+            for name, value in row.items():
+                buffer = self._buffers.get(name)
+                if buffer is None:
+                    buffer = [None] * self._length
+                    self._buffers[name] = buffer
+                buffer.append(value)
+            self._length += 1
+            if len(row) < len(self._buffers):
+                for buffer in self._buffers.values():
+                    if len(buffer) < self._length:
+                        buffer.append(None)
+
+    def _column(self, name: str, values: List[Any]):
+        """Convert one column buffer to a typed array."""
+        kind = self._kinds.get(name)
+        arrow = self._dtype_backend == "pyarrow"
+        if kind == "int":
+            values = [_to_int(value) for value in values]
+            dtype = pd.ArrowDtype(pa.int64()) if arrow else "Int64"
+            return pd.array(values, dtype=dtype)
+        if kind == "duration":
+            seconds = parse_durations(values)
+            if arrow:
+                return pd.array(seconds, dtype=pd.ArrowDtype(pa.int64()))
+            return seconds
+        if kind == "bool":
+            values = [_to_bool(value) for value in values]
+            dtype = pd.ArrowDtype(pa.bool_()) if arrow else "boolean"
+            return pd.array(values, dtype=dtype)
+        if kind == "timestamp":
+            timestamps = _to_datetime(values)
+            if arrow:
+                dtype = pd.ArrowDtype(pa.timestamp("ns", tz="UTC"))
+                return pd.array(timestamps, dtype=dtype)
+            return timestamps
+        if kind == "string" and name in self._categorical:
+            if arrow:
+                dtype = pd.ArrowDtype(pa.dictionary(pa.int32(), pa.string()))
+                return pd.array(values, dtype=dtype)
+            return pd.Categorical(values)
+        if kind == "string":
+            return pd.array(values, dtype=_string_dtype(self._dtype_backend))
+        if kind == "list" and arrow:
+            return pd.array(values, dtype=pd.ArrowDtype(pa.list_(pa.string())))
+        return values
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Build the DataFrame, converting each column once.
+
+        Returns:
+            pd.DataFrame: Typed DataFrame, empty if no row was added
+        """
+        if not self._length:
+            return pd.DataFrame()
+        return pd.DataFrame(
+            {
+                name: self._column(name, values)
+                for name, values in self._buffers.items()
+            }
+        )
+
+
+class CaptionTable:
+    """
+    Long-format caption table with one row per transcript segment.
+
+    Segments are appended straight into column buffers, without building
+    a DataFrame per video. The resulting frame has the columns videoId,
+    lang, start, duration and text, and joins to the ``videoId`` of the
+    Search and ChannelInfo frames.
+    """
+
+    COLUMNS = ["videoId", "lang", "start", "duration", "text"]
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self._video_ids = []
+        self._langs = []
+        self._starts = []
+        self._durations = []
+        self._texts = []
+        self._seen = set()
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add(
+        self, video_id: str, lang: str, segments: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Append the segments of one video. Videos already added are skipped.
+
+        Args:
+            video_id: YouTube video ID
+            lang: Language of the transcript
+            segments: Segments with text, start and duration
+        """
+        if video_id in self._seen:
+            return
+        self._seen.add(video_id)
+        self._video_ids.extend(repeat(video_id, len(segments)))
+        self._langs.extend(repeat(lang, len(segments)))
+        for segment in segments:
+            self._starts.append(segment.get("start"))
+            self._durations.append(segment.get("duration"))
+            self._texts.append(segment.get("text"))
+
+    def add_found(
+        self,
+        video_ids: List[str],
+        found: List[Optional[Tuple[str, List[Dict[str, Any]]]]],
+    ) -> None:
+        """
+        Append the results of get_videos_caption_segments.
+
+        Args:
+            video_ids: List of YouTube video IDs
+            found: Language and segments, or None, for each video
+        """
+        for video_id, result in zip(video_ids, found):
+            if result is not None:
+                self.add(video_id, *result)
+
+    def to_frame(self, dtype_backend: str = "numpy_nullable") -> pd.DataFrame:
+        """
+        Build the caption DataFrame.
+
+        Args:
+            dtype_backend: "numpy_nullable" or "pyarrow"
+
+        Returns:
+            pd.DataFrame: One row per segment, with categorical videoId and
+            lang columns
+        """
+        if dtype_backend == "pyarrow":
+            category = pd.ArrowDtype(pa.dictionary(pa.int32(), pa.string()))
+            number = pd.ArrowDtype(pa.float64())
+            video_ids = pd.array(self._video_ids, dtype=category)
+            langs = pd.array(self._langs, dtype=category)
+        else:
+            number = "float64"
+            video_ids = pd.Categorical(self._video_ids)
+            langs = pd.Categorical(self._langs)
+        return pd.DataFrame(
+            {
+                "videoId": video_ids,
+                "lang": langs,
+                "start": pd.array(self._starts, dtype=number),
+                "duration": pd.array(self._durations, dtype=number),
+                "text": pd.array(
+                    self._texts, dtype=_string_dtype(dtype_backend)
+                ),
+            },
+            columns=self.COLUMNS,
+        )
+
+
+def join_captions(captions: pd.DataFrame, sep: str = "; ") -> pd.Series:
+    """
+    Join the segments of a caption table into one text per video.
+
+    Args:
+        captions: Caption table built by CaptionTable
+        sep: Separator placed between segments
+
+    Returns:
+        pd.Series: Caption text indexed by videoId
+    """
+    text = captions["text"].astype(object)
+    return text.groupby(
+        captions["videoId"].astype(object), sort=False
+    ).agg(sep.join)
+
+
+def create_df_from_items(
+    items_data: List[Dict[str, Any]],
+    columns: Optional[List[Tuple[str, str]]] = None,
+    categorical: Optional[List[str]] = None,
+    dtype_backend: str = "numpy_nullable",
+    select: bool = False,
+) -> pd.DataFrame:
+    """
+    Create a typed DataFrame from a list of processed video items.
+
+    Args:
+        items_data: List of dictionaries with video information
+        columns: Column names and kinds, see FrameBuilder
+        categorical: Columns stored as categoricals, see FrameBuilder
+        dtype_backend: "numpy_nullable" or "pyarrow"
+        select: Whether to keep only ``columns``, see FrameBuilder
+
+    Returns:
+        pd.DataFrame: DataFrame with video information
+    """
+    builder = FrameBuilder(columns, categorical, dtype_backend, select)
+    builder.add_rows(items_data)
+    return builder.to_frame()
@@ -0,0 +1,258 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import logging
+import operator
+
+import pandas as pd
+
+from tubeframes.config.constants import (
+    COLUMN_KINDS,
+    CONTENT_DETAILS_COLUMN_FIELDS,
+    STATISTICS_COLUMN_FIELDS,
+    WHERE_STAGES,
+)
+from tubeframes.utils import parse_duration
+
+logger = logging.getLogger(__name__)
+
+# Comparison operators accepted in ``where`` conditions
+OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda value, values: value in values,
+    "not in": lambda value, values: value not in values,
+}
+
+# Caption columns of Search and ChannelInfo rows
+CAPTION_COLUMNS = ("video_caption", "caption")
+
+# A condition is (column, operator, value) or (column, callable)
+Condition = Union[Tuple[str, str, Any], Tuple[str, Callable[[Any], bool]]]
+
+# Default of Predicate values, telling a missing value from None
+_MISSING = object()
+
+
+def column_stage(name: str) -> str:
+    """
+    Get the earliest enrichment stage at which a column is known.
+
+    Args:
+        name: Output column name
+
+    Returns:
+        str: "snippet", "statistics" or "captions"
+    """
+    if name in STATISTICS_COLUMN_FIELDS:
+        return "statistics"
+    if name in CONTENT_DETAILS_COLUMN_FIELDS:
+        return "statistics"
+    if name in CAPTION_COLUMNS:
+        return "captions"
+    return "snippet"
+
+
+def _coerce(value: Any, kind: str) -> Any:
+    """
+    Convert a row or condition value to the type compared for its kind.
+
+    Args:
+        value: API string, or a number or date given in a condition
+        kind: Column kind ("string", "int", "timestamp", "duration",
+            "bool" or "list")
+
+    Returns:
+        Any: Integer for counts, seconds for durations, bool for flags,
+        UTC Timestamp for dates, else the value
+
+    Raises:
+        ValueError: If the value cannot be converted
+        TypeError: If the value has an unsupported type
+    """
+    if kind == "int":
+        return int(value)
+    if kind == "duration":
+        if not isinstance(value, str):
+            return int(value)
+        seconds = parse_duration(value)
+        if seconds is None:
+            raise ValueError("Invalid ISO 8601 duration {!r}".format(value))
+        return seconds
+    if kind == "bool":
+        if isinstance(value, bool):
+            return value
+        return str(value).lower() == "true"
+    if kind == "timestamp":
+        timestamp = pd.Timestamp(value)
+        if timestamp.tzinfo is None:
+            return timestamp.tz_localize("UTC")
+        return timestamp.tz_convert("UTC")
+    return value
+
+
+class Predicate:
+    """Condition on one column of a result row."""
+
+    def __init__(
+        self,
+        column: str,
+        op: Union[str, Callable[[Any], bool]],
+        value: Any = _MISSING,
+    ) -> None:
+        """
+        Initialize a predicate.
+
+        Counts are compared as integers, durations as seconds and dates as
+        UTC timestamps, so ``("viewCount", ">=", 1000)``, ``("duration",
+        ">", 60)`` and ``("publishedAt", ">=", "2024-01-01")`` work on the
+        raw API strings.
+
+        Args:
+            column: Output column name
+            op: Operator from OPERATORS, or a callable receiving the
+                converted value and returning whether to keep the row
+            value: Value compared with, a collection for "in" and "not in".
+                Required with an operator, not allowed with a callable.
+
+        Raises:
+            ValueError: If the operator is not supported, the value is
+                missing or not allowed, or it cannot be converted to the
+                column kind
+        """
+        self.column = column
+        self.stage = column_stage(column)
+        self._kind = COLUMN_KINDS.get(column, "string")
+        if callable(op):
+            if value is not _MISSING:
+                raise ValueError(
+                    "where condition on {!r} has both a callable and a "
+                    "value".format(column)
+                )
+            self._test = op
+            return
+        if not isinstance(op, str) or op not in OPERATORS:
+            raise ValueError(
+                "Unsupported where operator {!r}, use one of {}".format(
+                    op, list(OPERATORS)
+                )
+            )
+        if value is _MISSING:
+            raise ValueError(
+                "where condition ({!r}, {!r}) needs a value".format(column, op)
+            )
+        compare = OPERATORS[op]
+        try:
+            if op in ("in", "not in"):
+                value = {_coerce(v, self._kind) for v in value}
+            else:
+                value = _coerce(value, self._kind)
+        except (TypeError, ValueError) as e:
+            raise ValueError(
+                "Invalid value {!r} in where condition on {!r}: {}".format(
+                    value, column, e
+                )
+            ) from e
+        self._test = lambda row_value: compare(row_value, value)
+
+    def __call__(self, row: Dict) -> bool:
+        """
+        Check a row. Rows missing the column never match.
+
+        Args:
+            row: Result row
+
+        Returns:
+            bool: Whether the row is kept
+        """
+        value = row.get(self.column)
+        if value is None:
+            return False
+        try:
+            value = _coerce(value, self._kind)
+        except (TypeError, ValueError):
+            return False
+        return bool(self._test(value))
+
+
+class Where:
+    """Predicates of a ``where`` filter, grouped by enrichment stage."""
+
+    def __init__(
+        self,
+        conditions: Optional[List[Condition]],
+        available: List[Tuple[str, str]],
+    ) -> None:
+        """
+        Parse the conditions of a ``where`` filter.
+
+        Args:
+            conditions: Conditions that every kept row meets, or None
+            available: Column names and kinds of the result type
+
+        Raises:
+            ValueError: If a condition is malformed or names an unknown
+                column
+        """
+        names = [name for name, _ in available]
+        self._stages = {stage: [] for stage in WHERE_STAGES}
+        for condition in conditions or []:
+            if not isinstance(condition, (tuple, list)) or len(
+                condition
+            ) not in (2, 3):
+                raise ValueError(
+                    "where conditions are (column, operator, value) or "
+                    "(column, callable), got {!r}".format(condition)
+                )
+            predicate = Predicate(*condition)
+            if predicate.column not in names:
+                raise ValueError(
+                    "Unknown where column {!r}, available columns are "
+                    "{}".format(predicate.column, names)
+                )
+            self._stages[predicate.stage].append(predicate)
+
+    def __bool__(self) -> bool:
+        """Whether any condition is set."""
+        return any(self._stages.values())
+
+    @property
+    def columns(self) -> List[str]:
+        """Columns read by the predicates, which must be fetched."""
+        return list(
+            dict.fromkeys(
+                predicate.column
+                for predicates in self._stages.values()
+                for predicate in predicates
+            )
+        )
+
+    def needs(self, stage: str) -> bool:
+        """Whether any predicate runs at a stage."""
+        return bool(self._stages[stage])
+
+    def apply(self, rows: List[Dict], stage: str) -> List[Dict]:
+        """
+        Keep the rows meeting every predicate of a stage.
+
+        Args:
+            rows: Rows enriched up to the stage
+            stage: One of WHERE_STAGES
+
+        Returns:
+            List[Dict]: Kept rows, in order
+        """
+        predicates = self._stages[stage]
+        if not predicates or not rows:
+            return rows
+        kept = [row for row in rows if all(p(row) for p in predicates)]
+        if len(kept) < len(rows):
+            logger.debug(
+                "Dropped %d of %d rows at the %s stage",
+                len(rows) - len(kept),
+                len(rows),
+                stage,
+            )
+        return kept
@@ -0,0 +1,419 @@
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Any,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+from contextlib import contextmanager
+import json
+import sqlite3
+import threading
+import time
+
+from tubeframes.config.constants import (
+    DEFAULT_LEASE,
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_SHARD_SIZES,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - pandas is imported on use
+    import pandas as pd
+
+JOB_KINDS = ("search", "channels")
+UNIT_STATUSES = ("pending", "running", "done", "failed")
+
+# Arguments set by the runner itself, not accepted in job options
+_RESERVED_OPTIONS = {
+    "term",
+    "channel_ids",
+    "client",
+    "developer_key",
+    "lazy",
+    "sync_state",
+    "transcript_cache",
+}
+
+
+class Job(NamedTuple):
+    """A crawl job: search terms or channel IDs and their options."""
+
+    name: str
+    kind: str
+    options: Dict[str, Any]
+
+
+class Shard(NamedTuple):
+    """Units of a job claimed together by one worker."""
+
+    job: Job
+    shard: int
+    units: List[str]
+    worker: str
+
+
+class WorkQueue:
+    """
+    SQLite-backed queue of crawl units, split into shards.
+
+    A job lists search terms or channel IDs, the units. Units are grouped
+    into shards that workers claim as a whole: a claimed shard is leased to
+    its worker for ``lease`` seconds, extended on every completed unit, so
+    the shards of a crashed worker are claimed again once the lease runs
+    out. Each unit is checkpointed when done, and a failed unit is retried
+    up to ``max_attempts`` times.
+
+    Claims use SQLite locking, so several processes, and several machines
+    sharing the file on a file system with working locks, can drain the
+    same queue.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        lease: float = DEFAULT_LEASE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        timeout: float = 60.0,
+    ) -> None:
+        """
+        Open or create a work queue.
+
+        Args:
+            path: SQLite file of the queue
+            lease: Seconds a claimed shard stays with its worker without
+                progress
+            max_attempts: Attempts before a unit is marked failed
+            timeout: Seconds to wait for a lock held by another worker
+        """
+        self.path = path
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path,
+            timeout=timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        with self._transaction():
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "job TEXT PRIMARY KEY, kind TEXT NOT NULL, "
+                "options TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS units ("
+                "job TEXT NOT NULL, unit TEXT NOT NULL, "
+                "shard INTEGER NOT NULL, status TEXT NOT NULL, "
+                "attempts INTEGER NOT NULL DEFAULT 0, worker TEXT, "
+                "lease_until REAL, rows INTEGER, error TEXT, "
+                "PRIMARY KEY (job, unit))"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS units_shard "
+                "ON units (job, shard, status)"
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run a block in one write transaction."""
+        with self._lock:
+            # Take the write lock at once, so two workers never read the
+            # same free shard before either marks it
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def submit(
+        self,
+        job: str,
+        kind: str,
+        units: List[str],
+        options: Optional[Dict[str, Any]] = None,
+        shard_size: Optional[int] = None,
+    ) -> int:
+        """
+        Add a job, or new units to an existing job.
+
+        Units already in the job are ignored, so submitting the same spec
+        again resumes the job instead of starting over.
+
+        Args:
+            job: Job name
+            kind: "search" for search terms or "channels" for channel IDs
+            units: Search terms or channel IDs
+            options: Extra arguments of Search or ChannelInfo, stored as
+                JSON
+            shard_size: Units per shard, 10 terms or 50 channels if None
+
+        Returns:
+            int: Number of new units
+
+        Raises:
+            ValueError: If the kind or an option is not supported, or the
+                job exists with another kind or other options
+        """
+        if kind not in JOB_KINDS:
+            raise ValueError("kind must be one of {}".format(JOB_KINDS))
+        options = options or {}
+        reserved = sorted(_RESERVED_OPTIONS.intersection(options))
+        if reserved:
+            raise ValueError("Options set by the runner: {}".format(reserved))
+        encoded = json.dumps(options, sort_keys=True)
+        if shard_size is None:
+            shard_size = DEFAULT_SHARD_SIZES[kind]
+
+        with self._transaction():
+            row = self._conn.execute(
+                "SELECT kind, options FROM jobs WHERE job = ?", (job,)
+            ).fetchone()
+            if row is None:
+                self._conn.execute(
+                    "INSERT INTO jobs (job, kind, options, created) "
+                    "VALUES (?, ?, ?, ?)",
+                    (job, kind, encoded, time.time()),
+                )
+            elif row != (kind, encoded):
+                raise ValueError(
+                    "Job {!r} exists with other settings".format(job)
+                )
+
+            known = {
+                unit
+                for (unit,) in self._conn.execute(
+                    "SELECT unit FROM units WHERE job = ?", (job,)
+                )
+            }
+            new_units = [
+                unit for unit in dict.fromkeys(units) if unit not in known
+            ]
+            (last,) = self._conn.execute(
+                "SELECT MAX(shard) FROM units WHERE job = ?", (job,)
+            ).fetchone()
+            first = 0 if last is None else last + 1
+            self._conn.executemany(
+                "INSERT INTO units (job, unit, shard, status) "
+                "VALUES (?, ?, ?, 'pending')",
+                [
+                    (job, unit, first + n // shard_size)
+                    for n, unit in enumerate(new_units)
+                ],
+            )
+        return len(new_units)
+
+    def job(self, name: str) -> Optional[Job]:
+        """
+        Read a job.
+
+        Args:
+            name: Job name
+
+        Returns:
+            Optional[Job]: The job, None if unknown
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT kind, options FROM jobs WHERE job = ?", (name,)
+            ).fetchone()
+        if row is None:
+            return None
+        return Job(name, row[0], json.loads(row[1]))
+
+    def claim(self, worker: str, job: Optional[str] = None) -> Optional[Shard]:
+        """
+        Claim the next shard with pending units or an expired lease.
+
+        Args:
+            worker: Unique name of the claiming worker
+            job: Only claim shards of this job, any job if None
+
+        Returns:
+            Optional[Shard]: Claimed shard with its unfinished units, None
+            if no work is left
+        """
+        now = time.time()
+        available = (
+            "(status = 'pending' OR (status = 'running' AND lease_until < ?))"
+        )
+        with self._transaction():
+            query = "SELECT job, shard FROM units WHERE " + available
+            args = [now]
+            if job is not None:
+                query += " AND job = ?"
+                args.append(job)
+            row = self._conn.execute(
+                query + " ORDER BY job, shard LIMIT 1", args
+            ).fetchone()
+            if row is None:
+                return None
+            name, shard = row
+            self._conn.execute(
+                "UPDATE units SET status = 'running', worker = ?, "
+                "lease_until = ? WHERE job = ? AND shard = ? AND " + available,
+                (worker, now + self.lease, name, shard, now),
+            )
+            units = [
+                unit
+                for (unit,) in self._conn.execute(
+                    "SELECT unit FROM units WHERE job = ? AND shard = ? "
+                    "AND worker = ? AND status = 'running' ORDER BY rowid",
+                    (name, shard, worker),
+                )
+            ]
+            kind, options = self._conn.execute(
+                "SELECT kind, options FROM jobs WHERE job = ?", (name,)
+            ).fetchone()
+        return Shard(
+            Job(name, kind, json.loads(options)), shard, units, worker
+        )
+
+    def complete(self, shard: Shard, unit: str, rows: int) -> bool:
+        """
+        Checkpoint a finished unit and extend the lease of its shard.
+
+        Args:
+            shard: Claimed shard
+            unit: Finished unit
+            rows: Number of rows written for the unit
+
+        Returns:
+            bool: False if the lease ran out and another worker claimed
+            the unit, which is then left to that worker
+        """
+        with self._transaction():
+            updated = self._conn.execute(
+                "UPDATE units SET status = 'done', rows = ?, error = NULL, "
+                "lease_until = NULL WHERE job = ? AND unit = ? "
+                "AND worker = ? AND status = 'running'",
+                (rows, shard.job.name, unit, shard.worker),
+            ).rowcount
+            self._conn.execute(
+                "UPDATE units SET lease_until = ? WHERE job = ? AND "
+                "shard = ? AND worker = ? AND status = 'running'",
+                (
+                    time.time() + self.lease,
+                    shard.job.name,
+                    shard.shard,
+                    shard.worker,
+                ),
+            )
+        return updated > 0
+
+    def fail(self, shard: Shard, unit: str, error: str) -> str:
+        """
+        Record a failed attempt of a unit.
+
+        Args:
+            shard: Claimed shard
+            unit: Failed unit
+            error: Error message
+
+        Returns:
+            str: "pending" if the unit will be retried, "failed" if not,
+            or the unit status left untouched if the lease ran out and
+            another worker claimed the unit
+        """
+        with self._transaction():
+            current, attempts = self._conn.execute(
+                "SELECT status, attempts FROM units WHERE job = ? "
+                "AND unit = ?",
+                (shard.job.name, unit),
+            ).fetchone()
+            attempts += 1
+            status = "failed" if attempts >= self.max_attempts else "pending"
+            updated = self._conn.execute(
+                "UPDATE units SET status = ?, attempts = ?, error = ?, "
+                "worker = NULL, lease_until = NULL "
+                "WHERE job = ? AND unit = ? AND worker = ? "
+                "AND status = 'running'",
+                (status, attempts, error, shard.job.name, unit, shard.worker),
+            ).rowcount
+        return status if updated else current
+
+    def release(self, shard: Shard, units: List[str]) -> None:
+        """
+        Give unfinished units back without counting an attempt.
+
+        Units claimed by another worker since the lease ran out are left
+        to it.
+
+        Args:
+            shard: Claimed shard
+            units: Units to release
+        """
+        with self._transaction():
+            self._conn.executemany(
+                "UPDATE units SET status = 'pending', worker = NULL, "
+                "lease_until = NULL WHERE job = ? AND unit = ? "
+                "AND worker = ? AND status = 'running'",
+                [(shard.job.name, unit, shard.worker) for unit in units],
+            )
+
+    def retry_failed(self, job: Optional[str] = None) -> int:
+        """
+        Make failed units pending again, with fresh attempts.
+
+        Args:
+            job: Job name, every job if None
+
+        Returns:
+            int: Number of units reset
+        """
+        where, args = "", ()
+        if job is not None:
+            where, args = " AND job = ?", (job,)
+        with self._transaction():
+            cursor = self._conn.execute(
+                "UPDATE units SET status = 'pending', attempts = 0, "
+                "worker = NULL WHERE status = 'failed'" + where,
+                args,
+            )
+        return cursor.rowcount
+
+    def status(self, job: Optional[str] = None) -> "pd.DataFrame":
+        """
+        Count the units of each job by status.
+
+        Args:
+            job: Job name, every job if None
+
+        Returns:
+            pd.DataFrame: One row per job with the number of pending,
+            running, done and failed units and the rows written
+        """
+        import pandas as pd
+
+        where, args = "", ()
+        if job is not None:
+            where, args = " WHERE job = ?", (job,)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job, status, COUNT(*), SUM(rows) FROM units"
+                + where
+                + " GROUP BY job, status",
+                args,
+            ).fetchall()
+        data = {}
+        for name, status, count, written in rows:
+            counts = data.setdefault(
+                name, dict.fromkeys(UNIT_STATUSES + ("rows",), 0)
+            )
+            counts[status] = count
+            counts["rows"] += written or 0
+        df = pd.DataFrame.from_dict(
+            data, orient="index", columns=list(UNIT_STATUSES) + ["rows"]
+        )
+        df.index.name = "job"
+        return df
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
+